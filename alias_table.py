@@ -0,0 +1,55 @@
+# alias_table.py
+"""Walker alias tables for drawing from fixed weighted distributions.
+
+Building a table is O(n) once, after that every draw costs a single
+random.random() call and two list lookups no matter how many outcomes there are.
+"""
+import random
+
+class AliasTable:
+    """Weighted choice between a fixed set of outcomes"""
+    def __init__(self, weights):
+        """
+        Args:
+            weights: Dict of outcome to relative weight, weights don't need to sum to 1
+        """
+        self.outcomes = [outcome for outcome, weight in weights.items() if weight > 0]
+        if not self.outcomes:
+            raise ValueError("AliasTable needs at least one outcome with a positive weight")
+        count = len(self.outcomes)
+        total = sum(weights[outcome] for outcome in self.outcomes)
+        scaled = [weights[outcome] * count / total for outcome in self.outcomes]
+
+        # Vose's method, pair each under-full column with an over-full one
+        self.chance = [1.0] * count
+        self.alias = list(range(count))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self.chance[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Anything left over is only short of 1.0 by float error
+        for i in small + large:
+            self.chance[i] = 1.0
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def draw(self):
+        roll = random.random() * len(self.outcomes)
+        column = int(roll)
+        if roll - column < self.chance[column]:
+            return self.outcomes[column]
+        return self.outcomes[self.alias[column]]
+
+    def probabilities(self):
+        """Exact chance of each outcome as the table will draw it"""
+        count = len(self.outcomes)
+        result = dict.fromkeys(self.outcomes, 0.0)
+        for column, outcome in enumerate(self.outcomes):
+            result[outcome] += self.chance[column] / count
+            result[self.outcomes[self.alias[column]]] += (1.0 - self.chance[column]) / count
+        return result
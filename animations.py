@@ -0,0 +1,136 @@
+import pygame
+
+class Tween:
+    """Base timed animation, progress runs from 0 to 1 over its duration (ms)"""
+    def __init__(self, duration):
+        self.duration = max(1, duration)
+        self.start = 0
+        self.elapsed = 0
+
+    @property
+    def progress(self):
+        return max(0.0, min(1.0, self.elapsed / self.duration))
+
+    @property
+    def finished(self):
+        return self.elapsed >= self.duration
+
+    def draw(self, display):
+        """Override this method to draw the current frame of the animation"""
+        pass
+
+    def on_finish(self):
+        """Override this method to run logic once the animation has completed"""
+        pass
+
+class BannerAnimation(Tween):
+    """Attack announcement box shown over a panel"""
+    def __init__(self, rect, text, colour, duration=2000):
+        super().__init__(duration)
+        self.rect = rect
+        self.text = text
+        self.colour = colour
+        width, height = int(rect[0]), int(rect[1])
+        self.overlay = pygame.Surface((width, height))
+        self.overlay.fill((0, 0, 0))
+        self.overlay.set_alpha(180)  # Partial transparency
+
+    def draw(self, display):
+        width, height, x, y = self.rect
+        display.screen.blit(self.overlay, (x, y))
+        pygame.draw.rect(display.screen, 'blue', (x, y, width, height))
+        pygame.draw.rect(display.screen, 'white', (x, y, width, height), 2)
+        display.draw_text(self.text, (x + width // 2, y + height // 2), 'large', self.colour, center=True)
+
+class FloatingText(Tween):
+    """Text that drifts upwards, used for damage numbers"""
+    def __init__(self, text, pos, colour, rise=100, size='title', duration=500):
+        super().__init__(duration)
+        self.text = text
+        self.pos = pos
+        self.colour = colour
+        self.rise = rise
+        self.size = size
+
+    def draw(self, display):
+        x, y = self.pos
+        display.draw_text(self.text, (x, y - self.rise * self.progress), self.size, self.colour, center=True)
+
+class FlashAnimation(Tween):
+    """Coloured overlay that pulses in and out over a panel with a message on top"""
+    def __init__(self, rect, colour, text, text_pos, text_colour='white', flashes=3, max_alpha=128, duration=2400):
+        super().__init__(duration)
+        self.rect = rect
+        self.text = text
+        self.text_pos = text_pos
+        self.text_colour = text_colour
+        self.flashes = flashes
+        self.max_alpha = max_alpha
+        width, height = int(rect[0]), int(rect[1])
+        self.flash_surface = pygame.Surface((width, height))
+        self.flash_surface.fill(colour)
+
+    def draw(self, display):
+        # Triangle wave, each flash fades in then out again
+        phase = (self.progress * self.flashes) % 1.0
+        alpha = self.max_alpha * (1 - abs(phase * 2 - 1))
+        self.flash_surface.set_alpha(int(alpha))
+        display.screen.blit(self.flash_surface, (self.rect[2], self.rect[3]))
+        display.draw_text(self.text, self.text_pos, 'large', self.text_colour, center=True)
+
+class AnimationScheduler:
+    """Timeline of tweens advanced by frame delta time instead of blocking waits"""
+    FAST_SPEED = 3.0
+
+    def __init__(self):
+        self.time = 0
+        self.cursor = 0
+        self.speed = 1.0
+        self.animations = []
+
+    @property
+    def active(self):
+        return bool(self.animations)
+
+    def add(self, animation, delay=0, blocking=True):
+        """Queue an animation on the timeline.
+
+        Args:
+            animation: Tween to play
+            delay: Milliseconds after the timeline cursor to start
+            blocking: If True later animations wait for this one to finish
+        """
+        self.cursor = max(self.cursor, self.time)
+        animation.start = self.cursor + delay
+        if blocking:
+            self.cursor = animation.start + animation.duration
+        self.animations.append(animation)
+        return animation
+
+    def wait(self, duration):
+        """Leave a gap on the timeline before the next queued animation"""
+        self.cursor = max(self.cursor, self.time) + duration
+
+    def update(self, dt):
+        """Advance the timeline by dt milliseconds, scaled by the current speed"""
+        self.time += dt * self.speed
+        for animation in self.animations[:]:
+            animation.elapsed = self.time - animation.start
+            if animation.finished:
+                self.animations.remove(animation)
+                animation.on_finish()
+
+    def draw(self, display):
+        for animation in self.animations:
+            if animation.elapsed >= 0:
+                animation.draw(display)
+
+    def skip(self):
+        """Finish everything that is queued straight away"""
+        for animation in self.animations:
+            animation.on_finish()
+        self.animations.clear()
+        self.cursor = self.time
+
+    def toggle_fast(self):
+        self.speed = 1.0 if self.speed > 1.0 else self.FAST_SPEED
@@ -1,9 +1,85 @@
 import os
+import copy
 import json
+import threading
 import pygame
 from datetime import datetime
-from save_system import save_game, SAVE_DIRECTORY
-from display import Display
+import save_system
+from save_system import build_save_data, write_save_data
+from save_journal import diff, new_snapshot_id
+from display import get_display
+
+class AutosaveWriter:
+    """Writes autosaves on a background thread so the game never waits on the disk.
+
+    Snapshots are queued by filename and a newer snapshot replaces one that
+    hasn't been written yet, so only the latest state of each save hits disk.
+    The first autosave of a session writes the whole save, after that only the
+    changes are appended to its journal until compact_every of them have built
+    up and the whole save is written again.
+    """
+    def __init__(self, before_write=None, compact_every=20):
+        """
+        Args:
+            before_write: Called with the filename on the writer thread before each full write, e.g. to rotate old saves
+            compact_every: Journal entries written before the next full write
+        """
+        self.before_write = before_write
+        self.compact_every = compact_every
+        self._written = {}  # filename -> (snapshot id, last data written, journal entries since the snapshot)
+        self._pending = {}
+        self._writing = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, filename, save_data):
+        """Queue a snapshot to be written, save_data must not be changed afterwards"""
+        with self._condition:
+            self._pending[filename] = save_data
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="AutosaveWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self, timeout=None):
+        """Wait until every queued snapshot is on disk, returns False if the timeout ran out first"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                filename, save_data = next(iter(self._pending.items()))
+                del self._pending[filename]
+                self._writing = True
+            try:
+                self._write(filename, save_data)
+            except Exception as e:
+                # Start again from a full write, the journal may be missing this change
+                self._written.pop(filename, None)
+                print(f"\nAutosave failed: {str(e)}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, filename, save_data):
+        written = self._written.get(filename)
+        if written is None or written[2] >= self.compact_every:
+            if self.before_write:
+                self.before_write(filename)
+            snapshot_id = new_snapshot_id()
+            write_save_data(dict(save_data, snapshot_id=snapshot_id), filename)
+            self._written[filename] = (snapshot_id, save_data, 0)
+            return
+
+        snapshot_id, last_data, entries = written
+        delta = diff(last_data, save_data)
+        if delta is not None:
+            save_system.SAVE_STORE.append_delta(filename, snapshot_id, delta, save_data)
+            entries += 1
+        self._written[filename] = (snapshot_id, save_data, entries)
 
 class AutosaveManager:
     def __init__(self, game, autosave_frequency = 10):
@@ -13,12 +89,13 @@ class AutosaveManager:
             game: Reference to the main game instance
             auto_save frequency: Number of turns between autosaves
         """
-        self.display = Display()
+        self.display = get_display()
         self.game = game
         self.autosave_frequency = autosave_frequency
         self.turns_since_autosave = 0
         self.autosave_enabled = True
         self.autosaves_to_keep = 3
+        self.writer = AutosaveWriter(before_write=self._rotate_autosaves)
         
     def toggle_autosave(self):
         """Toggles autosave on/off."""
@@ -38,56 +115,50 @@ class AutosaveManager:
             self.perform_autosave()
             
     def perform_autosave(self):
-        """Perform the autosave operation."""
+        """Snapshot the game and hand it to the writer thread, rotation and writing happen there."""
         try:
             # Create autosave filename with player name
             autosave_name = f"autosave_{self.game.player.name}.json"
             
-            # Create rotating backup of previous autosave
-            self._rotate_autosaves(autosave_name)
-            
-            # Perform the save
-            save_game(self.game.player, self.game.current_location, autosave_name)
+            # Copy so the game can carry on changing the player while the snapshot is written
+            save_data = copy.deepcopy(build_save_data(self.game.player, self.game.current_location))
+            self.writer.submit(autosave_name, save_data)
             self.turns_since_autosave = 0
             print("\nGame autosaved.")
             
         except Exception as e:
             print(f"\nAutosave failed: {str(e)}")
+
+    def flush(self):
+        """Wait for any autosave still being written, call before the game exits."""
+        self.writer.flush()
+        # Journalled autosaves only updated the save index in memory
+        save_system.SAVE_STORE.flush()
             
     def _rotate_autosaves(self, current_save):
         """Maintain a rotating list of autosaves."""
         try:
+            store = save_system.SAVE_STORE
             base_name = os.path.splitext(current_save)[0]
             
-            # Get list of existing autosaves for this player
-            existing_saves = [
-                f for f in os.listdir(SAVE_DIRECTORY)
-                if f.startswith(base_name) and f.endswith('.json')
-            ]
-            
-            # Sort by creation time
-            existing_saves.sort(
-                key=lambda x: os.path.getctime(os.path.join(SAVE_DIRECTORY, x)),
-                reverse=True
-            )
+            # Existing autosaves for this player, newest first
+            existing_saves = store.autosaves(base_name)
             
             # Remove oldest saves if we have too many
             for old_save in existing_saves[self.autosaves_to_keep - 1:]:
                 try:
-                    os.remove(os.path.join(SAVE_DIRECTORY, old_save))
+                    store.delete(old_save)
                 except OSError:
                     continue
                     
             # Rename existing autosaves to make room for new one
             for i in range(min(len(existing_saves), self.autosaves_to_keep - 1)):
-                old_path = os.path.join(SAVE_DIRECTORY, existing_saves[i])
                 new_name = f"{base_name}_{i+1}.json"
-                new_path = os.path.join(SAVE_DIRECTORY, new_name)
                 try:
-                    if os.path.exists(old_path):
-                        os.rename(old_path, new_path)
+                    if store.exists(existing_saves[i]):
+                        store.rename(existing_saves[i], new_name)
                 except OSError:
                     continue
                     
         except Exception as e:
-            print(f"\nError rotating autosaves: {str(e)}")
\ No newline at end of file
+            print(f"\nError rotating autosaves: {str(e)}")
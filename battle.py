@@ -1,21 +1,31 @@
 import random
 import pygame
-from display import Display, BattleDisplay
+from display import BattleDisplay, get_display
 from player import Player
-from enemies import Enemy, ENEMY_ATTACK_TYPES, MONSTER_VARIANTS
+from enemies import Enemy, ENEMY_ATTACK_TYPES
+from combat import CombatEngine
+from item_catalog import ItemCatalog, TIER_LEVELS, ITEM_TIERS
+from loot_tables import get_loot_table, stack_size
 from status_effects import *
 
 
 class Battle:
+    # How long to hold certain engine messages on screen (ms)
+    MESSAGE_PAUSES = {
+        "confusion_hit": 1500,
+        "confusion_cleared": 1500,
+        "thawed": 1000
+    }
+    
     def __init__(self, player, items, game):
         self.player = player
-        self.items = items
+        self.items = items if isinstance(items, ItemCatalog) else ItemCatalog(items)
         self.game = game
         self.current_location = game.current_location
         self.turn_counter = 0
         self.battle_ended = False
         self.enemy = None
-        self.display = Display()
+        self.display = get_display()
         self.battle_display = BattleDisplay(game.display)
         self.player.battle_display = self.battle_display
         self._battle_display = self.battle_display
@@ -37,20 +47,12 @@ class Battle:
         # Apply any pre-attack buffs
         self.apply_attack_buffs(attack_info)
 
-        # Perform the attack and get results
-        message, total_damage, self_damage_info, attack_hit = self.player.perform_attack(enemy, attack_type)
-        self.battle_display.draw_battle_message(message)
-        
-        if attack_hit:
-            reflected_damage = self.handle_damage_reflection(self.player, enemy, total_damage)
-            if reflected_damage > 0:
-                self.battle_display.draw_battle_message(f"\n{self.player.name} takes {reflected_damage} reflected damage!")
+        # Resolve the attack, reflection and post-attack effects, then draw what happened
+        events = self.engine.player_attack(attack_type)
+        self.present_pending()
+        if any(event.kind == "attack_result" and event.hit_type == "hit" for event in events):
             # Provide visual feedback for hit
             self.battle_display.draw_battle_screen(self.player, self.current_location, enemy)
-            pygame.display.flip()
-        
-        # Handle post-attack effects and cleanup
-        self.handle_post_attack_effects(enemy, attack_hit, total_damage, attack_type, attack_info)
 
         # Remove temporary attack buffs
         self.remove_attack_buffs(attack_info)
@@ -59,52 +61,43 @@ class Battle:
         if self.check_battle_end(enemy):
             return True, None
 
-        return False, self_damage_info
-
-    def handle_pre_attack_effects(self, enemy):
-        # Handle stun
-        if self.player.stunned:
-            self.battle_display.draw_battle_message("\nYou're stunned and lose your turn.")
-            self.player.stunned = False
-            self.player.remove_status_effect("Stun")
-            if self.player.status_effects:
-                self.player.update_status_effects(self.player)
-            return True
+        return False, None
 
-        # Handle confusion
-        confusion_effect = next((effect for effect in self.player.status_effects if effect.name == "Confusion"), None)
-        if confusion_effect:
-            if random.random() < 0.5:
-                self.battle_display.draw_battle_message("\nYou're confused and attack yourself!")
-                damage, hit_type, _, _ = self.player.calculate_damage(self.player, self.player, "normal")
-                self.player.take_damage(damage)
-                self.battle_display.draw_battle_message(f"\nYou dealt {damage} damage to yourself!")
-                self.battle_display.draw_battle_message("\nYour attack on yourself snaps you out of your confusion!")
-                pygame.time.wait(1500)
-                #self.display.pause()
-                self.player.remove_status_effect("Confusion")
-                return True
-            else:
-                self.battle_display.draw_battle_message(f"\n{self.player.name} snaps out of their confusion!")
-                pygame.time.wait(1500)
-                self.player.remove_status_effect("Confusion")
+    def present(self, events):
+        """Draw the outcome events produced by the combat engine"""
+        for event in events:
+            if event.kind == "attack":
+                self.battle_display.display_attack_animation(event.source.name, event.name, isinstance(event.source, Player))
+            elif event.kind == "hit":
+                self.battle_display.display_damage_numbers(event.target, event.amount, event.hit_type, isinstance(event.source, Player))
+            elif event.kind == "self_damage":
+                self.battle_display.display_damage_numbers(event.source, event.amount, "self_damage", isinstance(event.source, Player), True)
+            elif event.kind == "recoil":
+                self.battle_display.display_self_damage_flash(event.source.name, event.amount, event.name)
+            elif event.kind == "status_applied":
+                self.battle_display.display_status_effects(event.target, event.name)
+            elif event.message:
+                # Let queued animations finish before the log moves on
+                self.battle_display.play_animations()
+                if event.kind == "no_stamina":
+                    print(event.message)
+                else:
+                    self.battle_display.draw_battle_message(event.message)
+                if event.kind in self.MESSAGE_PAUSES:
+                    pygame.display.flip()
+                    pygame.time.wait(self.MESSAGE_PAUSES[event.kind])
+        self.battle_display.play_animations()
 
-        # Handle freeze
-        frozen_effect = next((effect for effect in self.player.status_effects if effect.name == "Freeze"), None)
-        if frozen_effect:
-            if random.random() < 0.5:
-                self.battle_display.draw_battle_message("\nYou're frozen and cannot attack!")
-                self.enemy_attack(enemy)
-                self.player.update_status_effects(self.player)
-                #self.display.pause()
-                return True
-            else:
-                self.battle_display.draw_battle_message(f"\n{self.player.name} thaws out from the ice and attacks!")
-                pygame.display.flip()
-                pygame.time.wait(1000)
-                self.player.remove_status_effect("Freeze")
+    def present_pending(self):
+        """Draw every engine event not shown yet, including status effect ticks between engine calls"""
+        events = self.engine.log.since(self._presented)
+        self._presented = len(self.engine.log.events)
+        self.present(events)
 
-        return False
+    def handle_pre_attack_effects(self, enemy):
+        turn_lost, _ = self.engine.pre_attack_effects()
+        self.present_pending()
+        return turn_lost
 
     def get_player_attack_choice(self):
         """Visual attack selection menu"""
@@ -129,16 +122,9 @@ class Battle:
 
     def handle_stamina_cost(self, attack_type, attack_info):
         """Calculate and apply stamina cost for attack"""
-        weapon_type = self.player.equipped.get("weapon", {"weapon_type": "light"}).weapon_type
-        base_stamina_cost = self.player.get_weapon_stamina_cost(weapon_type)
-        total_stamina_cost = base_stamina_cost + attack_info['stamina_modifier']
-
-        if self.player.stamina < total_stamina_cost:
-            print(f"Not enough stamina for {attack_info['name']}!")
-            return False
-
-        self.player.use_stamina(total_stamina_cost)
-        return True
+        paid = self.engine.pay_stamina(attack_info)
+        self.present_pending()
+        return paid
 
     def apply_attack_buffs(self, stat_buffs):
         """Apply temporary stat buffs for attack duration"""
@@ -152,33 +138,6 @@ class Battle:
             if hasattr(self, stat):
                 setattr(self, stat, getattr(self, stat) - value)
                 
-    def handle_post_attack_effects(self, enemy, attack_hit, total_damage, attack_type, attack_info):
-        # Handle damage reflection
-        if attack_hit: # Only reflect damage if the attack hits
-            self.player.update_buffs()
-            self.player.update_hots()
-            self.player.update_cooldowns()
-
-        # Handle attack effects
-        if 'effect' in attack_info and attack_hit:
-            self.apply_attack_effect(attack_info['effect'], enemy, self.player, total_damage)
-        
-        # Handle stance changes
-        if attack_type.endswith("_stance"):
-            if attack_type == "defensive_stance":
-                stance = DEFENSIVE_STANCE(attack_info["duration"], attack_info["defence_boost_percentage"])
-            elif attack_type == "power_stance":
-                stance = POWER_STANCE(attack_info["duration"], attack_info["attack_boost_percentage"])
-            elif attack_type == "berserker_stance":
-                stance = BERSERKER_STANCE(attack_info["duration"], attack_info["attack_boost_percentage"])
-            elif attack_type == "accuracy_stance":
-                stance = ACCURACY_STANCE(attack_info["duration"], attack_info["accuracy_boost_percentage"])
-            elif attack_type == "evasion_stance":
-                stance = EVASION_STANCE(attack_info["duration"], attack_info["evasion_boost_percentage"])
-            
-            stance.set_battle_display(self.battle_display)
-            self.player.apply_status_effect(stance)
-
     def check_battle_end(self, enemy):
         self.battle_display.wait_for_animation()
         
@@ -193,20 +152,14 @@ class Battle:
             self.end_battle("enemy_defeat", enemy)
             return True
         
-        enemy.update_status_effects(enemy)
+        self.engine.enemy_phase()
+        self.present_pending()
+        self.battle_display.draw_battle_screen(self.player, self.current_location, enemy)
         
         if not enemy.is_alive():
             self.end_battle("enemy_defeat", enemy)
             return True
         
-        if enemy.stunned:
-            print(f"\n{enemy.name} is stunned and loses their turn!")
-            enemy.stunned = False
-        else:
-            self.enemy_attack(enemy)
-            
-        self.player.update_status_effects(self.player)
-        
         if not self.player.is_alive():
             self.end_battle("player_defeat")
             return True
@@ -214,118 +167,28 @@ class Battle:
         return False
 
     def enemy_attack(self, enemy):
-        attack_type = enemy.choose_attack()
-        attack_info = ENEMY_ATTACK_TYPES[attack_type]
-        
-        message, total_damage, self_damage_info, attack_hit = enemy.perform_attack(self.player, attack_type)
-        self.battle_display.draw_battle_message(message)
-        
-        if attack_hit:
-            # Provide visual feedback for hit
-            self.battle_display.draw_battle_screen(self.player, self.current_location, enemy)
-            pygame.display.flip()
-            
-            # Handle main effect
-            if 'effect' in attack_info:
-                self.apply_attack_effect(attack_info['effect'], self.player, enemy, total_damage)
-                
-            # Handle any extra effects
-            if 'extra_effects' in attack_info:
-                for extra_effect in attack_info['extra_effects']:
-                    self.apply_attack_effect(extra_effect, self.player, enemy, total_damage)
-            
-        """reflected_damage = self.handle_damage_reflection(enemy, self.player, total_damage)
-        if reflected_damage > 0:
-            self.battle_display.draw_battle_message(f"{enemy.name} takes {reflected_damage} reflected damage!")"""
+        self.present_pending()
+        self.engine.enemy_turn()
+        self.present_pending()
+        self.battle_display.draw_battle_screen(self.player, self.current_location, enemy)
 
         if not self.player.is_alive():
             self.end_battle("player_defeat")
         
-        return False, self_damage_info
-    
-    def handle_damage_reflection(self, attacker, defender, damage):
-        reflected_damage = 0
-        for effect in defender.status_effects:
-            if effect.name == "Damage Reflect":
-                reflected_damage += effect.apply_func(attacker, effect.strength, damage)[0]
-        if reflected_damage > 0:
-            attacker.take_damage(reflected_damage)
-        return reflected_damage
-    
-    def apply_attack_effect(self, effect_type, target, attacker, damage):
-        #print(f"Applying {effect_type} effect from {attacker.name} to {target.name}")  # Debug output
-        effect_strength = max(1, attacker.level // 5)
-        effect = None
-        if effect_type == "poison":
-            effect_strength = max(1, attacker.level // 3)
-            effect = POISON(4, effect_strength)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "burn":
-            effect = BURN(4, effect_strength)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "freeze":
-            effect = FREEZE(2, 0)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "stun":
-            effect = STUN(2, 0)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "confusion":
-            effect = CONFUSION(3, 0)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "stamina_drain":
-            effect = STAMINA_DRAIN(damage)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "damage_reflect":
-            effect = DAMAGE_REFLECT(4, 0)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                attacker.apply_status_effect(effect)
-        elif effect_type == "lifesteal":
-            effect = VAMPIRIC(damage)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "defence_break":
-            effect_strength = 1
-            effect = DEFENCE_BREAK(3, effect_strength, damage)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == "attack_weaken":
-            effect_strength = 1
-            effect = ATTACK_WEAKEN(3, effect_strength, damage)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                target.apply_status_effect(effect)
-        elif effect_type == 'self_damage':
-            effect = SelfDamage(damage)
-            if effect:
-                effect.set_battle_display(self.battle_display)
-                attacker.apply_status_effect(effect)
-        """if effect:
-            effect.set_battle_display(self.battle_display)
-            target.apply_status_effect(effect)"""
-        # Add other effects as needed
+        return False, None
     
     def chance_to_hit(self, attacker, target):
-        print(f"Chance to hit %: {attacker.accuracy - target.evasion}")
+        from damage_model import damage_distributions
+        for attack in damage_distributions(attacker, target).values():
+            low, high = attack.hit_range
+            print(f"{attack.name}: {attack.hit_chance:.0%} to hit, avg {attack.expected:.1f} dmg ({low}-{high} on hit)")
     
     def battle(self, enemy):
         #Battle logic, displays player and enemy stats, updates the cooldowns of any items and buffs
         self.enemy = enemy
         enemy.battle_display = self._battle_display
+        self.engine = CombatEngine(self.player, enemy)
+        self._presented = 0
         enemy._prev_hp = enemy.hp
         self.player._prev_hp = self.player.hp
         scroll_offset = 0
@@ -432,16 +295,16 @@ class Battle:
         # Handle variant-specific drops first, if applicable
         if variant_data and 'loot_modifiers' in variant_data:
             # Handle guaranteed drops from variants
-            guaranteed_drops = variant_data['loot_modifiers'].get('guaranteed_drops', [])
-            for guaranteed_type in guaranteed_drops:
-                if guaranteed_type in ["common", "uncommon", "rare", "epic", "masterwork", "legendary", "mythical"]:
+            loot_table = get_loot_table(self.items, enemy_tier, variant_data['loot_modifiers'])
+            for guaranteed_type in loot_table.guaranteed:
+                if guaranteed_type in ITEM_TIERS:
                     # Get items of the guaranteed tier
-                    tier_items = [item for item in self.items.values() if item.tier == guaranteed_type]
+                    tier_items = self.items.pool(tier=guaranteed_type)
                     if tier_items:
                         drops.append(self.create_item_drop(random.choice(tier_items)))
                 else:
                     # Get items of the guaranteed type (like "consumable")
-                    type_items = [item for item in self.items.values() if item.type == guaranteed_type and self._is_tier_appropriate(item.tier, self.player.level)]
+                    type_items = self.items.pool(item_type=guaranteed_type, max_level=self.player.level)
                     if type_items:
                         drops.append(self.create_item_drop(random.choice(type_items)))
                         
@@ -461,96 +324,21 @@ class Battle:
                 
     def generate_loot(self, enemy_tier, variant_modifiers=None):
         """Generate loot based on enemy tier with enemy variants"""
-        drops = []
-        base_loot_tiers = self.get_loot_tiers(enemy_tier)
-        loot_tiers = base_loot_tiers.copy()
-        
-        # Get valid items for the loot pool
-        loot_pool = [item for item in self.items.values() if item.tier in loot_tiers]
-        
-        if not loot_pool:
-            return drops
-        
-        # Determine number of items to drop
-        num_drops = 1
-        
-        # Add variant quantity bonus if applicable
-        if variant_modifiers and "quantity_bonus" in variant_modifiers:
-            num_drops += variant_modifiers["quantity_bonus"]
-        
-        # 10% chance for additional drop
-        while random.random() < 0.1 and num_drops < 3:
-            num_drops += 1
-            
-        for _ in range(num_drops):
-            item = random.choice(loot_pool)
-            drops.append(self.create_item_drop(item))
-        
-        # Apply variant quality boost if applicable
-        if variant_modifiers and "quality_boost" in variant_modifiers:
-            tier_order = ["common", "uncommon", "rare", "epic", "masterwork", "legendary", "mythical"]
-            for item in drops:
-                if random.random() < variant_modifiers["quality_boost"]:
-                    current_tier_idx = tier_order.index(item.tier)
-                    if current_tier_idx < len(tier_order) - 1:
-                        # Get an item of the next tier
-                        next_tier = tier_order[current_tier_idx + 1]
-                        next_tier_items = [i for i in self.items.values() if i.tier == next_tier]
-                        if next_tier_items:
-                            upgraded_item = self.create_item_drop(random.choice(next_tier_items))
-                            drops[drops.index(item)] = upgraded_item
-        
-        return drops
+        # Quantity bonus and quality boost are already part of the compiled table
+        loot_table = get_loot_table(self.items, enemy_tier, variant_modifiers)
+        return [self.create_item_drop(item) for item in loot_table.draw()]
     
     def create_item_drop(self, item):
         """Helper method to create a new item instance with appropriate stack size"""
+        # New copy sharing the item's definition, never the catalog item itself
         if item.is_stackable():
-            # Calculate stack size based on tier
-            base_stack = {
-                "common": (1, 3),
-                "uncommon": (1, 2),
-                "rare": (1, 2),
-                "epic": 1,
-                "masterwork": 1,
-                "legendary": 1,
-                "mythical": 1
-            }
-            
-            # Get stack range for item tier
-            stack_range = base_stack.get(item.tier, (1, 1))
-            
-            # Calculate stack size
-            if isinstance(stack_range, tuple):
-                stack_size = random.randint(*stack_range)
-            else:
-                stack_size = stack_range
-            
-            # Create new item with stack size
-            new_item = type(item)(
-                item.name, item.type, item.value, item.tier,
-                effect_type=item.effect_type, effect=item.effect,
-                cooldown=item.cooldown, duration=item.duration,
-                tick_effect=item.tick_effect,
-                weapon_type=item.weapon_type,
-                stamina_restore=item.stamina_restore
-            )
-            new_item.stack_size = stack_size
-            return new_item
+            return item.copy(stack_size(item.tier))
         else:
-            return item
+            return item.copy()
     
     def _is_tier_appropriate(self, tier, player_level):
         """Check if an item is appropriate for the player level"""
-        tier_requirements = {
-            "common": 1,
-            "uncommon": 3,
-            "rare": 6,
-            "epic": 10,
-            "masterwork": 15,
-            "legendary": 20,
-            "mythical": 25
-        }
-        return player_level >= tier_requirements.get(tier, 1)
+        return player_level >= TIER_LEVELS.get(tier, 1)
     
     def display_loot(self, drops):
         """Display dropped loot with stack information"""
@@ -618,55 +406,6 @@ class Battle:
         for item in drops:
             self.player.add_item(item)
     
-    def get_loot_tiers(self, enemy_tier):
-        """Determine eligible loot tiers based on enemy tier"""
-        basic_tiers = {
-            "low": ["common"],
-            "medium": ["uncommon"],
-            "medium-hard": ["uncommon", "rare"],
-            "hard": ["rare", "epic"],
-            "very-hard": ["epic", "masterwork"],
-            "extreme": ["masterwork", "legendary"],
-            "boss": ["legendary", "mythical"]
-        }
-        
-        # Define the maximum possible tier upgrade based on base tier
-        max_tier_upgrade = {
-            "low": "rare",
-            "medium": "epic",
-            "medium-hard": "epic",
-            "hard": "legendary",
-            "very-hard": "legendary",
-            "extreme": "mythical",
-            "boss": "mythical"
-        }
-        
-        # Get base tiers for the enemy's tier
-        tiers = basic_tiers.get(enemy_tier, ["common"])
-        max_allowed_tier = max_tier_upgrade.get(enemy_tier, "rare")
-        
-        # tier_order defines the progression of tiers
-        tier_order = ["common", "uncommon", "rare", "epic", "masterwork", "legendary", "mythical"]
-        
-        # Check for variant in enemy name and apply tier boost if applicable
-        enemy_name = self.enemy.name if hasattr(self, 'enemy') else ""
-        for variant in MONSTER_VARIANTS:
-            if variant in enemy_name:
-                variant_data = MONSTER_VARIANTS[variant]["loot_modifiers"]
-                if random.random() < variant_data.get("quality_boost", 0):
-                    # Get current highest tier
-                    current_highest = tiers[-1]
-                    current_idx = tier_order.index(current_highest)
-                    max_allowed_idx = tier_order.index(max_allowed_tier)
-                    
-                    # Only upgrade if we haven't reached the maximum allowed tier
-                    if current_idx < max_allowed_idx:
-                        next_tier = tier_order[current_idx + 1]
-                        tiers.append(next_tier)
-                    break
-                    
-        return tiers
-    
     def run_away(self, enemy):
         #Gives the player a 50% chance to run away from the enemy, if they fail, the enemy attacks, damage is set based on difference between enemy attack and player defence * 2
         if random.random() < 0.5:
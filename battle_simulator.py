@@ -0,0 +1,294 @@
+# battle_simulator.py
+"""Monte Carlo battle simulator.
+
+Pits a levelled player against every enemy template in every zone of the world
+map using the headless CombatEngine, spreading the fights over all CPU cores.
+Results are written to a CSV or JSON report as each pairing finishes.
+
+Example:
+    python battle_simulator.py --fights 10000 --levels 1-30 --output balance_report.csv
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from item_catalog import TIER_LEVELS
+
+MAX_ROUNDS = 200  # Fights still going after this many rounds are counted as timeouts
+UNZONED = "Unzoned"  # Location name for templates that don't appear on the world map
+
+REPORT_FIELDS = [
+    "location", "enemy", "tier", "level", "fights",
+    "win_rate", "loss_rate", "mutual_rate", "timeout_rate",
+    "avg_rounds", "avg_rounds_to_kill", "avg_hp_lost", "avg_hp_lost_percent"
+]
+
+
+# Players are expensive to build (they load the full item catalogue), so each worker keeps one per level
+_player_cache = {}
+
+def _seed_for(*parts):
+    """Stable seed, unlike hash() this is the same in every worker process"""
+    return zlib.crc32(":".join(str(part) for part in parts).encode())
+
+def load_game_modules(seed):
+    """Import the game modules the same way in every process, call before building players or enemies"""
+    # Some enemy template stats are rolled when enemies.py is imported, seed first so every process gets the same ones
+    if "enemies" not in sys.modules:
+        random.seed(_seed_for(seed, "templates"))
+    import enemies, player, combat
+
+def _init_worker(seed):
+    # Status effects report to stdout when there is no battle display, silence them in workers
+    sys.stdout = open(os.devnull, "w")
+    load_game_modules(seed)
+
+def equip_loadout(player, gear):
+    """Equip the player for a fight.
+
+    Args:
+        player: Player to equip
+        gear: "none" leaves them unarmed, "starter" uses the starting kit and
+            "shop" picks the most valuable item per slot that shops stock at their level
+    """
+    if gear == "starter":
+        for item in player.items.values():
+            if item.tier == "starter" and item.type in player.equipped:
+                player.equip_item(item.copy())
+    elif gear == "shop":
+        best = {}
+        for item in player.items.values():
+            if item.type not in player.equipped or TIER_LEVELS.get(item.tier, 1) > player.level:
+                continue
+            if item.type not in best or item.value > best[item.type].value:
+                best[item.type] = item
+        for item in best.values():
+            player.equip_item(item.copy())
+
+def build_player(level, seed, gear="shop"):
+    """Create a player and roll its level ups with a seed shared by every pairing at that level"""
+    from player import Player
+    key = (level, seed, gear)
+    if key not in _player_cache:
+        state = random.getstate()
+        random.seed(_seed_for(seed, "player", level))
+        player = Player("Simulator")
+        for _ in range(level - 1):
+            player.level += 1
+            player.apply_level_gains()
+        equip_loadout(player, gear)
+        random.setstate(state)
+        _player_cache[key] = player
+    return _player_cache[key]
+
+def reset_player(player):
+    """Put the player back to full health with no lingering combat state"""
+    player.hp = player.max_hp
+    player.stamina = player.max_stamina
+    player.status_effects = []
+    player.stunned = False
+    player.confused = False
+    player.frozen = False
+    for modifiers in (player.combat_buff_modifiers, player.debuff_modifiers, player.weapon_buff_modifiers):
+        for stat in modifiers:
+            modifiers[stat] = 0
+    player.cooldowns = {}
+    player.combat_buffs = {}
+    player.active_hots = {}
+    player.active_debuffs = {}
+    player.weapon_buff = {'value': 0, 'duration': 0}
+    player.weapon_coating = None
+    player.recalculate_stats()
+
+def simulate_fight(player, enemy_name, attack_type):
+    """Run one fight to completion, returns (outcome, rounds, hp_lost)"""
+    from enemies import create_enemy
+    from combat import CombatEngine
+    from player import PLAYER_ATTACK_TYPES
+
+    reset_player(player)
+    enemy = create_enemy(enemy_name, player)
+    engine = CombatEngine(player, enemy)
+    attack_info = PLAYER_ATTACK_TYPES[attack_type]
+    weapon_type = getattr(player.equipped.get("weapon"), "weapon_type", "light")
+    stamina_cost = player.get_weapon_stamina_cost(weapon_type) + attack_info["stamina_modifier"]
+
+    rounds = 0
+    while engine.outcome() is None and rounds < MAX_ROUNDS:
+        rounds += 1
+        if player.stamina < stamina_cost:
+            # Out of stamina, the player can only take the hit
+            engine.enemy_phase()
+        else:
+            engine.play_round(attack_type)
+        engine.log.events.clear()  # Events aren't needed here, don't let them pile up
+
+    return engine.outcome() or "timeout", rounds, player.max_hp - player.hp
+
+def simulate_pairing(location, enemy_name, level, fights, seed, chunk, attack_type="normal", gear="shop"):
+    """Worker entry point, runs a chunk of fights for one pairing and returns summed results"""
+    player = build_player(level, seed, gear)
+    random.seed(_seed_for(seed, location, enemy_name, level, chunk))
+
+    totals = {"fights": 0, "player_win": 0, "player_defeat": 0, "mutual_defeat": 0, "timeout": 0,
+              "rounds": 0, "win_rounds": 0, "hp_lost": 0, "hp_lost_percent": 0.0}
+    for _ in range(fights):
+        outcome, rounds, hp_lost = simulate_fight(player, enemy_name, attack_type)
+        outcome = "player_win" if outcome == "enemy_defeat" else outcome
+        totals["fights"] += 1
+        totals[outcome] += 1
+        totals["rounds"] += rounds
+        if outcome == "player_win":
+            totals["win_rounds"] += rounds
+        totals["hp_lost"] += hp_lost
+        totals["hp_lost_percent"] += hp_lost / player.max_hp * 100
+    return (location, enemy_name, level), totals
+
+def build_pairings(levels, locations=None, include_unzoned=True):
+    """Every (location, enemy, level) combination to simulate"""
+    from enemies import ENEMY_TEMPLATES
+    from world_map import WorldMap
+
+    game_map = WorldMap()._game_map
+    pairings = []
+    zoned = set()
+    for location, info in game_map.items():
+        if locations and location not in locations:
+            continue
+        for enemy_name in info["enemies"]:
+            if enemy_name in ENEMY_TEMPLATES:
+                zoned.add(enemy_name)
+                pairings.extend((location, enemy_name, level) for level in levels)
+
+    if include_unzoned and not locations:
+        for enemy_name in ENEMY_TEMPLATES:
+            if enemy_name not in zoned:
+                pairings.extend((UNZONED, enemy_name, level) for level in levels)
+    return pairings
+
+def summarise(location, enemy_name, level, totals):
+    from enemies import ENEMY_TEMPLATES
+    fights = max(1, totals["fights"])
+    wins = totals["player_win"]
+    return {
+        "location": location,
+        "enemy": enemy_name,
+        "tier": ENEMY_TEMPLATES[enemy_name]["tier"],
+        "level": level,
+        "fights": totals["fights"],
+        "win_rate": round(wins / fights, 4),
+        "loss_rate": round(totals["player_defeat"] / fights, 4),
+        "mutual_rate": round(totals["mutual_defeat"] / fights, 4),
+        "timeout_rate": round(totals["timeout"] / fights, 4),
+        "avg_rounds": round(totals["rounds"] / fights, 2),
+        "avg_rounds_to_kill": round(totals["win_rounds"] / wins, 2) if wins else None,
+        "avg_hp_lost": round(totals["hp_lost"] / fights, 1),
+        "avg_hp_lost_percent": round(totals["hp_lost_percent"] / fights, 2)
+    }
+
+class ReportWriter:
+    """Writes report rows as they arrive so a long sweep can be watched and survives interruption"""
+    def __init__(self, path, report_format):
+        self.format = report_format
+        self.file = open(path, "w", newline="")
+        self.rows = 0
+        if report_format == "csv":
+            self.writer = csv.DictWriter(self.file, fieldnames=REPORT_FIELDS)
+            self.writer.writeheader()
+        else:
+            self.file.write("[\n")
+
+    def write(self, row):
+        if self.format == "csv":
+            self.writer.writerow(row)
+        else:
+            self.file.write((",\n" if self.rows else "") + json.dumps(row))
+        self.rows += 1
+        self.file.flush()
+
+    def close(self):
+        if self.format == "json":
+            self.file.write("\n]\n")
+        self.file.close()
+
+def parse_levels(text):
+    """Accepts "5", "1-30" or "1,5,10" """
+    levels = []
+    for part in text.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            levels.extend(range(int(start), int(end) + 1))
+        else:
+            levels.append(int(part))
+    return levels
+
+def run_sweep(args):
+    load_game_modules(args.seed)
+    levels = parse_levels(args.levels)
+    locations = set(args.locations) if args.locations else None
+    pairings = build_pairings(levels, locations, include_unzoned=not args.zoned_only)
+
+    # Split each pairing into chunks so the work spreads evenly over the workers
+    chunks_per_pairing = max(1, -(-args.fights // args.chunk_size))
+    remaining = {}
+    totals = {}
+    writer = ReportWriter(args.output, args.format)
+    started = time.time()
+
+    print(f"Simulating {len(pairings)} pairings x {args.fights} fights on {args.workers or os.cpu_count()} workers")
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(args.seed,)) as executor:
+        futures = []
+        for location, enemy_name, level in pairings:
+            remaining[(location, enemy_name, level)] = chunks_per_pairing
+            for chunk in range(chunks_per_pairing):
+                fights = min(args.chunk_size, args.fights - chunk * args.chunk_size)
+                futures.append(executor.submit(simulate_pairing, location, enemy_name, level,
+                                               fights, args.seed, chunk, args.attack, args.gear))
+
+        completed = 0
+        for future in as_completed(futures):
+            key, chunk_totals = future.result()
+            pairing_totals = totals.setdefault(key, dict.fromkeys(chunk_totals, 0))
+            for stat, value in chunk_totals.items():
+                pairing_totals[stat] += value
+
+            remaining[key] -= 1
+            if remaining[key] == 0:
+                writer.write(summarise(*key, totals.pop(key)))
+                completed += 1
+                if completed % 50 == 0 or completed == len(pairings):
+                    print(f"{completed}/{len(pairings)} pairings done ({time.time() - started:.1f}s)")
+
+    writer.close()
+    print(f"Report written to {args.output} in {time.time() - started:.1f}s")
+
+def main():
+    from player import PLAYER_ATTACK_TYPES
+    parser = argparse.ArgumentParser(description="Monte Carlo battle simulator for balancing enemies against player levels")
+    parser.add_argument("--fights", type=int, default=1000, help="Fights per location/enemy/level pairing")
+    parser.add_argument("--levels", default="1-30", help='Player levels to test, e.g. "1-30" or "1,5,10"')
+    parser.add_argument("--locations", nargs="*", help="Only simulate these world map locations")
+    parser.add_argument("--zoned-only", action="store_true", help="Skip templates that don't appear on the world map")
+    parser.add_argument("--attack", default="normal", choices=[name for name, info in PLAYER_ATTACK_TYPES.items() if "stance_type" not in info],
+                        help="Attack the simulated player uses every turn")
+    parser.add_argument("--gear", choices=["shop", "starter", "none"], default="shop",
+                        help="Equipment for the simulated player, shop picks the best item per slot for their level")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed, the same seed reproduces the same report")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to every core)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Fights per work unit sent to a worker")
+    parser.add_argument("--format", choices=["csv", "json"], default=None, help="Report format (defaults to the output file extension)")
+    parser.add_argument("--output", default="battle_report.csv", help="Report file to write")
+    args = parser.parse_args()
+
+    if args.format is None:
+        args.format = "json" if args.output.endswith(".json") else "csv"
+    run_sweep(args)
+
+if __name__ == "__main__":
+    main()
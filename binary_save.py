@@ -0,0 +1,225 @@
+# binary_save.py
+"""Compact binary save format.
+
+Holds exactly the data a JSON save does, so the two convert back and forth
+without losing anything. Every distinct string (dict keys, item ids, names) is
+written once in a string table and referred to by index afterwards, numbers are
+variable length, and unchanged catalog items are a two number record of their
+definition id and stack size instead of a dict. Runs of those items in a list,
+like most of an inventory, are packed into one fixed width block that loads in
+a single struct call.
+
+Layout:
+    MAGIC, format version (uint16), string table, root value
+
+Versions:
+    1: First binary format
+"""
+import json
+import struct
+
+MAGIC = b"TRPGSAV\0"
+FORMAT_VERSION = 1
+
+# One byte tag in front of every value
+NONE, FALSE, TRUE, INT, FLOAT, STRING, LIST, DICT, ITEM, ITEM_RUN = range(10)
+
+MAX_PACKED = 0xFFFFFFFF  # Item runs store string indexes and stack sizes as uint32
+
+_VERSION = struct.Struct("<H")
+_FLOAT = struct.Struct("<d")
+
+class SaveFormatError(ValueError):
+    """The data isn't a binary save this version can read"""
+
+def is_binary_save(data):
+    return data[:len(MAGIC)] == MAGIC
+
+def _key(key):
+    # json turns int, float, bool and None keys into strings, do the same so both formats load identically
+    return key if isinstance(key, str) else json.dumps(key)
+
+def _is_catalog_item(value):
+    """Item saved by id, see save_system.item_to_data"""
+    return (len(value) == 2 and isinstance(value.get("id"), str)
+            and isinstance(value.get("stack_size"), int) and value["stack_size"] >= 0)
+
+def _write_varint(out, number):
+    while number > 0x7F:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+def _read_varint(data, position):
+    number = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, position
+        shift += 7
+
+class _Encoder:
+    def __init__(self):
+        self.strings = {}
+        self.body = bytearray()
+
+    def string(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        _write_varint(self.body, index)
+
+    def value(self, value):
+        out = self.body
+        if value is None:
+            out.append(NONE)
+        elif value is True:
+            out.append(TRUE)
+        elif value is False:
+            out.append(FALSE)
+        elif isinstance(value, int):
+            out.append(INT)
+            # Zigzag so small negative numbers stay small
+            _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            out.append(FLOAT)
+            out += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            out.append(STRING)
+            self.string(value)
+        elif isinstance(value, (list, tuple)):
+            out.append(LIST)
+            _write_varint(out, len(value))
+            run = []
+            for entry in value:
+                if isinstance(entry, dict) and _is_catalog_item(entry) and entry["stack_size"] <= MAX_PACKED:
+                    run.append(entry)
+                    continue
+                self.item_run(run)
+                self.value(entry)
+            self.item_run(run)
+        elif isinstance(value, dict):
+            if _is_catalog_item(value):
+                out.append(ITEM)
+                self.string(value["id"])
+                _write_varint(out, value["stack_size"])
+                return
+            out.append(DICT)
+            _write_varint(out, len(value))
+            for key, entry in value.items():
+                self.string(_key(key))
+                self.value(entry)
+        else:
+            raise TypeError(f"Can't save {type(value).__name__} values")
+
+    def item_run(self, run):
+        """Write the catalog items collected from a list as one packed block and empty the run"""
+        if not run:
+            return
+        packed = []
+        for item in run:
+            index = self.strings.get(item["id"])
+            if index is None:
+                index = self.strings[item["id"]] = len(self.strings)
+            packed += (index, item["stack_size"])
+        self.body.append(ITEM_RUN)
+        _write_varint(self.body, len(run))
+        self.body += struct.pack(f"<{len(packed)}I", *packed)
+        run.clear()
+
+class _Decoder:
+    def __init__(self, data, position):
+        self.data = data
+        count, position = _read_varint(data, position)
+        self.strings = []
+        for _ in range(count):
+            length, position = _read_varint(data, position)
+            self.strings.append(data[position:position + length].decode("utf-8"))
+            position += length
+        self.position = position
+
+    def varint(self):
+        number, self.position = _read_varint(self.data, self.position)
+        return number
+
+    def string(self):
+        return self.strings[self.varint()]
+
+    def value(self):
+        tag = self.data[self.position]
+        self.position += 1
+        if tag == NONE:
+            return None
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+        if tag == INT:
+            number = self.varint()
+            return number >> 1 if not number & 1 else -((number + 1) >> 1)
+        if tag == FLOAT:
+            value = _FLOAT.unpack_from(self.data, self.position)[0]
+            self.position += _FLOAT.size
+            return value
+        if tag == STRING:
+            return self.string()
+        if tag == LIST:
+            result = []
+            remaining = self.varint()
+            while remaining:
+                if self.data[self.position] == ITEM_RUN:
+                    self.position += 1
+                    run = self.item_run()
+                    result += run
+                    remaining -= len(run)
+                else:
+                    result.append(self.value())
+                    remaining -= 1
+            return result
+        if tag == DICT:
+            result = {}
+            for _ in range(self.varint()):
+                key = self.string()
+                result[key] = self.value()
+            return result
+        if tag == ITEM:
+            item_id = self.string()
+            return {"id": item_id, "stack_size": self.varint()}
+        raise SaveFormatError(f"Unknown value tag {tag} at byte {self.position - 1}")
+
+    def item_run(self):
+        count = self.varint()
+        packed = struct.unpack_from(f"<{count * 2}I", self.data, self.position)
+        self.position += count * 8
+        strings = self.strings
+        return [{"id": strings[index], "stack_size": stack_size} for index, stack_size in zip(packed[::2], packed[1::2])]
+
+def encode(save_data):
+    """Binary save file contents for the same data save_game would write as json"""
+    encoder = _Encoder()
+    encoder.value(save_data)
+    out = bytearray(MAGIC)
+    out += _VERSION.pack(FORMAT_VERSION)
+    _write_varint(out, len(encoder.strings))
+    for text in encoder.strings:
+        encoded = text.encode("utf-8")
+        _write_varint(out, len(encoded))
+        out += encoded
+    out += encoder.body
+    return bytes(out)
+
+def decode(data):
+    """Save data from binary save file contents, the same as json.load gives for a json save"""
+    if not is_binary_save(data):
+        raise SaveFormatError("Not a binary save file")
+    if len(data) < len(MAGIC) + _VERSION.size:
+        raise SaveFormatError("Save file is damaged: it ends before the format version")
+    version = _VERSION.unpack_from(data, len(MAGIC))[0]
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Save format version {version} is newer than this game supports ({FORMAT_VERSION})")
+    try:
+        return _Decoder(data, len(MAGIC) + _VERSION.size).value()
+    except (IndexError, UnicodeDecodeError, struct.error) as e:
+        raise SaveFormatError(f"Save file is damaged: {e}") from e
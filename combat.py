@@ -0,0 +1,331 @@
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass
+from player import Player, PLAYER_ATTACK_TYPES
+from enemies import ENEMY_ATTACK_TYPES
+from status_effects import *
+
+@dataclass
+class CombatEvent:
+    kind: str
+    source: object = None
+    target: object = None
+    amount: int = 0
+    hit_type: str = None
+    name: str = None
+    message: str = None
+
+class EventLog:
+    """Collects combat events, stands in for the battle display while the engine resolves actions"""
+    def __init__(self):
+        self.events = []
+
+    def add(self, kind, **kwargs):
+        event = CombatEvent(kind, **kwargs)
+        self.events.append(event)
+        return event
+
+    def since(self, start):
+        return self.events[start:]
+
+    def draw_battle_message(self, text):
+        self.add("message", message=text)
+
+    def display_status_effects(self, target, effect_name):
+        self.add("status_applied", target=target, name=effect_name)
+
+class CombatEngine:
+    """Combat rules without any drawing, every action returns the list of outcome events it produced"""
+    def __init__(self, player, enemy, log=None):
+        self.player = player
+        self.enemy = enemy
+        self.log = log or EventLog()
+
+    @contextmanager
+    def _capture(self):
+        # Route status effect messages from both fighters into the event log
+        previous = (self.player._battle_display, self.enemy._battle_display)
+        self.player.battle_display = self.log
+        self.enemy.battle_display = self.log
+        try:
+            yield
+        finally:
+            self.player.battle_display, self.enemy.battle_display = previous
+
+    def resolve_attack(self, attacker, defender, attack_type):
+        """Resolve every hit of an attack, applying damage and on-hit effects"""
+        start = len(self.log.events)
+        is_player = isinstance(attacker, Player)
+        attack_info = PLAYER_ATTACK_TYPES[attack_type] if is_player else ENEMY_ATTACK_TYPES[attack_type]
+        self.log.add("attack", source=attacker, target=defender, name=attack_info['name'])
+
+        message = f"{attacker.name} used {attack_info['name']}."
+        total_damage = 0
+        hits = 1 + attack_info.get("extra_attacks", 0)
+        attack_hit = False
+        shattered_freeze = False
+        successful_hits = 0 # Track successful hits for weapon_coating effects
+
+        with self._capture():
+            # Apply attack-specific buffs before damage calculation (player only)
+            if is_player and 'stat_buffs' in attack_info:
+                attacker.apply_attack_buffs(attack_info['stat_buffs'])
+
+            for i in range(hits):
+                damage, hit_type, hit_chance, freeze_shatter = attacker.calculate_damage(attacker, defender, attack_type)
+                shattered_freeze = shattered_freeze or freeze_shatter
+                self.log.add("hit", source=attacker, target=defender, amount=damage, hit_type=hit_type)
+
+                if attack_info.get('effect') == 'self_damage':
+                    self.log.add("self_damage", source=attacker, target=attacker, amount=int(damage * 0.2))
+
+                if hit_type == "miss":
+                    message += f"\n{attacker.name}'s attack missed {defender.name}!"
+                elif hit_type == "blocked":
+                    message += f"\n{attacker.name}'s attack was blocked by {defender.name}!"
+                else:
+                    attack_hit = True
+                    defender.take_damage(damage)
+                    total_damage += damage
+                    if damage > 0:
+                        successful_hits += 1
+                    if i == 0:
+                        message += f"\n{attacker.name} dealt {damage} damage to {defender.name}!"
+                    else:
+                        message += f"\n{attacker.name} dealt an additional {damage} damage to {defender.name}!"
+
+                    if hit_type == "critical":
+                        message += " Critical hit!"
+                        shattered_freeze = True
+                        if "Freeze" in defender.status_effects and shattered_freeze:
+                            defender.remove_status_effect("Freeze")
+                            message += "\nThe frozen state shatters with the critical hit!"
+
+                    if attack_info.get('effect') == 'self_damage':
+                        self.log.add("recoil", source=attacker, amount=int(damage * 0.2), name=attack_info['name'])
+
+            if total_damage > 0 and hits > 1:
+                message += f"\nTotal damage dealt: {total_damage}"
+
+            if is_player and attacker.weapon_coating and successful_hits > 0:
+                total_stacks = attacker.weapon_coating['stacks'] * successful_hits
+                message += f"\n{defender.name} is poisoned by your coated weapon!"
+                message += f"\n({successful_hits} hits, {total_stacks} total poison stacks)"
+                poison_effect = POISON(duration=attacker.weapon_coating['duration'], strength=total_stacks)
+                defender.apply_status_effect(poison_effect)
+
+            if is_player and successful_hits > 0:
+                attacker.update_weapon_buff()
+
+            attacker.remove_status_effect("Freeze")
+
+            # Remove attack-specific buffs after damage calculation (player only)
+            if is_player and 'stat_buffs' in attack_info:
+                attacker.remove_attack_buffs(attack_info['stat_buffs'])
+
+        self.log.add("attack_result", source=attacker, target=defender, amount=total_damage,
+                     hit_type="hit" if attack_hit else "miss", message=message)
+        return self.log.since(start)
+
+    def apply_attack_effect(self, effect_type, target, attacker, damage):
+        """Create and apply the status effect tied to an enemy attack"""
+        start = len(self.log.events)
+        effect_strength = max(1, attacker.level // 5)
+        effect = None
+        recipient = target
+        if effect_type == "poison":
+            effect = POISON(4, max(1, attacker.level // 3))
+        elif effect_type == "burn":
+            effect = BURN(4, effect_strength)
+        elif effect_type == "freeze":
+            effect = FREEZE(2, 0)
+        elif effect_type == "stun":
+            effect = STUN(2, 0)
+        elif effect_type == "confusion":
+            effect = CONFUSION(3, 0)
+        elif effect_type == "stamina_drain":
+            effect = STAMINA_DRAIN(damage)
+        elif effect_type == "damage_reflect":
+            effect = DAMAGE_REFLECT(4, 0)
+            recipient = attacker
+        elif effect_type == "lifesteal":
+            effect = VAMPIRIC(damage)
+        elif effect_type == "defence_break":
+            effect = DEFENCE_BREAK(3, 1, damage)
+        elif effect_type == "attack_weaken":
+            effect = ATTACK_WEAKEN(3, 1, damage)
+        elif effect_type == 'self_damage':
+            effect = SelfDamage(damage)
+            recipient = attacker
+
+        if effect:
+            with self._capture():
+                effect.set_battle_display(self.log)
+                recipient.apply_status_effect(effect)
+        return self.log.since(start)
+
+    def reflect_damage(self, attacker, defender, damage):
+        """Bounce damage back at the attacker from any Damage Reflect on the defender"""
+        start = len(self.log.events)
+        reflected_damage = 0
+        reflect = defender.status_effects.get("Damage Reflect")
+        if reflect:
+            reflected_damage += reflect.apply_func(attacker, reflect.strength, damage)[0]
+        if reflected_damage > 0:
+            attacker.take_damage(reflected_damage)
+            self.log.add("reflect", source=defender, target=attacker, amount=reflected_damage,
+                         message=f"\n{attacker.name} takes {reflected_damage} reflected damage!")
+        return self.log.since(start)
+
+    def pre_attack_effects(self):
+        """Resolve stun, confusion and freeze on the player, returns (turn_lost, events)"""
+        start = len(self.log.events)
+        player = self.player
+        with self._capture():
+            # Handle stun
+            if player.stunned:
+                self.log.add("stunned", target=player, message="\nYou're stunned and lose your turn.")
+                player.stunned = False
+                player.remove_status_effect("Stun")
+                if player.status_effects:
+                    player.update_status_effects(player)
+                return True, self.log.since(start)
+
+            # Handle confusion
+            confusion_effect = player.status_effects.get("Confusion")
+            if confusion_effect:
+                if random.random() < 0.5:
+                    self.log.add("message", message="\nYou're confused and attack yourself!")
+                    damage, hit_type, _, _ = player.calculate_damage(player, player, "normal")
+                    player.take_damage(damage)
+                    self.log.add("message", message=f"\nYou dealt {damage} damage to yourself!")
+                    self.log.add("confusion_hit", source=player, target=player, amount=damage,
+                                 message="\nYour attack on yourself snaps you out of your confusion!")
+                    player.remove_status_effect("Confusion")
+                    return True, self.log.since(start)
+                self.log.add("confusion_cleared", target=player, message=f"\n{player.name} snaps out of their confusion!")
+                player.remove_status_effect("Confusion")
+
+            # Handle freeze
+            frozen_effect = player.status_effects.get("Freeze")
+            if frozen_effect:
+                if random.random() < 0.5:
+                    self.log.add("frozen", target=player, message="\nYou're frozen and cannot attack!")
+                    self.enemy_turn()
+                    player.update_status_effects(player)
+                    return True, self.log.since(start)
+                self.log.add("thawed", target=player, message=f"\n{player.name} thaws out from the ice and attacks!")
+                player.remove_status_effect("Freeze")
+
+        return False, self.log.since(start)
+
+    def pay_stamina(self, attack_info):
+        """Spend the stamina an attack costs, returns False if the player can't afford it"""
+        weapon = self.player.equipped.get("weapon")
+        weapon_type = getattr(weapon, 'weapon_type', "light")
+        total_stamina_cost = self.player.get_weapon_stamina_cost(weapon_type) + attack_info['stamina_modifier']
+        if self.player.stamina < total_stamina_cost:
+            self.log.add("no_stamina", source=self.player, message=f"Not enough stamina for {attack_info['name']}!")
+            return False
+        self.player.use_stamina(total_stamina_cost)
+        return True
+
+    def post_attack_effects(self, attack_type, attack_hit, total_damage):
+        """Tick the player's buffs after a hit, then apply the attack's effect or stance"""
+        start = len(self.log.events)
+        attack_info = PLAYER_ATTACK_TYPES[attack_type]
+        with self._capture():
+            if attack_hit:
+                self.player.update_buffs()
+                self.player.update_hots()
+                self.player.update_cooldowns()
+
+        # Handle attack effects
+        if 'effect' in attack_info and attack_hit:
+            self.apply_attack_effect(attack_info['effect'], self.enemy, self.player, total_damage)
+
+        # Handle stance changes
+        if attack_type.endswith("_stance"):
+            if attack_type == "defensive_stance":
+                stance = DEFENSIVE_STANCE(attack_info["duration"], attack_info["defence_boost_percentage"])
+            elif attack_type == "power_stance":
+                stance = POWER_STANCE(attack_info["duration"], attack_info["attack_boost_percentage"])
+            elif attack_type == "berserker_stance":
+                stance = BERSERKER_STANCE(attack_info["duration"], attack_info["attack_boost_percentage"])
+            elif attack_type == "accuracy_stance":
+                stance = ACCURACY_STANCE(attack_info["duration"], attack_info["accuracy_boost_percentage"])
+            elif attack_type == "evasion_stance":
+                stance = EVASION_STANCE(attack_info["duration"], attack_info["evasion_boost_percentage"])
+
+            with self._capture():
+                stance.set_battle_display(self.log)
+                self.player.apply_status_effect(stance)
+        return self.log.since(start)
+
+    def enemy_phase(self):
+        """Tick the enemy's effects, let it respond unless stunned, then tick the player's effects"""
+        start = len(self.log.events)
+        player, enemy = self.player, self.enemy
+        with self._capture():
+            if not enemy.is_alive():
+                return self.log.since(start)
+
+            enemy.update_status_effects(enemy)
+
+            if not enemy.is_alive():
+                return self.log.since(start)
+
+            if enemy.stunned:
+                self.log.add("stunned", target=enemy, message=f"\n{enemy.name} is stunned and loses their turn!")
+                enemy.stunned = False
+            else:
+                self.enemy_turn()
+
+            player.update_status_effects(player)
+        return self.log.since(start)
+
+    def player_attack(self, attack_type):
+        """Resolve a chosen player attack including reflection and the follow-up effects"""
+        start = len(self.log.events)
+        result = self.resolve_attack(self.player, self.enemy, attack_type)[-1]
+        attack_hit = result.hit_type == "hit"
+        if attack_hit:
+            self.reflect_damage(self.player, self.enemy, result.amount)
+        self.post_attack_effects(attack_type, attack_hit, result.amount)
+        return self.log.since(start)
+
+    def enemy_turn(self):
+        """Let the enemy pick and resolve an attack against the player"""
+        start = len(self.log.events)
+        attack_type = self.enemy.choose_attack()
+        attack_info = ENEMY_ATTACK_TYPES[attack_type]
+
+        result = self.resolve_attack(self.enemy, self.player, attack_type)[-1]
+        if result.hit_type == "hit":
+            # Handle main effect
+            if 'effect' in attack_info:
+                self.apply_attack_effect(attack_info['effect'], self.player, self.enemy, result.amount)
+            # Handle any extra effects
+            for extra_effect in attack_info.get('extra_effects', []):
+                self.apply_attack_effect(extra_effect, self.player, self.enemy, result.amount)
+        return self.log.since(start)
+
+    def play_round(self, attack_type):
+        """One full round as the battle screen runs it: the player's attack followed by the enemy phase"""
+        start = len(self.log.events)
+        turn_lost, _ = self.pre_attack_effects()
+        if not turn_lost and self.pay_stamina(PLAYER_ATTACK_TYPES[attack_type]):
+            self.player_attack(attack_type)
+            if self.outcome() is None:
+                self.enemy_phase()
+        return self.log.since(start)
+
+    def outcome(self):
+        """Return "player_defeat", "enemy_defeat", "mutual_defeat" or None while both fighters stand"""
+        if not self.player.is_alive() and not self.enemy.is_alive():
+            return "mutual_defeat"
+        if not self.player.is_alive():
+            return "player_defeat"
+        if not self.enemy.is_alive():
+            return "enemy_defeat"
+        return None
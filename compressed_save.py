@@ -0,0 +1,91 @@
+# compressed_save.py
+"""zlib compressed save container.
+
+The same JSON a .json save holds, streamed through zlib in both directions:
+saving encodes the save a field at a time (long lists a slice at a time) and
+writes each compressed block as it is produced, so the whole JSON text is
+never built. Loading reads and inflates the file in blocks rather than
+reading it in one go.
+
+Layout:
+    MAGIC, format version (1 byte), zlib stream of the save's JSON
+"""
+import io
+import json
+import zlib
+
+MAGIC = b"TRPGZ\0"
+FORMAT_VERSION = 1
+CHUNK_SIZE = 64 * 1024  # Bytes handed to zlib and read from disk at a time
+LIST_SLICE = 1000  # Entries of a long list encoded at once
+NESTED_LEVELS = 2  # Dicts this deep (the save and its player) are encoded field by field
+COMPRESSION_LEVEL = 6
+
+class CompressedSaveError(ValueError):
+    """The data isn't a compressed save this version can read"""
+
+def is_compressed_save(data):
+    return data[:len(MAGIC)] == MAGIC
+
+def _json_chunks(value, depth=0):
+    """The JSON text of a value in pieces, each piece encoded by json's C encoder"""
+    if depth < NESTED_LEVELS and isinstance(value, dict) and value and all(isinstance(key, str) for key in value):
+        separator = "{"
+        for key, entry in value.items():
+            yield separator + json.dumps(key) + ":"
+            yield from _json_chunks(entry, depth + 1)
+            separator = ","
+        yield "}"
+    elif depth <= NESTED_LEVELS and isinstance(value, (list, tuple)) and len(value) > LIST_SLICE:
+        separator = "["
+        for start in range(0, len(value), LIST_SLICE):
+            yield separator + json.dumps(value[start:start + LIST_SLICE])[1:-1]
+            separator = ","
+        yield "]"
+    else:
+        yield json.dumps(value)
+
+def write(file, save_data, level=COMPRESSION_LEVEL):
+    """Stream save data into an open binary file, returns the bytes written"""
+    compressor = zlib.compressobj(level)
+    written = file.write(MAGIC + bytes([FORMAT_VERSION]))
+    pending = []
+    pending_size = 0
+    for text in _json_chunks(save_data):
+        pending.append(text)
+        pending_size += len(text)
+        if pending_size >= CHUNK_SIZE:
+            written += file.write(compressor.compress("".join(pending).encode("utf-8")))
+            pending = []
+            pending_size = 0
+    written += file.write(compressor.compress("".join(pending).encode("utf-8")))
+    written += file.write(compressor.flush())
+    return written
+
+def read(file):
+    """Save data from an open binary file positioned at the start of a compressed save"""
+    header = file.read(len(MAGIC) + 1)
+    if not is_compressed_save(header):
+        raise CompressedSaveError("Not a compressed save file")
+    if header[-1] > FORMAT_VERSION:
+        raise CompressedSaveError(f"Compressed save version {header[-1]} is newer than this game supports ({FORMAT_VERSION})")
+
+    decompressor = zlib.decompressobj()
+    text = bytearray()
+    try:
+        for block in iter(lambda: file.read(CHUNK_SIZE), b""):
+            text += decompressor.decompress(block)
+        text += decompressor.flush()
+    except zlib.error as e:
+        raise CompressedSaveError(f"Save file is damaged: {e}") from e
+    if not decompressor.eof:
+        raise CompressedSaveError("Save file is damaged: it ends part way through")
+    return json.loads(text)
+
+def encode(save_data, level=COMPRESSION_LEVEL):
+    buffer = io.BytesIO()
+    write(buffer, save_data, level)
+    return buffer.getvalue()
+
+def decode(data):
+    return read(io.BytesIO(data))
@@ -1,10 +1,11 @@
 import json
 import os
 
-def create_save_files():
+def create_save_files(write=True):
+    """Write a test save for each level setup, returns the save data, write=False only builds it"""
     # Create saves directory if it doesn't exist
     SAVE_DIRECTORY = "saves"
-    if not os.path.exists(SAVE_DIRECTORY):
+    if write and not os.path.exists(SAVE_DIRECTORY):
         os.makedirs(SAVE_DIRECTORY)
 
     level_setups = [
@@ -715,6 +716,7 @@ def create_save_files():
 }
     ]
 
+    saves = []
     for setup in level_setups:
         level = setup["level"]
         base_hp = 100 + (level * 50)
@@ -790,11 +792,127 @@ def create_save_files():
             "current_location": "Village"
         }
 
+        saves.append(save)
+        if not write:
+            continue
+
         filename = f"level_{level}_save.json"
         filepath = os.path.join(SAVE_DIRECTORY, filename)
         with open(filepath, 'w') as f:
             json.dump(save, f, indent=2)
         print(f"Created save file for level {level}")
+    return saves
+
+# Benchmark corpora are written here rather than the real saves folder
+CORPUS_DIRECTORY = "save_corpus"
+CORPUS_FORMATS = {"json": ".json", "binary": ".sav", "compressed": ".savz", "sqlite": ".json"}
+
+def synthetic_save(template, index, inventory_size, kill_types, rng):
+    """A late game save built on a level setup with a huge inventory and kill trackers"""
+    from items import item_definitions
+    definitions = list(item_definitions().values())
+    save = json.loads(json.dumps(template))
+    player = save["player"]
+    player["name"] = f"Corpus{index}"
+    player["days"] = rng.randint(50, 5000)
+    player["gold"] = rng.randint(0, 10 ** 6)
+
+    inventory = []
+    for _ in range(inventory_size):
+        definition = rng.choice(definitions)
+        inventory.append({"id": definition.name, "stack_size": rng.randint(1, definition.max_stack)})
+    player["inventory"] = inventory
+
+    enemies = [f"Enemy {number}" for number in range(kill_types)]
+    variants = ["Frenzied", "Ancient", "Corrupted", "Elemental", "Vampiric"]
+    player["kill_tracker"] = {enemy: rng.randint(1, 5000) for enemy in enemies}
+    player["used_kill_tracker"] = {enemy: count // 2 for enemy, count in player["kill_tracker"].items()}
+    player["variant_kill_tracker"] = {f"{variant} {enemy}": rng.randint(1, 200) for enemy in enemies[:kill_types // 4] for variant in variants}
+    player["boss_kill_tracker"] = {enemy: rng.randint(1, 20) for enemy in enemies[:kill_types // 20]}
+    return save
+
+def _peak_rss_kb():
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _benchmark_format(save_format, count, inventory_size, kill_types, seed):
+    """Save then load a whole corpus in one format, run in its own process so peak RSS is per format"""
+    import random
+    import time
+    from save_storage import FileSaveStore, SQLiteSaveStore
+    from save_system import load_save_data
+
+    rng = random.Random(seed)
+    template = create_save_files(write=False)[-1]
+    corpus = [synthetic_save(template, index, inventory_size, kill_types, rng) for index in range(count)]
+    directory = os.path.join(CORPUS_DIRECTORY, save_format)
+    if save_format == "sqlite":
+        store = SQLiteSaveStore(os.path.join(directory, "corpus.db"))
+    else:
+        store = FileSaveStore(directory)
+    filenames = [f"corpus_{index}{CORPUS_FORMATS[save_format]}" for index in range(count)]
+
+    start = time.perf_counter()
+    for filename, save in zip(filenames, corpus):
+        store.write(filename, save)
+    save_time = time.perf_counter() - start
+    if save_format == "sqlite":
+        store.checkpoint()
+        size = sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory) if f.startswith("corpus.db"))
+    else:
+        size = sum(os.path.getsize(os.path.join(directory, filename)) for filename in filenames)
+
+    start = time.perf_counter()
+    for filename in filenames:
+        store.read(filename)
+    read_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for filename in filenames:
+        load_save_data(store.read(filename))
+    load_time = time.perf_counter() - start
+
+    for filename in filenames:
+        store.delete(filename)
+    return {
+        "format": save_format,
+        "bytes": size,
+        "save_ms": save_time / count * 1000,
+        "read_ms": read_time / count * 1000,
+        "load_ms": load_time / count * 1000,
+        "peak_rss_kb": _peak_rss_kb()
+    }
+
+def benchmark_save_corpus(count=50, inventory_size=5000, kill_types=2000, seed=0):
+    """Report bytes on disk, peak RSS and per save latency for every save format"""
+    from concurrent.futures import ProcessPoolExecutor
+    results = []
+    for save_format in CORPUS_FORMATS:
+        # A fresh process per format, so one format's peak memory doesn't hide the next one's
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(executor.submit(_benchmark_format, save_format, count, inventory_size, kill_types, seed).result())
+
+    print(f"{count} saves, {inventory_size} items and {kill_types} enemy types each")
+    print(f"{'Format':<12}{'Bytes':>14}{'Save ms':>10}{'Read ms':>10}{'Load ms':>10}{'Peak RSS KB':>14}")
+    for result in results:
+        peak = result["peak_rss_kb"] if result["peak_rss_kb"] is not None else "n/a"
+        print(f"{result['format']:<12}{result['bytes']:>14,}{result['save_ms']:>10.2f}"
+              f"{result['read_ms']:>10.2f}{result['load_ms']:>10.2f}{peak:>14}")
+    return results
 
 if __name__ == "__main__":
-    create_save_files()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Create the level test saves, or benchmark the save formats on a synthetic corpus")
+    parser.add_argument("--corpus", type=int, help="Benchmark this many synthetic saves instead of creating the test saves")
+    parser.add_argument("--items", type=int, default=5000, help="Inventory entries per corpus save")
+    parser.add_argument("--kill-types", type=int, default=2000, help="Enemy types in each corpus save's kill trackers")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.corpus:
+        benchmark_save_corpus(args.corpus, args.items, args.kill_types, args.seed)
+    else:
+        create_save_files()
\ No newline at end of file
@@ -0,0 +1,132 @@
+# damage_model.py
+"""Exact damage distributions for Character.calculate_damage.
+
+Rather than sampling fights, every outcome of the hit, block, damage roll and
+crit checks is enumerated with NumPy so the probability of each damage value is
+known exactly. All attack types for an attacker are evaluated in one batch.
+"""
+import math
+import numpy as np
+
+class DamageDistribution:
+    """Probability of every total damage value for a single attack"""
+    def __init__(self, attack_type, name, pmf, hit_pmf, hit_chance, block_chance, crit_chance, hits):
+        self.attack_type = attack_type
+        self.name = name
+        self.pmf = pmf  # pmf[d] is the chance the whole attack deals exactly d damage
+        self.hit_pmf = hit_pmf  # Damage of one hit that connects, ignoring misses and blocks
+        self.hit_chance = hit_chance
+        self.block_chance = block_chance
+        self.crit_chance = crit_chance
+        self.hits = hits
+
+    @property
+    def expected(self):
+        return float(np.dot(np.arange(len(self.pmf)), self.pmf))
+
+    @property
+    def hit_range(self):
+        """Lowest and highest damage a single connecting hit can do"""
+        possible = np.flatnonzero(self.hit_pmf)
+        return (int(possible[0]), int(possible[-1])) if len(possible) else (0, 0)
+
+    @property
+    def max_damage(self):
+        return int(np.flatnonzero(self.pmf)[-1])
+
+    def chance_to_deal(self, amount):
+        """Chance the attack deals at least this much damage, e.g. the target's hp for a kill"""
+        if amount <= 0:
+            return 1.0
+        return float(self.pmf[amount:].sum())
+
+def _stat_columns(attacker, infos, stat):
+    # Attack-specific buffs are added on top of the attacker's stat just before the roll (see apply_attack_buffs)
+    return np.array([getattr(attacker, stat) + info.get("stat_buffs", {}).get(stat, 0) for info in infos], dtype=float)
+
+def damage_distributions(attacker, defender, attack_types=None):
+    """Damage distribution of each attack the attacker can use against the defender.
+
+    Args:
+        attacker: Player or Enemy making the attack
+        defender: Character being attacked
+        attack_types: Attack type keys to evaluate, defaults to every damaging attack the attacker has
+
+    Returns:
+        Dict of attack type to DamageDistribution, in the order given
+    """
+    from player import Player, PLAYER_ATTACK_TYPES
+    from enemies import ENEMY_ATTACK_TYPES
+
+    table = PLAYER_ATTACK_TYPES if isinstance(attacker, Player) else ENEMY_ATTACK_TYPES
+    if attack_types is None:
+        attack_types = list(PLAYER_ATTACK_TYPES) if isinstance(attacker, Player) else list(attacker.attack_types)
+    # Stances don't deal damage
+    attack_types = [attack_type for attack_type in attack_types if table[attack_type]["damage_modifier"] > 0]
+    if not attack_types:
+        return {}
+    infos = [table[attack_type] for attack_type in attack_types]
+
+    # Soul crystal stat bonuses are looked up with getattr on a dict in calculate_damage, so only the multiplier applies
+    damage_multiplier = attacker.apply_special_effects(attacker, defender).get("damage_multiplier")
+    stunned = bool(defender.stunned)
+
+    # One row per attack type
+    damage_modifier = np.array([info["damage_modifier"] for info in infos], dtype=float)
+    accuracy = _stat_columns(attacker, infos, "accuracy")
+    attack = _stat_columns(attacker, infos, "attack")
+    crit_chance = _stat_columns(attacker, infos, "crit_chance") + (25 if stunned else 0)
+    crit_damage = _stat_columns(attacker, infos, "crit_damage")
+    armour_penetration = _stat_columns(attacker, infos, "armour_penetration")
+
+    # Each check is randint(1, 100) <= chance, so fractional chances (from variant scaling) round down
+    hit_chance = np.floor(np.clip(accuracy - defender.evasion, 5, 95)) / 100
+    block_chance = 0.0 if stunned else math.floor(min(max(defender.block_chance, 0), 100)) / 100
+    crit_chance = np.floor(np.clip(crit_chance, 0, 100)) / 100
+
+    # Every value of the +-10% damage roll, padded to the widest range
+    base_damage = attack * damage_modifier
+    low = np.trunc(base_damage * 0.9).astype(np.int64)
+    high = np.trunc(base_damage * 1.1).astype(np.int64)
+    width = high - low + 1
+    offsets = np.arange(width.max())
+    valid = offsets[None, :] < width[:, None]
+    rolls = low[:, None] + offsets[None, :]
+    roll_chance = np.where(valid, 1 / width[:, None], 0.0)
+
+    effective_defence = np.maximum(0, defender.defence - armour_penetration[:, None])
+    damage = np.maximum(0, rolls - effective_defence)
+
+    def finish(damage):
+        # Same float operations and truncation as calculate_damage so results match exactly
+        if damage_multiplier is not None:
+            damage = np.trunc(damage * damage_multiplier)
+        damage = np.trunc(damage * (1 - (defender.damage_reduction / 100)))
+        return np.maximum(1, damage).astype(np.int64)
+
+    normal_damage = finish(damage)
+    crit_hit_damage = finish(np.trunc(damage * (crit_damage[:, None] / 100)))
+
+    # Scatter both branches into per-attack histograms with a single bincount
+    size = int(max(normal_damage[valid].max(), crit_hit_damage[valid].max())) + 1
+    rows = np.arange(len(infos))[:, None] * size
+    indexes = np.concatenate([(rows + normal_damage)[valid], (rows + crit_hit_damage)[valid]])
+    weights = np.concatenate([(roll_chance * (1 - crit_chance[:, None]))[valid], (roll_chance * crit_chance[:, None])[valid]])
+    hit_pmfs = np.bincount(indexes, weights=weights, minlength=len(infos) * size).reshape(len(infos), size)
+
+    # A single hit either misses or is blocked (0 damage) or connects
+    connect_chance = hit_chance * (1 - block_chance)
+    single_pmfs = hit_pmfs * connect_chance[:, None]
+    single_pmfs[:, 0] += 1 - connect_chance
+
+    distributions = {}
+    for i, (attack_type, info) in enumerate(zip(attack_types, infos)):
+        # Extra attacks are independent rolls, so the total is the convolution of each hit
+        # (a crit shattering a stun part way through a multi-hit attack isn't modelled)
+        hits = 1 + info.get("extra_attacks", 0)
+        pmf = single_pmfs[i]
+        for _ in range(hits - 1):
+            pmf = np.convolve(pmf, single_pmfs[i])
+        distributions[attack_type] = DamageDistribution(attack_type, info["name"], pmf, hit_pmfs[i],
+                                                        float(hit_chance[i]), block_chance, float(crit_chance[i]), hits)
+    return distributions
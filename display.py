@@ -1,7 +1,9 @@
 import pygame
 import sys
 from dataclasses import dataclass
+from collections import OrderedDict
 from items import SoulCrystal
+from animations import AnimationScheduler, BannerAnimation, FloatingText, FlashAnimation
 
 @dataclass
 class DisplayConfig:
@@ -25,10 +27,206 @@ class FontManager:
         'huge': 32,
         'title': 40
     }
-    
+    DEFAULT_FAMILY = "Comic Sans MS"
+    TEXT_CACHE_SIZE = 512  # Max number of rendered text surfaces kept around
+
+    # Fonts are resolved once per (family, point size) and reused everywhere
+    _fonts = {}
+    # LRU of rendered surfaces keyed by (text, size, colour, family)
+    _text_cache = OrderedDict()
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_bytes = 0
+
+    @staticmethod
+    def get_font(size='medium', family=None):
+        family = family or FontManager.DEFAULT_FAMILY
+        point_size = FontManager.SIZES[size] if isinstance(size, str) else size
+        key = (family, point_size)
+        font = FontManager._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(family, point_size)
+            FontManager._fonts[key] = font
+        return font
+
+    @staticmethod
+    def render(text, size='medium', colour='white', family=None):
+        """Return a rendered text surface, reusing a cached one where possible."""
+        key = (text, size, str(colour), family)
+        cache = FontManager._text_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            FontManager._cache_hits += 1
+            return surface
+
+        FontManager._cache_misses += 1
+        surface = FontManager.get_font(size, family).render(text, True, colour)
+        cache[key] = surface
+        FontManager._cache_bytes += FontManager._surface_bytes(surface)
+
+        while len(cache) > FontManager.TEXT_CACHE_SIZE:
+            _, old_surface = cache.popitem(last=False)
+            FontManager._cache_bytes -= FontManager._surface_bytes(old_surface)
+        return surface
+
+    @staticmethod
+    def text_size(text, size='medium', family=None):
+        """Measure text without rendering it."""
+        return FontManager.get_font(size, family).size(text)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def clear_cache():
+        FontManager._text_cache.clear()
+        FontManager._cache_bytes = 0
+
+    @staticmethod
+    def get_cache_stats():
+        """Hit rate and approximate memory use of the text surface cache."""
+        lookups = FontManager._cache_hits + FontManager._cache_misses
+        return {
+            'fonts': len(FontManager._fonts),
+            'entries': len(FontManager._text_cache),
+            'max_entries': FontManager.TEXT_CACHE_SIZE,
+            'hits': FontManager._cache_hits,
+            'misses': FontManager._cache_misses,
+            'hit_rate': FontManager._cache_hits / lookups if lookups else 0.0,
+            'memory_bytes': FontManager._cache_bytes
+        }
+
+LOCATION_IMAGES = {
+    "Village": "assets/area_images/village.jpg",
+    "Forest": "assets/area_images/forest.jpg",
+    "Plains": "assets/area_images/plains.jpg",
+    "Deepwoods": "assets/area_images/deepwoods.jpg",
+    "Cave": "assets/area_images/cave.jpg",
+    "Swamp": "assets/area_images/swamp.jpg",
+    "Temple": "assets/area_images/temple.jpg",
+    "Mountain": "assets/area_images/mountain.jpg",
+    "Desert": "assets/area_images/desert.jpg",
+    "Valley": "assets/area_images/valley.jpg",
+    "Toxic Swamp": "assets/area_images/toxic_swamp.jpg",
+    "Ruins": "assets/area_images/ruins.jpg",
+    "Mountain Peaks": "assets/area_images/mountain_peaks.jpg",
+    "Scorching Plains": "assets/area_images/scorching_plains.jpg",
+    "Shadowed Valley": "assets/area_images/shadowed_valley.jpg",
+    "Death Caves": "assets/area_images/death_caves.jpg",
+    "Ancient Ruins": "assets/area_images/ancient_ruins.jpg",
+    "Death Valley": "assets/area_images/death_valley.jpg",
+    "Dragons Lair": "assets/area_images/dragon_lair.jpg",
+    "Volcanic Valley": "assets/area_images/volcanic_valley.jpg",
+    "Heavens": "assets/area_images/heavens.jpg"
+}
+
+SHOP_IMAGES = {
+    "Alchemist": "assets/area_images/alchemist.jpg",
+    "Blacksmith": "assets/area_images/blacksmith.jpg",
+    "Inn": "assets/area_images/inn.jpg",
+}
+
+TITLE_IMAGE = "assets/start_screen_images/start_screen.jpg"
+WORLD_MAP_IMAGE = "assets/world_map/world_map.jpeg"
+
+class AssetManager:
+    MAX_SCALED_IMAGES = 24  # Scaled surfaces kept before the least recently used is dropped
+
+    # Decoded and converted source images keyed by path
+    _sources = {}
+    # Scaled surfaces keyed by (path, size, alpha), most recently used last
+    _scaled = OrderedDict()
+
+    @staticmethod
+    def _load_source(path):
+        source = AssetManager._sources.get(path)
+        if source is None:
+            image = pygame.image.load(path)
+            # convert() needs a display mode, fall back to the raw surface before one exists
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if path.endswith(".png") else image.convert()
+            AssetManager._sources[path] = image
+            source = image
+        return source
+
+    @staticmethod
+    def get_image(path, size=None, alpha=None):
+        """Return the image at path scaled to size, decoding and scaling it at most once."""
+        key = (path, tuple(size) if size else None, alpha)
+        scaled = AssetManager._scaled
+        surface = scaled.get(key)
+        if surface is not None:
+            scaled.move_to_end(key)
+            return surface
+
+        surface = AssetManager._load_source(path)
+        if size and surface.get_size() != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        elif alpha is not None:
+            surface = surface.copy()
+        if alpha is not None:
+            surface.set_alpha(alpha)
+
+        # A new size for the same image means the layout changed, so the old scale is stale
+        for stale in [k for k in scaled if k[0] == path and k[2] == alpha]:
+            del scaled[stale]
+        scaled[key] = surface
+
+        while len(scaled) > AssetManager.MAX_SCALED_IMAGES:
+            old_key, _ = scaled.popitem(last=False)
+            AssetManager._release_source_if_unused(old_key[0])
+        return surface
+
+    @staticmethod
+    def preload(paths, size=None):
+        """Decode and scale a batch of images up front, e.g. during startup."""
+        for path in paths:
+            try:
+                AssetManager.get_image(path, size)
+            except pygame.error as e:
+                print(f"Could not preload {path}: {e}")
+
+    @staticmethod
+    def _release_source_if_unused(path):
+        if not any(k[0] == path for k in AssetManager._scaled):
+            AssetManager._sources.pop(path, None)
+
     @staticmethod
-    def get_font(size='medium'):
-        return pygame.font.SysFont("Comic Sans MS", FontManager.SIZES[size])
+    def release(*paths):
+        """Drop cached surfaces for images that are no longer needed."""
+        for path in paths:
+            for key in [k for k in AssetManager._scaled if k[0] == path]:
+                del AssetManager._scaled[key]
+            AssetManager._sources.pop(path, None)
+
+    @staticmethod
+    def clear():
+        AssetManager._scaled.clear()
+        AssetManager._sources.clear()
+
+_shared_display = None
+
+def status_signature(entity):
+    """Cheap summary of an entity's status effects, used to spot panel changes."""
+    if not entity or not hasattr(entity, 'status_effects'):
+        return None
+    return tuple((effect.name, effect.remaining_duration, getattr(effect, 'strength', 1), effect.is_active)
+                 for effect in entity.status_effects)
+
+def combat_signature(entity):
+    """The stats that feed into damage rolls, used to spot when damage estimates change."""
+    return (entity.attack, entity.defence, entity.accuracy, entity.evasion, entity.crit_chance,
+            entity.crit_damage, entity.armour_penetration, entity.damage_reduction, entity.block_chance,
+            entity.stunned, tuple(getattr(entity, 'soul_crystal_effects', {})))
+
+def get_display():
+    """Return the game's single Display, creating the window on first use."""
+    global _shared_display
+    if _shared_display is None:
+        _shared_display = Display()
+    return _shared_display
 
 class Display:
     def __init__(self):
@@ -40,10 +238,49 @@ class Display:
         self.scroll_offset = 0
         self.max_scroll_lines = 30
         self.game = None
+        # Retained-mode state, panels are only redrawn when their content key changes
+        self.panel_keys = {}
+        self.dirty_rects = []
+        self.active_screen = None
+        self.screen_valid = False
+        self.full_redraw = True
         pygame.display.set_caption("TEXT RPG ADVENTURE")
 
     def set_game(self, game):
         self.game = game
+
+    def invalidate(self):
+        """Force the next incremental draw to repaint the whole screen."""
+        self.screen_valid = False
+
+    def begin_frame(self, screen_name, incremental=False):
+        """Start a frame, clearing the screen unless the previous frame can be reused."""
+        self.full_redraw = (not incremental or not self.screen_valid
+                            or self.active_screen != screen_name)
+        if self.full_redraw:
+            self.screen.fill('black')
+            self.panel_keys.clear()
+        self.active_screen = screen_name
+        self.dirty_rects = []
+        return self.full_redraw
+
+    def panel_changed(self, panel, rect, key):
+        """Record a panel's content key, returns True if the panel needs redrawing."""
+        if panel in self.panel_keys and self.panel_keys[panel] == key:
+            return False
+        self.panel_keys[panel] = key
+        width, height, x, y = rect
+        self.dirty_rects.append(pygame.Rect(x, y, width, height))
+        return True
+
+    def present(self):
+        """Push the frame to the window, only sending dirty rects when possible."""
+        if self.full_redraw:
+            pygame.display.update()
+        elif self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+        self.dirty_rects = []
+        self.screen_valid = True
     
     def clear_screen(self):
         self.screen.fill('black')
@@ -77,8 +314,7 @@ class Display:
             self.clock.tick(self.config.FPS)
 
     def draw_text(self, text, pos, size='medium', colour='white', center=False):
-        font = FontManager.get_font(size)
-        text_surface = font.render(text, True, colour)
+        text_surface = FontManager.render(text, size, colour)
         if center:
             rect = text_surface.get_rect(center=pos)
             self.screen.blit(text_surface, rect)
@@ -88,9 +324,7 @@ class Display:
     def display_title(self):
         self.clear_screen()
         
-        start_screen_image = pygame.image.load("assets/start_screen_images/start_screen.jpg")
-        start_screen_image = pygame.transform.scale(start_screen_image, (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        start_screen_image.set_alpha(128)
+        start_screen_image = AssetManager.get_image(TITLE_IMAGE, (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT), alpha=128)
         self.screen.blit(start_screen_image, (0, 0))
         
         title_pos = (self.config.SCREEN_WIDTH // 2, 100)
@@ -103,14 +337,20 @@ class Display:
             self.draw_text(option, pos, 'large', center=True)
         
         pygame.display.flip()
-        return self.wait_for_input()
+        choice = self.wait_for_input()
+        # The title art is only shown here, no need to hold on to it
+        AssetManager.release(TITLE_IMAGE)
+        return choice
     
     def display_load_game(self):
-        from save_system import get_save_files
         """Display visual load game menu screen with scrolling"""
+        from save_system import get_save_files, save_summaries, save_summary
+        from save_index import describe
         save_files = get_save_files()
         if not save_files:
             return self.display_no_saves()
+        # Checks the summaries are up to date, any that aren't are read in the background
+        save_summaries(save_files)
         
         scroll_offset = 0
         saves_per_page = 20
@@ -147,7 +387,7 @@ class Display:
             for i in range(start_idx, end_idx):
                 pos = (self.config.SCREEN_WIDTH // 2, 
                     200 + (i - start_idx) * (self.config.MENU_SPACING * 2))
-                self.draw_text(f"{i+1}. {save_files[i]}", pos, 'large', center=True)
+                self.draw_text(f"{i+1}. {describe(save_files[i], save_summary(save_files[i]))}", pos, 'large', center=True)
             
             # Draw navigation instructions
             if len(save_files) > saves_per_page:
@@ -502,9 +742,7 @@ class Display:
         }
     
     def calculate_text_dimensions(self, text, font_size='medium'):
-        font = FontManager.get_font(font_size)
-        text_surface = font.render(text, True, 'white')
-        return text_surface.get_width(), text_surface.get_height()
+        return FontManager.text_size(text, font_size)
     
     def draw_panel(self, width, height, x, y, content_list=None, font_size='medium', font_colour='white'):
         pygame.draw.rect(self.screen, 'gray20', (x, y, width, height))
@@ -518,24 +756,32 @@ class Display:
                 self.draw_text(content, (x + self.config.PADDING, current_y), font_size, font_colour)
                 current_y += self.calculate_text_dimensions(content, font_size)[1] + 5
     
-    def draw_game_screen(self, player, current_location, enemy=None):
-        self.screen.fill('black')
+    def draw_game_screen(self, player, current_location, enemy=None, incremental=False):
+        """Draw the overworld, with incremental=True only changed panels are redrawn"""
+        self.begin_frame('game', incremental)
         layout = self.calculate_layout()
         # Draw player info panel (left side)
-        self.draw_player_panel(player, *layout['player_panel'], current_location)
+        if self.panel_changed('player_panel', layout['player_panel'], self.player_panel_content(player, current_location)):
+            self.draw_player_panel(player, *layout['player_panel'], current_location)
         # Draw main game area (centre)
-        self.draw_main_area(*layout['main_panel'], current_location)
+        if self.panel_changed('main_panel', layout['main_panel'], current_location):
+            self.draw_main_area(*layout['main_panel'], current_location)
         # Draw battle log (bottom)
         self.draw_panels(player, enemy)
         # Draw command menu (right side)
-        self.draw_command_menu(*layout['command_panel'], current_location)
+        if self.panel_changed('command_panel', layout['command_panel'], current_location == "Village"):
+            self.draw_command_menu(*layout['command_panel'], current_location)
         
-        pygame.display.update()
+        self.present()
         self.clock.tick(self.config.FPS)
         
     def draw_player_panel(self, player, width, height, x, y, location):    
+        stats = self.player_panel_content(player, location)
+        self.draw_panel(width, height, x, y, stats, font_colour='yellow')
+
+    def player_panel_content(self, player, location):
         # Player stats
-        stats = [
+        return [
             f"Name: {player.name}",
             f"Location: {location}",
             f"Level: {player.level}",
@@ -553,8 +799,6 @@ class Display:
             f"Block Chance: {player.block_chance}",
             f"Damage Reduction: {player.damage_reduction}"
         ]
-        
-        self.draw_panel(width, height, x, y, stats, font_colour='yellow')
             
     def draw_location_panel(self, location, width, height, x, y):
         content = [f"Location: {location}"]
@@ -564,41 +808,14 @@ class Display:
         # Background
         self.draw_panel(width, height, x, y)
         
-        # Map location to image path
-        location_images = {
-            "Village": "assets/area_images/village.jpg",
-            "Forest": "assets/area_images/forest.jpg",
-            "Plains": "assets/area_images/plains.jpg",
-            "Deepwoods": "assets/area_images/deepwoods.jpg",
-            "Cave": "assets/area_images/cave.jpg",
-            "Swamp": "assets/area_images/swamp.jpg",
-            "Temple": "assets/area_images/temple.jpg",
-            "Mountain": "assets/area_images/mountain.jpg",
-            "Desert": "assets/area_images/desert.jpg",
-            "Valley": "assets/area_images/valley.jpg",
-            "Toxic Swamp": "assets/area_images/toxic_swamp.jpg",
-            "Ruins": "assets/area_images/ruins.jpg",
-            "Mountain Peaks": "assets/area_images/mountain_peaks.jpg",
-            "Scorching Plains": "assets/area_images/scorching_plains.jpg",
-            "Shadowed Valley": "assets/area_images/shadowed_valley.jpg",
-            "Death Caves": "assets/area_images/death_caves.jpg",
-            "Ancient Ruins": "assets/area_images/ancient_ruins.jpg",
-            "Death Valley": "assets/area_images/death_valley.jpg",
-            "Dragons Lair": "assets/area_images/dragon_lair.jpg",
-            "Volcanic Valley": "assets/area_images/volcanic_valley.jpg",
-            "Heavens": "assets/area_images/heavens.jpg"
-        }
-        
-        if current_location in location_images:
+        if current_location in LOCATION_IMAGES:
             try:
-                # Load and scale image to fit the main area
-                image = pygame.image.load(location_images[current_location])
-                scaled_image = pygame.transform.scale(image, (width - 4, height - 4))
+                # Cached image already scaled to fit the main area
+                scaled_image = AssetManager.get_image(LOCATION_IMAGES[current_location], (width - 4, height - 4))
                 self.screen.blit(scaled_image, (x + 2, y + 2))
             except pygame.error:
                 # Fallback text if image loading fails
-                font = FontManager.get_font('large')
-                text = font.render(f"Current Location: {current_location}", True, 'white')
+                text = FontManager.render(f"Current Location: {current_location}", 'large', 'white')
                 text_rect = text.get_rect(center=(x + width // 2, y + height // 2))
                 self.screen.blit(text, text_rect)
     
@@ -756,10 +973,24 @@ class Display:
     
     def draw_panels(self, player, enemy=None, scroll_offset=0):
         layout = self.calculate_layout()
-        self.draw_player_status_panel(*layout['player_status_panel'], player)
-        self.draw_battle_log_panel(*layout['battle_log_panel'], scroll_offset)
-        self.draw_enemy_status_panel(*layout['enemy_status_panel'], enemy)
-        self.draw_player_weapon_buff_panel(*layout['player_weapon_buffs_panel'], player)
+        player_status_key = (status_signature(player),
+                             repr(getattr(player, 'active_buffs', None)),
+                             repr(getattr(player, 'combat_buff_modifiers', None)),
+                             repr(getattr(player, 'active_hots', None)),
+                             repr(getattr(player, 'debuff_modifiers', None)),
+                             repr(getattr(player, 'active_debuffs', None)))
+        if self.panel_changed('player_status_panel', layout['player_status_panel'], player_status_key):
+            self.draw_player_status_panel(*layout['player_status_panel'], player)
+        if self.panel_changed('battle_log_panel', layout['battle_log_panel'], (tuple(self.text_buffer), scroll_offset)):
+            self.draw_battle_log_panel(*layout['battle_log_panel'], scroll_offset)
+        enemy_status_key = (status_signature(enemy), repr(getattr(enemy, 'debuff_modifiers', None)))
+        if self.panel_changed('enemy_status_panel', layout['enemy_status_panel'], enemy_status_key):
+            self.draw_enemy_status_panel(*layout['enemy_status_panel'], enemy)
+        weapon_buff_key = (repr(getattr(player, 'weapon_buff', None)),
+                           repr(getattr(player, 'weapon_buff_modifiers', None)),
+                           repr(getattr(player, 'weapon_coating', None)))
+        if self.panel_changed('player_weapon_buffs_panel', layout['player_weapon_buffs_panel'], weapon_buff_key):
+            self.draw_player_weapon_buff_panel(*layout['player_weapon_buffs_panel'], player)
     
     def draw_command_menu(self, width, height, x, y, location):
         # Command menu
@@ -902,18 +1133,12 @@ class ShopDisplay:
         self.player = player
         
     def draw_shop_interface(self, shop, player):
-        location_images = {
-            "Alchemist": "assets/area_images/alchemist.jpg",
-            "Blacksmith": "assets/area_images/blacksmith.jpg",
-            "Inn": "assets/area_images/inn.jpg",
-        }
-        
         self.player = player
         self.display.screen.fill('black')
         
-        if shop.__class__.__name__ in location_images:
-            location_image = pygame.image.load(location_images[shop.__class__.__name__])
-            location_image = pygame.transform.scale(location_image, (self.display.config.SCREEN_WIDTH, self.display.config.SCREEN_HEIGHT))
+        if shop.__class__.__name__ in SHOP_IMAGES:
+            location_image = AssetManager.get_image(SHOP_IMAGES[shop.__class__.__name__],
+                                                    (self.display.config.SCREEN_WIDTH, self.display.config.SCREEN_HEIGHT))
             self.display.screen.blit(location_image, (0, 0))
         
         # Draw shop header
@@ -992,9 +1217,7 @@ class ShopDisplay:
                 elif event.key == pygame.K_RIGHT:
                     if self.selected_item:
                         if self.mode == "sell":
-                            matching_items = [i for i in player.inventory 
-                                        if i.name == self.selected_item.name and i.type == self.selected_item.type]
-                            max_available = sum(i.stack_size if hasattr(i, 'stack_size') else 1 for i in matching_items)
+                            max_available = player.inventory.quantity(self.selected_item.name)
                             self.quantity = min(self.quantity + 1, max_available)
                         else:
                             inventory_item = self.selected_item
@@ -1011,9 +1234,7 @@ class ShopDisplay:
                         if self.mode == "buy":
                             self.execute_purchase(shop, player)
                         else:
-                            matching_items = [i for i in player.inventory 
-                                        if i.name == self.selected_item.name and i.type == self.selected_item.type]
-                            available_quantity = sum(i.stack_size if hasattr(i, 'stack_size') else 1 for i in matching_items)
+                            available_quantity = player.inventory.quantity(self.selected_item.name)
                             
                             if self.quantity <= available_quantity:
                                 self.execute_sale(shop, player)
@@ -1039,11 +1260,7 @@ class ShopDisplay:
                 if item.type == "soul_crystal":
                     quantity = 1
                 else:
-                    matching_items = [
-                        i for i in self.player.inventory 
-                        if i.name == item.name and i.type == item.type
-                    ]
-                    quantity = sum(i.stack_size if hasattr(i, 'stack_size') else 1 for i in matching_items)
+                    quantity = self.player.inventory.quantity(item.name)
             
             item_y = shop_y + (i * self.config.ITEM_HEIGHT)
             highlighted = self.selected_item == item
@@ -1177,32 +1394,12 @@ class ShopDisplay:
         if player.gold >= total_cost:
             if shop.inventory[self.selected_item.name]['quantity'] >= self.quantity:
                 player.gold -= total_cost
-                new_item = type(self.selected_item)(
-                    self.selected_item.name, self.selected_item.type, self.selected_item.value, self.selected_item.tier,
-                    attack=self.selected_item.attack,
-                    defence=self.selected_item.defence,
-                    accuracy=self.selected_item.accuracy,
-                    crit_chance=getattr(self.selected_item, 'crit_chance', 0),
-                    crit_damage=getattr(self.selected_item, 'crit_damage', 0),
-                    armour_penetration=getattr(self.selected_item, 'armour_penetration', 0),
-                    damage_reduction=getattr(self.selected_item, 'damage_reduction', 0),
-                    evasion=getattr(self.selected_item, 'evasion', 0),
-                    block_chance=getattr(self.selected_item, 'block_chance', 0),
-                    effect_type=self.selected_item.effect_type,
-                    effect=self.selected_item.effect,
-                    cooldown=self.selected_item.cooldown,
-                    duration=self.selected_item.duration,
-                    tick_effect=self.selected_item.tick_effect,
-                    weapon_type=self.selected_item.weapon_type,
-                    stamina_restore=self.selected_item.stamina_restore
-                )
-                
-                if new_item.is_stackable():
-                    new_item.stack_size = self.quantity
-                    player.add_item(new_item)
+                if self.selected_item.is_stackable():
+                    # One new stack with the bought quantity
+                    player.add_item(self.selected_item.copy(self.quantity))
                 else:
                     for _ in range(self.quantity):
-                        player.add_item(new_item)
+                        player.add_item(self.selected_item.copy())
                         
                 shop.remove_item(self.selected_item.name, self.quantity)
                 self.selected_item = None
@@ -1217,7 +1414,7 @@ class ShopDisplay:
         
         if hasattr(self.selected_item, 'stack_size'):
             remaining = self.quantity
-            inventory_items = [i for i in player.inventory if i.name == self.selected_item.name]
+            inventory_items = player.inventory.stacks(self.selected_item.name)
             for item in inventory_items:
                 if remaining <= 0:
                     break
@@ -1258,7 +1455,7 @@ class VisualInput:
         
         # Draw text with cursor
         display_text = self.text + ('|' if self.cursor_visible and self.active else '')
-        text_surface = FontManager.get_font('large').render(display_text, True, 'white')
+        text_surface = FontManager.render(display_text, 'large', 'white')
         text_rect = text_surface.get_rect(center=(x + self.width // 2, y + self.height // 2))
         self.display.screen.blit(text_surface, text_rect)
 
@@ -1279,7 +1476,7 @@ class MapDisplay:
     def __init__(self, screen, config):
         self.screen = screen
         self.config = config
-        self.display = Display()
+        self.display = get_display()
         
         layout = self.display.calculate_layout()
         self.map_area = layout['main_panel']
@@ -1290,8 +1487,7 @@ class MapDisplay:
         
         # Try to load and scale background image
         try:
-            self.background = pygame.image.load('assets/world_map/world_map.jpeg').convert()
-            self.background = pygame.transform.scale(self.background, (self.width, self.height))
+            self.background = AssetManager.get_image(WORLD_MAP_IMAGE, (self.width, self.height))
         except:
             self.background = None
             print("Could not load map background image")
@@ -1387,8 +1583,7 @@ class MapDisplay:
         pygame.draw.rect(self.screen, colour, (x, y, rect_width, rect_height))
         pygame.draw.rect(self.screen, 'white', (x, y, rect_width, rect_height), 1)
         
-        font = pygame.font.SysFont("Arial", 12)
-        text = font.render(name, True, 'black')
+        text = FontManager.render(name, 12, 'black', "Arial")
         text_rect = text.get_rect(center=(pos[0], pos[1]))
         self.screen.blit(text, text_rect)
 
@@ -1402,8 +1597,7 @@ class MapDisplay:
         y = self.y_offset + self.display.config.PADDING * 2
         for text, colour in legend_items:
             pygame.draw.rect(self.screen, colour, (self.x_offset + 80, y, 15, 15))
-            font = pygame.font.SysFont("Arial", 14)
-            text_surface = font.render(text, True, 'white')
+            text_surface = FontManager.render(text, 14, 'white', "Arial")
             self.screen.blit(text_surface, (self.x_offset + 100, y))
             y += 25
             
@@ -2203,8 +2397,9 @@ class SaveMenuDisplay:
         self.visual_input = VisualInput(display)
     
     def show_save_menu(self):
-        from save_system import get_save_files
+        from save_system import get_save_files, save_summaries
         save_files = get_save_files()
+        save_summaries(save_files)
         scroll_offset = 0
         saves_per_page = 8
         
@@ -2237,8 +2432,10 @@ class SaveMenuDisplay:
         # Draw existing saves
         current_y = 150
         visible_saves = save_files[scroll_offset:scroll_offset + saves_per_page]
+        from save_system import save_summary
+        from save_index import describe
         for i, save in enumerate(visible_saves):
-            self.display.draw_text(f"Save {i + 1}: {save}",
+            self.display.draw_text(f"Save {i + 1}: {describe(save, save_summary(save))}",
                                 (self.config.SCREEN_WIDTH // 2, current_y),
                                 'large', center=True)
             current_y += 40
@@ -2303,7 +2500,8 @@ class SaveMenuDisplay:
                 
                 if self.visual_input.handle_event(event):
                     if self.visual_input.text.strip():
-                        return f"{self.visual_input.text}.json"
+                        from save_system import save_filename
+                        return save_filename(self.visual_input.text)
             
             self.display.clock.tick(self.display.config.FPS)
             
@@ -2346,58 +2544,76 @@ class BattleDisplay:
         self.config = display.config
         self.layout = display.calculate_layout()
         self.last_enemy = None
+        self.animations = AnimationScheduler()
+        self._damage_estimates = (None, None)
+    
+    HIT_INTERVAL = 150  # Gap between damage numbers of multi-hit attacks (ms)
     
     STATUS_ICONS = {
-        "Burn": pygame.image.load("assets/status_icons/flame.png"),
-        "Poison": pygame.image.load("assets/status_icons/poison.png"),
-        "Freeze": pygame.image.load("assets/status_icons/freeze.png"),
-        "Stun": pygame.image.load("assets/status_icons/stun.png"),
-        "Confusion": pygame.image.load("assets/status_icons/confusion.png"),
-        "Attack Weaken": pygame.image.load("assets/status_icons/attack_weaken.png"),
-        "Defence Break": pygame.image.load("assets/status_icons/defence_break.png"),
-        "Damage Reflect": pygame.image.load("assets/status_icons/damage_reflect.png"),
-        "Defensive Stance": pygame.image.load("assets/status_icons/defensive_stance.png"),
-        "Power Stance": pygame.image.load("assets/status_icons/power_stance.png"),
-        "Accuracy Stance": pygame.image.load("assets/status_icons/accuracy_stance.png"),
-        "Berserker Stance": pygame.image.load("assets/status_icons/berserker_stance.png"),
-        "Evasion Stance": pygame.image.load("assets/status_icons/evasion_stance.png")
+        "Burn": "assets/status_icons/flame.png",
+        "Poison": "assets/status_icons/poison.png",
+        "Freeze": "assets/status_icons/freeze.png",
+        "Stun": "assets/status_icons/stun.png",
+        "Confusion": "assets/status_icons/confusion.png",
+        "Attack Weaken": "assets/status_icons/attack_weaken.png",
+        "Defence Break": "assets/status_icons/defence_break.png",
+        "Damage Reflect": "assets/status_icons/damage_reflect.png",
+        "Defensive Stance": "assets/status_icons/defensive_stance.png",
+        "Power Stance": "assets/status_icons/power_stance.png",
+        "Accuracy Stance": "assets/status_icons/accuracy_stance.png",
+        "Berserker Stance": "assets/status_icons/berserker_stance.png",
+        "Evasion Stance": "assets/status_icons/evasion_stance.png"
     }
         
-    def draw_battle_screen(self, player, current_location=None, enemy=None, scroll_offset=0):
-        """Draw the battle screen layout"""
+    def draw_battle_screen(self, player, current_location=None, enemy=None, scroll_offset=0, incremental=False, present=True):
+        """Draw the battle screen layout, with incremental=True only changed panels are redrawn"""
         if enemy is not None:
             self.last_enemy = enemy
             
         enemy_to_draw = enemy or self.last_enemy
         
-        self.screen.fill('black')
+        self.display.begin_frame('battle', incremental)
         
         # Get player location
         #current_location = self.game.current_location if hasattr(self, 'game') else None
         
         # Draw Player Panel (left side)
-        self.display.draw_player_panel(player, *self.layout['player_panel'], current_location)
+        if self.display.panel_changed('player_panel', self.layout['player_panel'],
+                                      self.display.player_panel_content(player, current_location)):
+            self.display.draw_player_panel(player, *self.layout['player_panel'], current_location)
         
-        #  Draw main combat area
-        self.draw_combat_area(*self.layout['battle_panel'])
+        # Status bars and hit chances sit on top of the combat area, so they are redrawn together
+        if self.display.panel_changed('battle_panel', self.layout['battle_panel'], self.combat_area_key(player, enemy_to_draw)):
+            #  Draw main combat area
+            self.draw_combat_area(*self.layout['battle_panel'])
+            
+            # Player status bars
+            self.draw_status_bars(*self.layout['player_status_bars_panel'], player, True)
+            
+            # Enemy status bars
+            self.draw_status_bars(*self.layout['enemy_status_bars_panel'], enemy_to_draw, False)
+            
+            # Draw chance to hit
+            self.draw_chance_to_hit(self.layout['player_status_bars_panel'][2], self.layout['player_status_bars_panel'][3], player, enemy_to_draw)
         
         # Draw Enemy Panel (right side)
-        self.draw_enemy_panel(enemy_to_draw, *self.layout['enemy_panel'])
+        if self.display.panel_changed('enemy_panel', self.layout['enemy_panel'], self.enemy_panel_content(enemy_to_draw)):
+            self.draw_enemy_panel(enemy_to_draw, *self.layout['enemy_panel'])
         
         # Draw status panels (bottom)
         self.display.draw_panels(player, enemy_to_draw, scroll_offset)
         
-        # Player status bars
-        self.draw_status_bars(*self.layout['player_status_bars_panel'], player, True)
-        
-        # Enemy status bars
-        self.draw_status_bars(*self.layout['enemy_status_bars_panel'], enemy_to_draw, False)
-        
-        # Draw chance to hit
-        self.draw_chance_to_hit(self.layout['player_status_bars_panel'][2], self.layout['player_status_bars_panel'][3], player, enemy_to_draw)
-        
-        pygame.display.flip()
-        self.display.clock.tick(self.config.FPS)
+        if present:
+            self.display.present()
+            self.display.clock.tick(self.config.FPS)
+
+    def combat_area_key(self, player, enemy):
+        """Everything drawn in the combat area, including in-progress bar animations"""
+        fills = tuple(sorted(self.current_fills.items())) if hasattr(self, 'current_fills') else None
+        return (player.hp, player.max_hp, player.stamina, player.max_stamina,
+                combat_signature(player), player.name,
+                enemy.hp, enemy.max_hp, combat_signature(enemy), enemy.name,
+                status_signature(player), status_signature(enemy), fills)
         
     def draw_combat_area(self, width, height, x, y):
         """Draw the main combat area with enemy visualisation"""
@@ -2413,30 +2629,36 @@ class BattleDisplay:
     def draw_enemy_panel(self, enemy, width, height, x, y, during_animation=False):
         """Draw enemy stats panel"""
         if enemy:
-            content = []
-            # Add enemy level
-            content.append(f"Lvl: {enemy.level}")
-            # If its a variant add it here
-            if hasattr(enemy, 'variant') and enemy.variant:
-                content.append(f"Variant: {enemy.variant['name']}")
-            # Add enemy name
-            content.append(f"{enemy.template['name']}")
-            # Add all remaining stats
-            content.extend([
-                f"HP: {enemy.hp}/{enemy.max_hp}",
-                "",
-                f"Att: {enemy.attack}",
-                f"Acc: {enemy.accuracy}",
-                f"Def: {enemy.defence}",
-                f"Eva: {enemy.evasion}",
-                f"Crit: {enemy.crit_chance}%",
-                f"Crit Dmg: {enemy.crit_damage}%",
-                f"AP: {enemy.armour_penetration}",
-                f"DR: {enemy.damage_reduction}",
-                f"BC: {enemy.block_chance}%"
-            ])
-            
+            content = self.enemy_panel_content(enemy)
             self.display.draw_panel(width, height, x, y, content, font_colour='red')
+
+    def enemy_panel_content(self, enemy):
+        """Build the enemy stats panel lines"""
+        if not enemy:
+            return None
+        content = []
+        # Add enemy level
+        content.append(f"Lvl: {enemy.level}")
+        # If its a variant add it here
+        if hasattr(enemy, 'variant') and enemy.variant:
+            content.append(f"Variant: {enemy.variant['name']}")
+        # Add enemy name
+        content.append(f"{enemy.template['name']}")
+        # Add all remaining stats
+        content.extend([
+            f"HP: {enemy.hp}/{enemy.max_hp}",
+            "",
+            f"Att: {enemy.attack}",
+            f"Acc: {enemy.accuracy}",
+            f"Def: {enemy.defence}",
+            f"Eva: {enemy.evasion}",
+            f"Crit: {enemy.crit_chance}%",
+            f"Crit Dmg: {enemy.crit_damage}%",
+            f"AP: {enemy.armour_penetration}",
+            f"DR: {enemy.damage_reduction}",
+            f"BC: {enemy.block_chance}%"
+        ])
+        return content
                 
     def draw_battle_message(self, text):
         self.display.add_message(text)
@@ -2445,50 +2667,18 @@ class BattleDisplay:
         pygame.display.flip()
         
     def display_attack_animation(self, attacker_name, attack_name, is_player=True, duration=2000):
-        """Display Visual attack animation"""
-        self.wait_for_animation()
-        
-        # Draw attack announcement
-        layout = self.layout['attack_animation_panel']
-        width, height, x, y = layout
-        
-        # Store original surface
-        original_surface = self.display.screen.copy()
-        
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((width, height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)  # Partial transparency
-        
-        # Draw animation
-        self.display.screen.blit(overlay, (x, y))
-        self.display.draw_panel(width, height, x, y)
-        
-        # Draw background
-        pygame.draw.rect(self.display.screen, 'blue', (x, y, width, height))
-        pygame.draw.rect(self.display.screen, 'white', (x, y, width, height), 2)
-        
+        """Queue the attack announcement on the animation timeline"""
         # Draw attack name centered, using enemy template name instead of full name if not player
         display_name = attacker_name if is_player else attacker_name.split()[-1]
-        self.display.draw_text(f"{display_name} used {attack_name}",
-                               (x + width // 2, y + height // 2),
-                               'large', 'green' if is_player else 'red', center=True)
-        
-        pygame.display.flip()
-        pygame.time.wait(duration)
-        
-        # Restore original screen
-        self.display.screen.blit(original_surface, (0, 0))
-        pygame.display.flip()
+        self.animations.add(BannerAnimation(self.layout['attack_animation_panel'],
+                                            f"{display_name} used {attack_name}",
+                                            'green' if is_player else 'red', duration))
         
     def display_damage_numbers(self, target, damage, hit_type="normal", is_player=True, is_self_damage=False):
-        """Display floating damage numbers"""
+        """Queue a floating damage number, hits of the same attack overlap slightly"""
         layout = self.layout['battle_panel']
         width, height, x, y = layout
         
-        # Store original surface
-        original_surface = self.display.screen.copy()
-        
         # Set x position based on attacker
         if is_self_damage:
             x_pos = x + (width * 0.1) if is_player else x + (width * 0.9)
@@ -2505,30 +2695,18 @@ class BattleDisplay:
             "self_damage": 'crimson'
         }.get(hit_type, 'white')
         
-        # Wait for health bar animation to complete if it's a fatal hit
-        if target and target.hp <= 0:
-            health_bar_id = f"HP_{self.layout['player_status_bars_panel'][2]}_{self.layout['player_status_bars_panel'][3]}" if is_player else f"HP_{self.layout['enemy_status_bars_panel'][2]}_{self.layout['enemy_status_bars_panel'][3]}"
-            while not self.animation_complete.get(health_bar_id, True):
-                self.draw_battle_screen(self.display.game.player, self.display.game.current_location, target)
-                pygame.time.wait(16)  # Roughly 60 FPS
+        self.animations.add(FloatingText(f"-{damage}", (x_pos, y + height * 0.3), colour), blocking=False)
+        self.animations.wait(self.HIT_INTERVAL)
         
-        # Animate number floating up
-        for offset in range(0, 100, 2):
-            # Restore original screen
-            self.display.screen.blit(original_surface, (0, 0))
-            
-            # Draw damage number
-            self.display.draw_text(f"-{damage}", (x_pos, y + height * 0.3 - offset), 'title', colour, center=True)
-            pygame.display.flip()
-            pygame.time.wait(10)
-        
-        # Restore original screen
-        self.display.screen.blit(original_surface, (0, 0))
-        pygame.display.flip()
+    def display_self_damage_flash(self, attacker_name, self_damage, attack_name):
+        """Queue the red recoil flash for self damaging attacks"""
+        width, height, x, y = self.layout['battle_panel']
+        self.animations.add(FlashAnimation(self.layout['battle_panel'], (255, 0, 0),
+                                           f"{attacker_name} takes {self_damage} damage as recoil from their {attack_name} attack!",
+                                           (x + width // 2, y + height // 5)))
         
     def display_status_effects(self, target, effect_name):
-        """Display status effect application with flashing animatio"""
-        self.wait_for_animation()
+        """Display status effect application with flashing animation"""
         
         layout = self.layout['battle_panel']
         width, height, x, y = layout
@@ -2553,43 +2731,25 @@ class BattleDisplay:
         
         colour = effect_colours.get(effect_name, (255, 255, 255))
         
-        # Store original surface
-        original_surface = self.display.screen.copy()
-        
-        # Create flash overlay
-        flash_surface = pygame.Surface((width, height))
-        flash_surface.fill(colour)
-        
         # Flash animation (3 flashes)
-        for _ in range(3):
-            # Show flash
-            for alpha in range(0, 128, 32):  # Fade in
-                flash_surface.set_alpha(alpha)
-                self.display.screen.blit(original_surface, (0, 0))
-                self.display.screen.blit(flash_surface, (x, y))
-                self.display.draw_text(f"{effect_name} applied to {target.name}!",
-                                (x + width // 2, y + height // 3),
-                                'large', pygame.Color(*colour), center=True)
-                pygame.display.flip()
-                pygame.time.wait(100)
-                
-            for alpha in range(128, 0, -32):  # Fade out
-                flash_surface.set_alpha(alpha)
-                self.display.screen.blit(original_surface, (0, 0))
-                self.display.screen.blit(flash_surface, (x, y))
-                self.display.draw_text(f"{effect_name} applied to {target.name}!",
-                                (x + width // 2, y + height // 3),
-                                'large', pygame.Color(*colour), center=True)
-                pygame.display.flip()
-                pygame.time.wait(100)
-        
-        # Restore original screen
-        self.display.screen.blit(original_surface, (0, 0))
-        pygame.display.flip()
-        
+        self.animations.add(FlashAnimation(layout, colour, f"{effect_name} applied to {target.name}!",
+                                           (x + width // 2, y + height // 3), pygame.Color(*colour)))
+        self.play_animations()
+        
+    def damage_estimates(self, player, enemy):
+        """Damage distributions for both sides, only recalculated when a combat stat changes"""
+        key = (combat_signature(player), combat_signature(enemy), tuple(enemy.attack_types))
+        if self._damage_estimates[0] != key:
+            try:
+                from damage_model import damage_distributions
+                estimates = (damage_distributions(player, enemy, ["normal"]), damage_distributions(enemy, player))
+            except ImportError:
+                estimates = None  # NumPy isn't installed, fall back to showing hit chances only
+            self._damage_estimates = (key, estimates)
+        return self._damage_estimates[1]
+
     def draw_chance_to_hit(self, x, y, player, enemy):
-        from player import Player
-        """Draw chance to hit"""
+        """Draw chance to hit, with expected damage above the combat options"""
         layout = self.display.calculate_layout()
         enemy_panel_x = layout['enemy_panel'][2]  # Enemy panel x position
         
@@ -2610,6 +2770,29 @@ class BattleDisplay:
         
         self.display.draw_text(enemy_text, (enemy_x, y + 10), 'large', 'white')
         
+        estimates = self.damage_estimates(player, enemy)
+        if not estimates:
+            return
+        player_attacks, enemy_attacks = estimates
+        _, panel_height, _, panel_y = layout['battle_panel']
+        estimate_y = panel_y + panel_height - 80
+        
+        # Player's basic attack, including the chance it finishes the enemy off
+        normal = player_attacks["normal"]
+        low, high = normal.hit_range
+        player_text = (f"{normal.name}: avg {normal.expected:.0f} dmg ({low}-{high} on hit), "
+                       f"{normal.chance_to_deal(enemy.hp):.0%} to defeat")
+        self.display.draw_text(player_text, (x + player_padding, estimate_y), 'medium', 'lightgrey')
+        
+        # Enemy's most dangerous attack
+        if enemy_attacks:
+            strongest = max(enemy_attacks.values(), key=lambda attack: attack.expected)
+            low, high = strongest.hit_range
+            enemy_text = (f"{enemy.name}'s {strongest.name}: avg {strongest.expected:.0f} dmg ({low}-{high} on hit), "
+                          f"{strongest.chance_to_deal(player.hp):.0%} to defeat")
+            enemy_text_width = self.display.calculate_text_dimensions(enemy_text, 'medium')[0]
+            self.display.draw_text(enemy_text, (enemy_panel_x - enemy_text_width - enemy_padding, estimate_y + 25), 'medium', 'lightgrey')
+        
     def draw_status_bars(self, width, height, x, y, entity, is_player=True):
         """Draw status bars for the player and enemy"""
         # Constants
@@ -2682,9 +2865,38 @@ class BattleDisplay:
         
     def wait_for_animation(self):
         """Wait for all status bars animations to complete"""
+        if self.animations.active:
+            self.play_animations()
+            return
+        incremental = False
         while not all(self.animation_complete.values()):
-            self.draw_battle_screen(self.display.game.player, self.display.game.current_location, self.last_enemy)
+            # First frame repaints everything, after that only the animating bars change
+            self.draw_battle_screen(self.display.game.player, self.display.game.current_location, self.last_enemy,
+                                    incremental=incremental)
+            incremental = True
             pygame.time.wait(16)        
+
+    def play_animations(self):
+        """Run queued animations frame by frame, SPACE skips them and F toggles fast forward"""
+        held_events = []
+        while self.animations.active or not all(getattr(self, 'animation_complete', {}).values()):
+            for event in pygame.event.get():
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    self.animations.skip()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                    self.animations.toggle_fast()
+                else:
+                    # Keep other input for whatever reads events after the animations
+                    held_events.append(event)
+            
+            dt = self.display.clock.tick(self.config.FPS)
+            self.animations.update(dt)
+            self.draw_battle_screen(self.display.game.player, self.display.game.current_location, self.last_enemy, present=False)
+            self.animations.draw(self.display)
+            pygame.display.flip()
+        
+        for event in held_events:
+            pygame.event.post(event)
         
     def draw_status_effects(self, x, y, width, entity):
         """Draw status effects with icons and details"""
@@ -2711,7 +2923,7 @@ class BattleDisplay:
                 
                 # Draw icon if available
                 if effect.name in self.STATUS_ICONS:
-                    icon = pygame.transform.scale(
+                    icon = AssetManager.get_image(
                         self.STATUS_ICONS[effect.name],
                         (ICON_SIZE, ICON_SIZE)
                     )
@@ -1,7 +1,13 @@
 from player import Character
 from game_config import MONSTER_TYPES
 from status_effects import *
+from collections import deque
+from alias_table import AliasTable
+from stat_trace import STAT_TRACE
+import itertools
+import json
 import random
+import time
 
 ENEMY_TEMPLATES = {
         # Easy Enemies
@@ -1016,6 +1022,57 @@ TIER_RANGES = {
     "boss": (110, 130)
 }
 
+# Levels below and above the player's that an enemy of each tier can spawn at
+TIER_LEVEL_RANGES = {
+    "low": (1, 2),
+    "medium": (2, 3),
+    "medium-hard": (3, 4),
+    "hard": (4, 6),
+    "very-hard": (5, 7),
+    "extreme": (6, 8),
+    "boss": (7, 9)
+}
+
+# Tier multipliers adjusted for wider ranges
+TIER_SCALE_MULTIPLIERS = {
+    "low": 0.95,        # Reduced to prevent low-tier from being too strong
+    "medium": 1.0,
+    "medium-hard": 1.05,
+    "hard": 1.1,
+    "very-hard": 1.15,
+    "extreme": 1.2,
+    "boss": 1.25
+}
+
+# Cap based on tier to prevent low-tier enemies from being too strong
+TIER_SCALE_CAPS = {
+    "low": 1.05,
+    "medium": 1.1,
+    "medium-hard": 1.15,
+    "hard": 1.2,
+    "very-hard": 1.25,
+    "extreme": 1.3,
+    "boss": 1.35
+}
+
+def hybrid_level_scale(tier, player_level, enemy_level):
+    """Stat scaling for an enemy of this tier based on its level difference to the player"""
+    level_diff = enemy_level - player_level
+    
+    # Expanded scaling based on wider level ranges
+    if level_diff <= -5: base_scale = 0.88
+    elif level_diff <= -3: base_scale = 0.91
+    elif level_diff <= -2: base_scale = 0.94
+    elif level_diff <= 0: base_scale = 0.97
+    elif level_diff <= 2: base_scale = 1.0
+    elif level_diff <= 4: base_scale = 1.03
+    elif level_diff <= 6: base_scale = 1.06
+    elif level_diff <= 8: base_scale = 1.09
+    else: base_scale = 1.12
+    
+    tier_scale = TIER_SCALE_MULTIPLIERS.get(tier, 1.0)
+    return min(TIER_SCALE_CAPS.get(tier, 1.35), base_scale * tier_scale)
+
 STAT_FOCUSES = {
     "tank": {
         "hp": round(random.uniform(1.25, 1.35), 2),
@@ -1363,6 +1420,272 @@ ENEMY_ATTACK_TYPES = {
     }
 }
 
+TYPE_COMBOS = {
+    "fire": {
+        "burn": {
+            "follow_up": ["power", "reckless"],
+            "chance": 0.45,
+            "description": "Burning Power Assault"
+        },
+        "power": {
+            "follow_up": ["double", "triple"],
+            "chance": 0.4,
+            "description": "Blazing Flurry"
+        }
+    },
+    "ice": {
+        "freeze": {
+            "follow_up": ["power", "defence_break"],
+            "chance": 0.5,
+            "description": "Frozen Shatter"
+        }
+    },
+    "void": {
+        "void_drain": {
+            "follow_up": ["reality_rend"],
+            "chance": 0.6,
+            "description": "Void Collapse"
+        },
+        "reality_rend": {
+            "follow_up": ["confusion", "draining"],
+            "chance": 0.4,
+            "description": "Reality Drain"
+        }
+    },
+    "spirit": {
+        "draining": {
+            "follow_up": ["vampiric", "attack_weaken"],
+            "chance": 0.5,
+            "description": "Spirit Siphon"
+        }
+    },
+    "warrior": {
+        "stunning": {
+            "follow_up": ["triple", "power"],
+            "chance": 0.45,
+            "description": "Warrior's Fury"
+        },
+        "defence_break": {
+            "follow_up": ["reckless", "power"],
+            "chance": 0.4,
+            "description": "Warrior's Rage"
+        }
+    },
+    "undead": {
+        "poison": {
+            "follow_up": ["draining", "vampiric"],
+            "chance": 0.5,
+            "description": "Death's Touch"
+        }
+    },
+    "dragon": {
+        "burn": {
+            "follow_up": ["triple", "reckless"],
+            "chance": 0.55,
+            "description": "Dragon's Wrath"
+        },
+        "power": {
+            "follow_up": ["stunning", "defence_break"],
+            "chance": 0.45,
+            "description": "Dragon's Might"
+        }
+    },
+    "arcane": {
+        "confusion": {
+            "follow_up": ["draining", "attack_weaken"],
+            "chance": 0.5,
+            "description": "Mind Shatter"
+        }
+    },
+    "wind": {
+        "double": {
+            "follow_up": ["triple", "stunning"],
+            "chance": 0.5,
+            "description": "Wind Flurry"
+        },
+        "attack_weaken": {
+            "follow_up": ["confusion", "evasion_stance"],
+            "chance": 0.4,
+            "description": "Tempest Dance"
+        }
+    },
+    "grass": {
+        "poison": {
+            "follow_up": ["draining", "attack_weaken"],
+            "chance": 0.45,
+            "description": "Toxic Drain"
+        },
+        "double": {
+            "follow_up": ["poison", "vampiric"],
+            "chance": 0.4,
+            "description": "Nature's Vengeance"
+        }
+    },
+    "earth": {
+        "stunning": {
+            "follow_up": ["defence_break", "power"],
+            "chance": 0.5,
+            "description": "Tectonic Crush"
+        },
+        "damage_reflect": {
+            "follow_up": ["defensive", "stunning"],
+            "chance": 0.45,
+            "description": "Mountain's Defense"
+        }
+    },
+    "water": {
+        "draining": {
+            "follow_up": ["freeze", "vampiric"],
+            "chance": 0.45,
+            "description": "Drowning Depths"
+        },
+        "defence_break": {
+            "follow_up": ["triple", "freeze"],
+            "chance": 0.4,
+            "description": "Crushing Wave"
+        }
+    },
+    "lightning": {
+        "stunning": {
+            "follow_up": ["double", "triple"],
+            "chance": 0.6,
+            "description": "Thunder Strike"
+        },
+        "attack_weaken": {
+            "follow_up": ["power", "stunning"],
+            "chance": 0.45,
+            "description": "Storm's Fury"
+        }
+    }
+}
+
+GENERIC_COMBOS = {
+    "stunning": {
+        "follow_up": ["power", "reckless"],
+        "chance": 0.4,
+        "description": "Stun into heavy damage"
+    },
+    "attack_weaken": {
+        "follow_up": ["triple", "reckless"],
+        "chance": 0.35,
+        "description": "Weaken defense then multi-hit"
+    },
+    "poison": {
+        "follow_up": ["draining", "vampiric"],
+        "chance": 0.3,
+        "description": "DoT then life steal"
+    },
+    "freeze": {
+        "follow_up": ["power", "defence_break"],
+        "chance": 0.45,
+        "description": "Freeze then shatter"
+    },
+    "burn": {
+        "follow_up": ["double", "triple"],
+        "chance": 0.35,
+        "description": "Burn then rapid strikes"
+    },
+    "defence_break": {
+        "follow_up": ["power", "reckless"],
+        "chance": 0.4,
+        "description": "Break defense then power hit"
+    },
+    "void_drain": {
+        "follow_up": ["reality_rend", "confusion"],
+        "chance": 0.5,
+        "description": "Drain then reality tear"
+    }
+}
+
+# Moves an enemy leans towards at each health band and the chance it picks one of them
+HP_BAND_MOVES = {
+    "desperate": (["vampiric", "reckless", "power", "void_drain"], 1.0),  # 30% hp or less
+    "defensive": (["draining", "damage_reflect", "stunning", "double"], 0.7),  # 50% hp or less
+    "steady": ([], 0),
+    "aggressive": (["triple", "power", "reckless", "poison"], 0.6)  # 80% hp or more
+}
+
+_decision_tables = {}
+
+def hp_band(hp, max_hp):
+    hp_percent = (hp / max_hp) * 100
+    if hp_percent <= 30:
+        return "desperate"
+    elif hp_percent <= 50:
+        return "defensive"
+    elif hp_percent >= 80:
+        return "aggressive"
+    return "steady"
+
+def _move_weights(monster_type, attacks, last_move, band, repeated):
+    """Chance of each move in one situation, following the order choose_attack checks things in"""
+    weights = dict.fromkeys(attacks, 0.0)
+    remaining = 1.0
+
+    def spread(moves, chance):
+        nonlocal remaining
+        for move in moves:
+            weights[move] += remaining * chance / len(moves)
+        remaining *= 1 - chance
+
+    # Type-specific then generic combos off the last move
+    if last_move is not None:
+        for combo in (TYPE_COMBOS.get(monster_type, {}).get(last_move), GENERIC_COMBOS.get(last_move)):
+            if combo:
+                follow_ups = [move for move in combo["follow_up"] if move in weights]
+                if follow_ups:
+                    spread(follow_ups, combo["chance"])
+
+    # Health-based preferences
+    band_moves, band_chance = HP_BAND_MOVES[band]
+    preferred = [move for move in band_moves if move in weights]
+    if preferred:
+        spread(preferred, band_chance)
+
+    # Otherwise anything that hasn't been used twice in the last 3 moves
+    spread([move for move in attacks if move != repeated] or attacks, 1.0)
+    return weights
+
+def compile_decision_table(monster_type, attack_types):
+    """Every situation an enemy can be in mapped to its moves and cumulative weights.
+
+    A situation is (last move, hp band, move used twice recently), which is
+    all choose_attack needs, so picking a move is one lookup and one draw.
+    """
+    attacks = list(attack_types)
+    table = {}
+    for last_move in [None] + attacks:
+        for band in HP_BAND_MOVES:
+            for repeated in [None] + attacks:
+                weights = _move_weights(monster_type, attacks, last_move, band, repeated)
+                moves = [move for move in attacks if weights[move] > 0]
+                cumulative_weights = list(itertools.accumulate(weights[move] for move in moves))
+                table[(last_move, band, repeated)] = (moves, cumulative_weights)
+    return table
+
+def get_decision_table(monster_type, attack_types):
+    """Compiled decision table, shared by every enemy with the same type and attacks"""
+    key = (monster_type, tuple(attack_types))
+    if key not in _decision_tables:
+        _decision_tables[key] = compile_decision_table(monster_type, attack_types)
+    return _decision_tables[key]
+
+def export_decision_tables(path="enemy_ai_tables.json"):
+    """Write every template's move probabilities to JSON for balance analysis"""
+    export = {}
+    for name, template in ENEMY_TEMPLATES.items():
+        monster_type = template.get("monster_type", "unknown")
+        table = get_decision_table(monster_type, template["attack_types"])
+        states = []
+        for (last_move, band, repeated), (moves, cumulative_weights) in table.items():
+            chances = [round(weight - previous, 4) for weight, previous in zip(cumulative_weights, [0.0] + cumulative_weights)]
+            states.append({"last_move": last_move, "hp_band": band, "repeated": repeated,
+                           "moves": dict(zip(moves, chances))})
+        export[name] = {"monster_type": monster_type, "attack_types": template["attack_types"], "states": states}
+    with open(path, "w") as file:
+        json.dump(export, file, indent=2)
+    return path
+
 # Monster variant modifiers with stat changes and spawn chances
 MONSTER_VARIANTS = {
     "Frenzied": {
@@ -1583,18 +1906,23 @@ MONSTER_VARIANTS = {
 class Enemy(Character):
     def __init__(self, name=None, hp=None, attack=None, defence=None, accuracy=None, evasion=None, 
              crit_chance=None, crit_damage=None, armour_penetration=None, damage_reduction=None, 
-             block_chance=None, exp=None, gold=None, tier=None, level=0, attack_types=None, template=None, player=None):
+             block_chance=None, exp=None, gold=None, tier=None, level=0, attack_types=None, template=None, player=None,
+             stats=None):
         
         if template and player:
             self.template = template
             self.tier = template["tier"]
             self.stat_focus = template.get("stat_focus", "balanced")
-            self.last_moves = []
+            self.last_moves = deque(maxlen=3)
             self.combo_counter = 0
-            self.debug_info = {}  # Store debug calculation info
+            self.trace_id = None  # Only set when the stat calculation was traced
             
-            # Calculate stats and store debug info
-            stats = self._calculate_stats_with_debug(player, template)
+            if stats is None:
+                # Step by step calculation, recorded in STAT_TRACE
+                stats = self._calculate_stats_with_debug(player, template)
+            else:
+                # Already rolled by a CompiledTemplate
+                self.variant = stats['variant']
             
             hp = stats['hp']
             attack = stats['attack']
@@ -1626,7 +1954,10 @@ class Enemy(Character):
         self.monster_type = self._determine_monster_type(final_name)
         
         # Update attack types initialization
-        if template and player:
+        if template and player and isinstance(stats['attack_types'], dict):
+            # Compiled by the CompiledTemplate once per template and variant, nothing changes it after spawning so it's shared
+            self.attack_types = stats['attack_types']
+        elif template and player:
             self.attack_types = {attack_type: ENEMY_ATTACK_TYPES[attack_type] 
                             for attack_type in stats['attack_types']}
         elif attack_types:
@@ -1637,50 +1968,11 @@ class Enemy(Character):
             
     def get_hybrid_level_scale(self, player_level, enemy_level):
         """Calculate scaling based on level difference and enemy tier"""
-        level_diff = enemy_level - player_level
-        base_scale = 1.0
-        
-        # Expanded scaling based on wider level ranges
-        if level_diff <= -5: base_scale = 0.88
-        elif level_diff <= -3: base_scale = 0.91
-        elif level_diff <= -2: base_scale = 0.94
-        elif level_diff <= 0: base_scale = 0.97
-        elif level_diff <= 2: base_scale = 1.0
-        elif level_diff <= 4: base_scale = 1.03
-        elif level_diff <= 6: base_scale = 1.06
-        elif level_diff <= 8: base_scale = 1.09
-        else: base_scale = 1.12
-
-        # Tier multipliers adjusted for wider ranges
-        tier_multipliers = {
-            "low": 0.95,        # Reduced to prevent low-tier from being too strong
-            "medium": 1.0,
-            "medium-hard": 1.05,
-            "hard": 1.1,
-            "very-hard": 1.15,
-            "extreme": 1.2,
-            "boss": 1.25
-        }
-        
-        tier_scale = tier_multipliers.get(self.tier, 1.0)
-        
-        # Cap based on tier to prevent low-tier enemies from being too strong
-        tier_caps = {
-            "low": 1.05,
-            "medium": 1.1,
-            "medium-hard": 1.15,
-            "hard": 1.2,
-            "very-hard": 1.25,
-            "extreme": 1.3,
-            "boss": 1.35
-        }
-        
-        final_scale = min(tier_caps.get(self.tier, 1.35), base_scale * tier_scale)
-        return final_scale
+        return hybrid_level_scale(self.tier, player_level, enemy_level)
     
     def _calculate_stats_with_debug(self, player, template):
         stats = {}
-        debug = self.debug_info
+        debug = {}
         
         # Get focus modifiers first
         stat_focus = template.get("stat_focus", "balanced")
@@ -1750,17 +2042,7 @@ class Enemy(Character):
             debug['variant_mods'] = {}
 
         # Level ranges based on tier
-        tier_level_ranges = {
-            "low": (1, 2),
-            "medium": (2, 3),
-            "medium-hard": (3, 4),
-            "hard": (4, 6),
-            "very-hard": (5, 7),
-            "extreme": (6, 8),
-            "boss": (7, 9)
-        }
-        
-        level_range = tier_level_ranges.get(self.tier, (2, 3))
+        level_range = TIER_LEVEL_RANGES.get(self.tier, (2, 3))
         level_min = max(1, player.level - level_range[0])
         level_max = player.level + level_range[1]
         stats['level'] = random.randint(level_min, level_max)
@@ -1801,7 +2083,7 @@ class Enemy(Character):
         debug['final_percentages'] = base_percentages.copy()
         
         # Calculate remaining stats with caps
-        stats.update(self._calculate_secondary_stats(player, base_percentages))
+        stats.update(self._calculate_secondary_stats(player, base_percentages, debug))
         
         # Calculate rewards
         debug['exp_roll'] = random.randint(8, 20)
@@ -1814,13 +2096,14 @@ class Enemy(Character):
             if 'loot_modifiers' in self.variant and 'gold_multiplier' in self.variant['loot_modifiers']:
                 stats['gold'] = int(stats['gold'] * self.variant['loot_modifiers']['gold_multiplier'])
         
+        self.trace_id = STAT_TRACE.record(stats, player, debug)
         return stats
     
-    def _calculate_secondary_stats(self, player, base_percentages):
-        """Calculate secondary stats with caps and store debug information"""
+    def _calculate_secondary_stats(self, player, base_percentages, trace):
+        """Calculate secondary stats with caps, recording each step in the trace dict"""
         stats = {}
-        self.debug_info['secondary_calc'] = {}
-        debug = self.debug_info['secondary_calc']
+        trace['secondary_calc'] = {}
+        debug = trace['secondary_calc']
         
         # Accuracy calculation
         base_accuracy = (player.base_accuracy + player.level_modifiers.get("accuracy", 0) + 
@@ -1940,7 +2223,12 @@ class Enemy(Character):
         return stats
 
     def debug_stat_calculation(self, player):
-        """Display full calculation process using stored debug info"""
+        """Display full calculation process from this enemy's stat trace"""
+        trace = STAT_TRACE.get(getattr(self, 'trace_id', None))
+        if trace is None:
+            return (f"No stat trace for {self.name}, spawn it with tracing enabled "
+                    "(TEXT_RPG_TRACE_STATS=1) or create_enemy(..., debug=True)")
+        
         debug = []
         debug.append(f"\n=== Detailed Stat Calculation for {self.name} ===\n")
         
@@ -1953,43 +2241,43 @@ class Enemy(Character):
         
         # Base percentages
         debug.append("\n2. Initial Base Percentages:")
-        for stat, value in self.debug_info['base_percentages'].items():
+        for stat, value in trace['base_percentages'].items():
             debug.append(f"{stat}: {value}%")
         
         # Template modifications
         debug.append("\n3. Template Modifications:")
-        for stat, value in self.debug_info['template_mods'].items():
+        for stat, value in trace['template_mods'].items():
             debug.append(f"{stat} modified to: {value}%")
             
         # Variant modifications if any
         if self.variant:
             debug.append("\n4. Variant Modifications:")
-            for stat, modifier in self.debug_info['variant_mods'].items():
+            for stat, modifier in trace['variant_mods'].items():
                 debug.append(f"{stat}: {modifier}%")
                 
         # Level scaling
         debug.append("\n5. Level Scaling:")
-        debug.append(f"Level range: {self.debug_info['level_calc']['min']} - {self.debug_info['level_calc']['max']}")
-        debug.append(f"Chosen level: {self.debug_info['level_calc']['chosen']}")
-        debug.append(f"Level difference: {self.debug_info['level_calc']['chosen'] - player.level}")
-        debug.append(f"Level scale: {self.debug_info['level_scale']:.2f}")
+        debug.append(f"Level range: {trace['level_calc']['min']} - {trace['level_calc']['max']}")
+        debug.append(f"Chosen level: {trace['level_calc']['chosen']}")
+        debug.append(f"Level difference: {trace['level_calc']['chosen'] - player.level}")
+        debug.append(f"Level scale: {trace['level_scale']:.2f}")
         
         # Main stat calculations
         debug.append("\n6. Main Stat Calculations:")
         
         # HP calculation
-        base_hp = self.debug_info['player_stats']['max_hp']
-        hp_percent = self.debug_info['final_percentages']['hp_percent']
+        base_hp = trace['player_stats']['max_hp']
+        hp_percent = trace['final_percentages']['hp_percent']
         debug.append(f"HP Calculation:")
         debug.append(f"Base HP (from player): {base_hp}")
         debug.append(f"Percentage modifier: {hp_percent}%")
         debug.append(f"Final HP: {base_hp} * {hp_percent}% = {self.hp}")
         
         # Attack calculation
-        attack_base = self.debug_info['player_stats']['base_attack']
-        attack_level = self.debug_info['player_stats']['level_attack']
-        attack_equipment = self.debug_info['player_stats']['equipment_attack']
-        attack_percent = self.debug_info['final_percentages']['attack_percent']
+        attack_base = trace['player_stats']['base_attack']
+        attack_level = trace['player_stats']['level_attack']
+        attack_equipment = trace['player_stats']['equipment_attack']
+        attack_percent = trace['final_percentages']['attack_percent']
         
         debug.append(f"\nAttack Calculation:")
         debug.append(f"Base attack: {attack_base * 2}")
@@ -1997,14 +2285,14 @@ class Enemy(Character):
         debug.append(f"Equipment modifier (30%): {attack_equipment * 0.4}")
         debug.append(f"Combined base: {(attack_base * 2) + (attack_level * 2) + (attack_equipment * 0.4)}")
         debug.append(f"Percentage modifier: {attack_percent}%")
-        debug.append(f"Level scaling: {self.debug_info['level_scale']:.2f}")
+        debug.append(f"Level scaling: {trace['level_scale']:.2f}")
         debug.append(f"Final attack: {self.attack}")
         
         # Defence Calculation
-        defence_base = self.debug_info['player_stats']['base_defence']
-        defence_level = self.debug_info['player_stats']['level_defence']
-        defence_equipment = self.debug_info['player_stats']['equipment_defence']
-        defence_percent = self.debug_info['final_percentages']['defence_percent']
+        defence_base = trace['player_stats']['base_defence']
+        defence_level = trace['player_stats']['level_defence']
+        defence_equipment = trace['player_stats']['equipment_defence']
+        defence_percent = trace['final_percentages']['defence_percent']
         
         debug.append(f"\nDefence Calculation:")
         debug.append(f"Base defence: {defence_base * 2}")
@@ -2012,13 +2300,13 @@ class Enemy(Character):
         debug.append(f"Equipment modifier (30%): {defence_equipment * 0.4}")
         debug.append(f"Combined base: {(defence_base * 2) + (defence_level * 2) + (defence_equipment * 0.4)}")
         debug.append(f"Percentage modifier: {defence_percent}%")
-        debug.append(f"Level scaling: {self.debug_info['level_scale']:.2f}")
+        debug.append(f"Level scaling: {trace['level_scale']:.2f}")
         debug.append(f"Final defence: {self.defence}")
         
         # Secondary stats calculations
         debug.append("\n7. Secondary Stats Calculations:")
         
-        secondary_stats = self.debug_info['secondary_calc']
+        secondary_stats = trace['secondary_calc']
         for stat_name, stat_info in secondary_stats.items():
             debug.append(f"\n{stat_name.replace('_', ' ').title()} Calculation:")
             debug.append(f"Base: {stat_info['base']}")
@@ -2033,7 +2321,7 @@ class Enemy(Character):
         # Add attack types section
         debug.append("\n8. Attack Types:")
         debug.append("Base attack types:")
-        for attack in self.debug_info['attack_types']['base']:
+        for attack in trace['attack_types']['base']:
             attack_info = ENEMY_ATTACK_TYPES[attack]
             debug.append(f"- {attack_info['name']}:")
             debug.append(f"  Damage modifier: {attack_info['damage_modifier']}")
@@ -2042,9 +2330,9 @@ class Enemy(Character):
             if 'extra_attacks' in attack_info:
                 debug.append(f"  Extra attacks: {attack_info['extra_attacks']}")
         
-        if 'variant_added' in self.debug_info['attack_types']:
+        if 'variant_added' in trace['attack_types']:
             debug.append("\nVariant added attack types:")
-            for attack in self.debug_info['attack_types']['variant_added']:
+            for attack in trace['attack_types']['variant_added']:
                 attack_info = ENEMY_ATTACK_TYPES[attack]
                 debug.append(f"- {attack_info['name']}:")
                 debug.append(f"  Damage modifier: {attack_info['damage_modifier']}")
@@ -2054,8 +2342,8 @@ class Enemy(Character):
                     debug.append(f"  Extra attacks: {attack_info['extra_attacks']}")
         
         debug.append("\nFinal available attacks:")
-        debug.append(f"Total unique attacks: {len(set(self.debug_info['attack_types']['final']))}")
-        for attack in set(self.debug_info['attack_types']['final']):
+        debug.append(f"Total unique attacks: {len(set(trace['attack_types']['final']))}")
+        for attack in set(trace['attack_types']['final']):
             attack_info = ENEMY_ATTACK_TYPES[attack]
             debug.append(f"- {attack_info['name']}:")
             debug.append(f"  Damage modifier: {attack_info['damage_modifier']}")
@@ -2075,260 +2363,42 @@ class Enemy(Character):
     
     def get_type_specific_combos(self):
         """Get monster type specific combo moves"""
-        type_combos = {
-            "fire": {
-                "burn": {
-                    "follow_up": ["power", "reckless"],
-                    "chance": 0.45,
-                    "description": "Burning Power Assault"
-                },
-                "power": {
-                    "follow_up": ["double", "triple"],
-                    "chance": 0.4,
-                    "description": "Blazing Flurry"
-                }
-            },
-            "ice": {
-                "freeze": {
-                    "follow_up": ["power", "defence_break"],
-                    "chance": 0.5,
-                    "description": "Frozen Shatter"
-                }
-            },
-            "void": {
-                "void_drain": {
-                    "follow_up": ["reality_rend"],
-                    "chance": 0.6,
-                    "description": "Void Collapse"
-                },
-                "reality_rend": {
-                    "follow_up": ["confusion", "draining"],
-                    "chance": 0.4,
-                    "description": "Reality Drain"
-                }
-            },
-            "spirit": {
-                "draining": {
-                    "follow_up": ["vampiric", "attack_weaken"],
-                    "chance": 0.5,
-                    "description": "Spirit Siphon"
-                }
-            },
-            "warrior": {
-                "stunning": {
-                    "follow_up": ["triple", "power"],
-                    "chance": 0.45,
-                    "description": "Warrior's Fury"
-                },
-                "defence_break": {
-                    "follow_up": ["reckless", "power"],
-                    "chance": 0.4,
-                    "description": "Warrior's Rage"
-                }
-            },
-            "undead": {
-                "poison": {
-                    "follow_up": ["draining", "vampiric"],
-                    "chance": 0.5,
-                    "description": "Death's Touch"
-                }
-            },
-            "dragon": {
-                "burn": {
-                    "follow_up": ["triple", "reckless"],
-                    "chance": 0.55,
-                    "description": "Dragon's Wrath"
-                },
-                "power": {
-                    "follow_up": ["stunning", "defence_break"],
-                    "chance": 0.45,
-                    "description": "Dragon's Might"
-                }
-            },
-            "arcane": {
-                "confusion": {
-                    "follow_up": ["draining", "attack_weaken"],
-                    "chance": 0.5,
-                    "description": "Mind Shatter"
-                }
-            },
-            "wind": {
-                "double": {
-                    "follow_up": ["triple", "stunning"],
-                    "chance": 0.5,
-                    "description": "Wind Flurry"
-                },
-                "attack_weaken": {
-                    "follow_up": ["confusion", "evasion_stance"],
-                    "chance": 0.4,
-                    "description": "Tempest Dance"
-                }
-            },
-            "grass": {
-                "poison": {
-                    "follow_up": ["draining", "attack_weaken"],
-                    "chance": 0.45,
-                    "description": "Toxic Drain"
-                },
-                "double": {
-                    "follow_up": ["poison", "vampiric"],
-                    "chance": 0.4,
-                    "description": "Nature's Vengeance"
-                }
-            },
-            "earth": {
-                "stunning": {
-                    "follow_up": ["defence_break", "power"],
-                    "chance": 0.5,
-                    "description": "Tectonic Crush"
-                },
-                "damage_reflect": {
-                    "follow_up": ["defensive", "stunning"],
-                    "chance": 0.45,
-                    "description": "Mountain's Defense"
-                }
-            },
-            "water": {
-                "draining": {
-                    "follow_up": ["freeze", "vampiric"],
-                    "chance": 0.45,
-                    "description": "Drowning Depths"
-                },
-                "defence_break": {
-                    "follow_up": ["triple", "freeze"],
-                    "chance": 0.4,
-                    "description": "Crushing Wave"
-                }
-            },
-            "lightning": {
-                "stunning": {
-                    "follow_up": ["double", "triple"],
-                    "chance": 0.6,
-                    "description": "Thunder Strike"
-                },
-                "attack_weaken": {
-                    "follow_up": ["power", "stunning"],
-                    "chance": 0.45,
-                    "description": "Storm's Fury"
-                }
-            }
-        }
-        return type_combos.get(self.monster_type, {})
+        return TYPE_COMBOS.get(self.monster_type, {})
 
     def check_generic_combo(self, last_move):
         """Check for generic combo sequences"""
-        generic_combos = {
-            "stunning": {
-                "follow_up": ["power", "reckless"],
-                "chance": 0.4,
-                "description": "Stun into heavy damage"
-            },
-            "attack_weaken": {
-                "follow_up": ["triple", "reckless"],
-                "chance": 0.35,
-                "description": "Weaken defense then multi-hit"
-            },
-            "poison": {
-                "follow_up": ["draining", "vampiric"],
-                "chance": 0.3,
-                "description": "DoT then life steal"
-            },
-            "freeze": {
-                "follow_up": ["power", "defence_break"],
-                "chance": 0.45,
-                "description": "Freeze then shatter"
-            },
-            "burn": {
-                "follow_up": ["double", "triple"],
-                "chance": 0.35,
-                "description": "Burn then rapid strikes"
-            },
-            "defence_break": {
-                "follow_up": ["power", "reckless"],
-                "chance": 0.4,
-                "description": "Break defense then power hit"
-            },
-            "void_drain": {
-                "follow_up": ["reality_rend", "confusion"],
-                "chance": 0.5,
-                "description": "Drain then reality tear"
-            }
-        }
-        return generic_combos.get(last_move, None)
+        return GENERIC_COMBOS.get(last_move, None)
 
     def choose_attack(self):
         """
-        Enhanced attack selection with combo system
+        Enhanced attack selection with combo system, looked up from the compiled decision table
         """
         if self.stunned:
             self.stunned = False
             return None
             
-        available_attacks = list(self.attack_types.keys())
-        if not available_attacks:
+        if not self.attack_types:
             return "normal"
         
-        hp_percent = (self.hp / self.max_hp) * 100
+        # Recent moves only matter for the last one (combos) and any move used twice (repetition)
+        last_move = self.last_moves[-1] if self.last_moves else None
+        repeated = None
+        if len(self.last_moves) >= 2:
+            counts = {}
+            for move in self.last_moves:
+                counts[move] = counts.get(move, 0) + 1
+                if counts[move] >= 2:
+                    repeated = move
         
-        # Check for ongoing combo
-        if self.last_moves:
-            # Try type-specific combo first
-            type_combo = self.get_type_specific_combos().get(self.last_moves[-1])
-            if type_combo and random.random() < type_combo["chance"]:
-                available_follow_ups = [x for x in type_combo["follow_up"] if x in available_attacks]
-                if available_follow_ups:
-                    choice = random.choice(available_follow_ups)
-                    self._update_last_moves(choice)
-                    return choice
-            
-            # Try generic combo
-            generic_combo = self.check_generic_combo(self.last_moves[-1])
-            if generic_combo and random.random() < generic_combo["chance"]:
-                available_follow_ups = [x for x in generic_combo["follow_up"] if x in available_attacks]
-                if available_follow_ups:
-                    choice = random.choice(available_follow_ups)
-                    self._update_last_moves(choice)
-                    return choice
-
-        # Health-based decisions
-        if hp_percent <= 30:
-            desperate_moves = ["vampiric", "reckless", "power", "void_drain"]
-            available_desperate = [x for x in desperate_moves if x in available_attacks]
-            if available_desperate:
-                choice = random.choice(available_desperate)
-                self._update_last_moves(choice)
-                return choice
-                
-        elif hp_percent <= 50:
-            defensive_moves = ["draining", "damage_reflect", "stunning", "double"]
-            available_defensive = [x for x in defensive_moves if x in available_attacks]
-            if available_defensive and random.random() < 0.7:
-                choice = random.choice(available_defensive)
-                self._update_last_moves(choice)
-                return choice
-                
-        elif hp_percent >= 80:
-            aggressive_moves = ["triple", "power", "reckless", "poison"]
-            available_aggressive = [x for x in aggressive_moves if x in available_attacks]
-            if available_aggressive and random.random() < 0.6:
-                choice = random.choice(available_aggressive)
-                self._update_last_moves(choice)
-                return choice
-
-        # Avoid move repetition
-        available_moves = [x for x in available_attacks if self.last_moves.count(x) < 2]
-        if not available_moves:
-            available_moves = available_attacks
-            
-        choice = random.choice(available_moves)
+        table = get_decision_table(self.monster_type, self.attack_types)
+        moves, cumulative_weights = table[(last_move, hp_band(self.hp, self.max_hp), repeated)]
+        choice = random.choices(moves, cum_weights=cumulative_weights)[0]
         self._update_last_moves(choice)
         return choice
 
     def _update_last_moves(self, move):
         """Track last 3 moves"""
-        self.last_moves.append(move)
-        if len(self.last_moves) > 3:
-            self.last_moves.pop(0)
+        self.last_moves.append(move)  # Ring buffer, the oldest move drops off
 
 def get_stat_range(tier, stat_type):
     """Get the appropriate stat range based on tier and stat type"""
@@ -2350,57 +2420,196 @@ def get_stat_range(tier, stat_type):
     mod_min, mod_max = stat_modifiers.get(stat_type, (0, 0))
     return (base_min + mod_min, base_max + mod_max)
 
+PERCENT_STATS = ("hp_percent", "attack_percent", "defence_percent",
+                 "accuracy_percent", "evasion_percent", "crit_chance_percent",
+                 "crit_damage_percent", "armour_penetration_percent",
+                 "damage_reduction_percent", "block_chance_percent")
+
+def get_balanced_bounds(tier, stat_name, stat_focus="balanced"):
+    """Lowest and highest roll for a stat percentage, with the focus applied before variation"""
+    focus_mod = STAT_FOCUSES.get(stat_focus, STAT_FOCUSES["balanced"]).get(stat_name.replace("_percent", ""), 1.0)
+    
+    # Calculate base value
+    min_val, max_val = get_stat_range(tier, stat_name)
+    base_value = (min_val + max_val) // 2
+    
+    # Apply focus modifier before variation
+    modified_base = int(base_value * focus_mod)
+    variation = max(5, int(modified_base * 0.15))
+    
+    # Keep within tier bounds
+    min_stat = max(min_val, modified_base - variation)
+    max_stat = max(min_stat + 1, min(max_val, modified_base + variation))
+    return min_stat, max_stat
+
 def generate_balanced_stats(tier, stat_focus="balanced"):
     """Generate balanced stats with stat focus and controlled randomization"""
     stats = {}
-    focus_modifiers = STAT_FOCUSES.get(stat_focus, STAT_FOCUSES["balanced"])
-    base_ranges = TIER_RANGES.get(tier, (80, 95))
-    
-    for stat_name in ["hp_percent", "attack_percent", "defence_percent", 
-                      "accuracy_percent", "evasion_percent", "crit_chance_percent",
-                      "crit_damage_percent", "armour_penetration_percent", 
-                      "damage_reduction_percent", "block_chance_percent"]:
+    for stat_name in PERCENT_STATS:
+        stats[stat_name] = random.randint(*get_balanced_bounds(tier, stat_name, stat_focus))
+    return stats
+
+# Secondary stats: (stat, share of the player's equipment bonus that counts, lowest, highest)
+SECONDARY_STAT_SCALING = (
+    ("accuracy", 0.7, None, 130),
+    ("evasion", 0.75, None, 50),
+    ("crit_chance", 0.75, None, 50),
+    ("crit_damage", 0.75, 100, 250),
+    ("armour_penetration", 0.75, None, 50),
+    ("damage_reduction", 0.75, None, 30),
+    ("block_chance", 0.75, None, 30)
+)
+
+def player_snapshot(player):
+    """The player values enemy stats are scaled from, read once per spawn"""
+    level_mods = player.level_modifiers
+    equipment_mods = player.equipment_modifiers
+    # Same operation order as _calculate_stats_with_debug so both paths give identical stats
+    attack_base = ((player.base_attack + level_mods.get("attack", 0)) * 2) + equipment_mods.get("attack", 0) * 0.3
+    defence_base = ((player.base_defence + level_mods.get("defence", 0)) * 2) + equipment_mods.get("defence", 0) * 0.3
+    base_stats = player.base_stats
+    secondary_bases = tuple(
+        base_stats[stat] + level_mods.get(stat, 0) + (equipment_mods.get(stat, 0) * share)
+        for stat, share, _, _ in SECONDARY_STAT_SCALING
+    )
+    return player.level, player.max_hp, attack_base, defence_base, secondary_bases
+
+class CompiledVariant:
+    """A MONSTER_VARIANTS entry resolved into per-stat multipliers"""
+    def __init__(self, name, variant):
+        self.name = name
+        self.variant = variant
+        variant_stats = variant.get("stats", {})
+        self.multipliers = tuple(variant_stats[stat] / 100 if stat in variant_stats else None for stat in PERCENT_STATS)
+        self.additional_attacks = variant.get("additional_attacks", [])
+        self.gold_multiplier = variant.get("loot_modifiers", {}).get("gold_multiplier")
+
+    def state(self):
+        """Per-enemy copy of the variant, as stored on Enemy.variant"""
+        return {
+            'name': self.name,
+            'stats': self.variant.get('stats', {}).copy(),
+            'loot_modifiers': self.variant.get('loot_modifiers', {}).copy()
+        }
+
+class CompiledTemplate:
+    """An ENEMY_TEMPLATES entry with everything that doesn't depend on the player worked out once.
+
+    Spawning only draws the random numbers and scales them by the player.
+    """
+    def __init__(self, enemy_type, template):
+        self.enemy_type = enemy_type
+        self.template = template
+        self.tier = template["tier"]
+        self.stat_focus = template.get("stat_focus", "balanced")
+        self.soultype = template.get("soultype", "standard")
+        self.monster_type = template.get("monster_type", "unknown")
+        focus_modifiers = STAT_FOCUSES.get(self.stat_focus, STAT_FOCUSES["balanced"])
         
-        # Get base stat without "_percent"
-        base_stat = stat_name.replace("_percent", "")
-        focus_mod = focus_modifiers.get(base_stat, 1.0)
+        # Every percentage a stat can end up at, the focus modifier already applied to each roll
+        self.percent_values = []
+        for stat_name in PERCENT_STATS:
+            focus_mod = focus_modifiers.get(stat_name.replace("_percent", ""), 1.0)
+            min_stat, max_stat = get_balanced_bounds(self.tier, stat_name)
+            self.percent_values.append(tuple(int(value * focus_mod) for value in range(min_stat, max_stat + 1)))
         
-        # Calculate base value
-        min_val, max_val = get_stat_range(tier, stat_name)
-        base_value = (min_val + max_val) // 2
+        # Level scale for every level difference a spawn can roll
+        self.level_range = TIER_LEVEL_RANGES.get(self.tier, (2, 3))
+        below, above = self.level_range
+        self.level_scales = tuple(hybrid_level_scale(self.tier, 0, diff) for diff in range(-below, above + 1))
         
-        # Apply focus modifier before variation
-        modified_base = int(base_value * focus_mod)
-        variation = max(5, int(modified_base * 0.15))
+        self.attack_types = {attack_type: ENEMY_ATTACK_TYPES[attack_type] for attack_type in template["attack_types"]}
+        self.variant_attack_types = {}
+        for variant in VARIANT_TABLE.outcomes:
+            attack_types = dict(self.attack_types)
+            attack_types.update((attack_type, ENEMY_ATTACK_TYPES[attack_type]) for attack_type in variant.additional_attacks)
+            self.variant_attack_types[variant.name] = attack_types
+
+    def roll_stats(self, player):
+        """Roll stats for one enemy, same draws and results as Enemy._calculate_stats_with_debug"""
+        player_level, max_hp, attack_base, defence_base, secondary_bases = player_snapshot(player)
+        choice = random.choice
+        percents = [choice(values) for values in self.percent_values]
         
-        # Keep within tier bounds
-        min_stat = max(min_val, modified_base - variation)
-        max_stat = max(min_stat + 1, min(max_val, modified_base + variation))
+        variant = VARIANT_TABLE.draw() if random.random() < 0.1 else None
+        if variant:
+            percents = [percent if multiplier is None else int(percent * multiplier)
+                        for percent, multiplier in zip(percents, variant.multipliers)]
         
-        stats[stat_name] = random.randint(min_stat, max_stat)
-    
-    return stats
+        below, above = self.level_range
+        level = random.randint(max(1, player_level - below), player_level + above)
+        scale = self.level_scales[level - player_level + below]
+        
+        stats = {
+            'name': f"{variant.name} {self.template['name']}" if variant else self.template['name'],
+            'variant': variant.state() if variant else None,
+            'attack_types': self.variant_attack_types[variant.name] if variant else self.attack_types,
+            'level': level,
+            'hp': int(max_hp * percents[0] / 100),
+            'attack': int(attack_base * ((percents[1] / 100) * scale)),
+            'defence': int(defence_base * ((percents[2] / 100) * scale))
+        }
+        for (stat, _, lowest, highest), base, percent in zip(SECONDARY_STAT_SCALING, secondary_bases, percents[3:]):
+            value = min(highest, int(base * percent / 100))
+            stats[stat] = value if lowest is None else max(lowest, value)
+        
+        stats['exp'] = random.randint(8, 20) * max(1, player_level)
+        stats['gold'] = random.randint(8, 20) * max(1, player_level)
+        if variant:
+            stats['exp'] = int(stats['exp'] * 1.5)
+            if variant.gold_multiplier is not None:
+                stats['gold'] = int(stats['gold'] * variant.gold_multiplier)
+        return stats
+
+    def spawn(self, player):
+        enemy = Enemy(template=self.template, player=player, stats=self.roll_stats(player))
+        enemy.soultype = self.soultype
+        enemy.monster_type = self.monster_type
+        enemy.stat_focus = self.stat_focus  # Store the focus for reference
+        return enemy
+
+# Variants are picked by their relative chance once the 10% variant roll succeeds
+VARIANT_TABLE = AliasTable({CompiledVariant(name, variant): variant["chance"] for name, variant in MONSTER_VARIANTS.items()})
+
+# Templates are compiled the first time each one spawns
+_compiled_templates = {}
+
+def get_compiled_template(enemy_type):
+    if enemy_type not in _compiled_templates:
+        _compiled_templates[enemy_type] = CompiledTemplate(enemy_type, ENEMY_TEMPLATES[enemy_type])
+    return _compiled_templates[enemy_type]
 
 # Helper function to create enemies
-def create_enemy(enemy_type, player=None):
-    """Create a new enemy either from template + player scaling or from ENEMY_TEMPLATES directly"""
+def create_enemy(enemy_type, player=None, debug=False):
+    """Create a new enemy from its ENEMY_TEMPLATES entry scaled to the player.
+
+    Args:
+        enemy_type: ENEMY_TEMPLATES key
+        player: Player the enemy's stats are scaled against
+        debug: Trace this spawn's stat calculation for debug_stat_calculation even when tracing is off
+    """
     if enemy_type in ENEMY_TEMPLATES:
-        template = ENEMY_TEMPLATES[enemy_type]
-        stat_focus = template.get("stat_focus", "balanced")
+        if not (debug or STAT_TRACE.enabled):
+            return get_compiled_template(enemy_type).spawn(player)
         
-        # Generate stats with focus
-        template_stats = generate_balanced_stats(template["tier"], stat_focus)
-        
-        # Create enemy instance
+        template = ENEMY_TEMPLATES[enemy_type]
         enemy = Enemy(template=template, player=player)
         enemy.soultype = template.get("soultype", "standard")
         enemy.monster_type = template.get("monster_type", "unknown")
-        enemy.stat_focus = stat_focus  # Store the focus for reference
+        enemy.stat_focus = template.get("stat_focus", "balanced")  # Store the focus for reference
         #print(enemy.debug_stat_calculation(player))
         return enemy
         
     return None
 
+def benchmark_enemy_creation(player, count=10000, enemy_types=None, debug=False):
+    """Create enemies as fast as possible and return how many were made per second"""
+    enemy_types = list(enemy_types or ENEMY_TEMPLATES)
+    started = time.perf_counter()
+    for i in range(count):
+        create_enemy(enemy_types[i % len(enemy_types)], player, debug=debug)
+    return count / (time.perf_counter() - started)
+
 def guaranteed_drops(min_chance, max_chance, item=[]):
     """Chance for a guaranteed drop of a certain tier item"""
     if random.random < random.randint(min_chance, max_chance):
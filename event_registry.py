@@ -0,0 +1,115 @@
+# event_registry.py
+"""Random event eligibility, indexed once when the events are set up.
+
+Events are bucketed by the location they can happen in and the level they
+unlock at. Each bucket holds the events with no other conditions in a Walker
+alias table, so picking one is a single lookup and draw however many events
+there are. Events that also need an item get a table per item, and each item
+is one lookup in the player's inventory index rather than a check per event.
+Conditions the registry doesn't know fall back to the event's can_occur.
+"""
+import random
+from bisect import bisect_right
+
+from alias_table import AliasTable
+
+INDEXED_CONDITIONS = {"min_level", "location_type"}  # Settled by the bucket an event is in
+
+class WeightedEvents:
+    """An alias table over some events and their combined weight"""
+    def __init__(self, events):
+        weights = {event: event.weight for event in events if event.weight > 0}
+        self.table = AliasTable(weights) if weights else None
+        self.total_weight = sum(weights.values())
+
+    def draw(self):
+        return self.table.draw()
+
+class EventBucket:
+    """Events open to one level range in one location"""
+    def __init__(self, events):
+        self.always = [event for event in events if not event.conditions.keys() - INDEXED_CONDITIONS]
+        self.always_table = WeightedEvents(self.always)
+        # Events that only need an item, grouped so each item is looked up once per pick
+        self.by_item = {}
+        self.checked = []
+        for event in events:
+            extra = event.conditions.keys() - INDEXED_CONDITIONS
+            if extra == {"required_item"}:
+                self.by_item.setdefault(event.conditions["required_item"], []).append(event)
+            elif extra:
+                self.checked.append(event)
+        self.item_tables = {item: WeightedEvents(gated) for item, gated in self.by_item.items()}
+
+    def _available(self, player, location):
+        """Tables for everything the player qualifies for, events with other conditions one by one"""
+        tables = [self.always_table]
+        tables += [table for item, table in self.item_tables.items() if player.inventory.has_item(item)]
+        checked = [event for event in self.checked if event.can_occur(player, location) and event.weight > 0]
+        return tables, checked
+
+    def choose(self, player, location):
+        if not self.by_item and not self.checked:
+            return self.always_table.draw() if self.always_table.table else None
+
+        tables, checked = self._available(player, location)
+        total = sum(table.total_weight for table in tables) + sum(event.weight for event in checked)
+        if total <= 0:
+            return None
+        roll = random.random() * total
+        for table in tables:
+            if roll < table.total_weight:
+                return table.draw()
+            roll -= table.total_weight
+        for event in checked:
+            if roll < event.weight:
+                return event
+            roll -= event.weight
+        # Only reached through float rounding on the last weight
+        return checked[-1] if checked else [table for table in tables if table.table][-1].draw()
+
+    def eligible(self, player, location):
+        available = list(self.always)
+        available += [event for item, gated in self.by_item.items() if player.inventory.has_item(item) for event in gated]
+        available += [event for event in self.checked if event.can_occur(player, location)]
+        return available
+
+class EventRegistry:
+    """Every random event, looked up by location and player level"""
+    ANYWHERE = None  # Bucket key for locations no event names specifically
+
+    def __init__(self, events):
+        self.events = list(events)
+        locations = {location for event in self.events for location in event.conditions.get("location_type") or ()}
+        self._buckets = {}
+        for location in list(locations) + [self.ANYWHERE]:
+            here = [event for event in self.events if self._allowed_in(event, location)]
+            thresholds = sorted({event.conditions.get("min_level", 0) for event in here})
+            self._buckets[location] = (thresholds, [
+                EventBucket([event for event in here if event.conditions.get("min_level", 0) <= threshold])
+                for threshold in thresholds
+            ])
+
+    def __len__(self):
+        return len(self.events)
+
+    @staticmethod
+    def _allowed_in(event, location):
+        allowed = event.conditions.get("location_type")
+        return allowed is None or location in allowed
+
+    def bucket(self, level, location):
+        """Events open at this level and location before any item checks, None if there are none"""
+        thresholds, buckets = self._buckets.get(location, self._buckets[self.ANYWHERE])
+        index = bisect_right(thresholds, level)
+        return buckets[index - 1] if index else None
+
+    def choose(self, player, location):
+        """Weighted pick of an event the player can have here, None if nothing can happen"""
+        bucket = self.bucket(player.level, location)
+        return bucket.choose(player, location) if bucket else None
+
+    def eligible(self, player, location):
+        """Every event the player can have here, what can_occur would allow"""
+        bucket = self.bucket(player.level, location)
+        return bucket.eligible(player, location) if bucket else []
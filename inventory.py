@@ -0,0 +1,92 @@
+# inventory.py
+"""The player's inventory, indexed by item name.
+
+Behaves like the list it replaces: it iterates in the order items were picked
+up and supports append, remove, len, in and indexing. Alongside that it keeps
+each name's stacks and a running total of how many of that item are held, so
+stacking, has_item and quantity don't have to walk the whole inventory.
+
+Items report their own stack_size changes back to the inventory holding them,
+so the totals stay right however a stack is changed. That back-reference is
+why only per-copy items (item.copy()) should go in, never the shared catalog
+items.
+"""
+
+class Inventory:
+    """Items in pickup order with per name stacks and quantities"""
+    def __init__(self, items=()):
+        self._items = {}  # id(item) -> item, dicts keep insertion order
+        self._stacks = {}  # name -> {id(item): item}
+        self._counts = {}  # name -> total stack size
+        for item in items:
+            self.append(item)
+
+    def __iter__(self):
+        # Snapshot so items can be removed while looping, as with the old list
+        return iter(tuple(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return self._items.get(id(item)) is item
+
+    def __getitem__(self, index):
+        return list(self._items.values())[index]
+
+    def __repr__(self):
+        return f"Inventory({list(self._items.values())})"
+
+    def append(self, item):
+        if item in self:
+            # Each copy can only be held once, hand out item.copy() rather than the catalog item
+            raise ValueError(f"This {item.name} is already in the inventory")
+        key = id(item)
+        self._items[key] = item
+        self._stacks.setdefault(item.name, {})[key] = item
+        self._counts[item.name] = self._counts.get(item.name, 0) + item.stack_size
+        item.inventory = self
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item):
+        if item not in self:
+            raise ValueError(f"{item.name} is not in the inventory")
+        key = id(item)
+        del self._items[key]
+        stacks = self._stacks[item.name]
+        del stacks[key]
+        if stacks:
+            self._counts[item.name] -= item.stack_size
+        else:
+            del self._stacks[item.name]
+            del self._counts[item.name]
+        item.inventory = None
+
+    def clear(self):
+        for item in self._items.values():
+            item.inventory = None
+        self._items.clear()
+        self._stacks.clear()
+        self._counts.clear()
+
+    def _stack_changed(self, item, change):
+        """Called by an item in this inventory whenever its stack_size changes"""
+        self._counts[item.name] += change
+
+    def stacks(self, name):
+        """Every stack of the named item, in pickup order"""
+        return tuple(self._stacks.get(name, {}).values())
+
+    def names(self):
+        """Each distinct item name held, in the order it was first picked up"""
+        return tuple(self._stacks)
+
+    def has_item(self, name):
+        return name in self._stacks
+
+    def quantity(self, name):
+        """Total held across every stack of the named item"""
+        return self._counts.get(name, 0)
@@ -0,0 +1,133 @@
+# item_catalog.py
+"""Read-only item catalog with prebuilt lookup indexes.
+
+Loot, shops and event rewards all pick from pools like "consumables of the
+highest tier the player has reached" or "rare weapons". The catalog indexes the
+items by tier, type, effect type, weapon type and level band once, and each
+distinct pool query is worked out the first time it is asked for and then
+handed back as the same shared tuple.
+
+Pools keep the catalog's own item order, so random.choice over a pool picks
+exactly what it did over the old list comprehensions.
+"""
+from bisect import bisect_right
+from collections.abc import Mapping
+
+# Player level each tier of item becomes available at (shops, loot and rewards)
+TIER_LEVELS = {
+    "starter": 1,
+    "common": 1,
+    "uncommon": 3,
+    "rare": 6,
+    "epic": 10,
+    "masterwork": 15,
+    "legendary": 20,
+    "mythical": 25
+}
+
+# Tiers in order of quality, starter items aren't part of the progression
+ITEM_TIERS = ["common", "uncommon", "rare", "epic", "masterwork", "legendary", "mythical"]
+
+EQUIPMENT_TYPES = ["weapon", "helm", "chest", "legs", "boots", "gloves", "shield", "ring"]
+
+# Distinct unlock levels, a player's level band is how many of these they have reached
+_BAND_LEVELS = sorted(set(TIER_LEVELS.values()))
+
+def tier_level(tier):
+    return TIER_LEVELS.get(tier, 1)
+
+def level_band(level):
+    return bisect_right(_BAND_LEVELS, level)
+
+def highest_tier_at(level):
+    """Best item tier unlocked at this level, None below level 1"""
+    highest = None
+    for tier in ITEM_TIERS:
+        if level >= TIER_LEVELS[tier]:
+            highest = tier
+    return highest
+
+def next_tier(tier):
+    """Tier above this one, None for the top tier or tiers outside the progression"""
+    if tier not in ITEM_TIERS:
+        return None
+    index = ITEM_TIERS.index(tier)
+    return ITEM_TIERS[index + 1] if index + 1 < len(ITEM_TIERS) else None
+
+class ItemCatalog(Mapping):
+    """Immutable name to Item mapping that also answers pool queries in O(1)"""
+    # Item attribute each pool() filter reads
+    INDEXED = {"tier": "tier", "item_type": "type", "effect_type": "effect_type", "weapon_type": "weapon_type"}
+
+    def __init__(self, items):
+        self._items = dict(items)
+        self._order = {name: position for position, name in enumerate(self._items)}
+        self._indexes = {}
+        for field, attribute in self.INDEXED.items():
+            index = {}
+            for name, item in self._items.items():
+                index.setdefault(getattr(item, attribute, None), []).append(name)
+            self._indexes[field] = {value: tuple(names) for value, names in index.items()}
+
+        # Names of the items in each level band
+        bands = {}
+        for name, item in self._items.items():
+            bands.setdefault(level_band(tier_level(item.tier)), []).append(name)
+        self._bands = bands
+        self._pools = {}
+
+    def __getitem__(self, name):
+        return self._items[name]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"ItemCatalog({len(self)} items)"
+
+    def pool(self, tier=None, item_type=None, effect_type=None, weapon_type=None, max_level=None):
+        """Items matching every filter given, in catalog order.
+
+        Args:
+            tier: Tier or list of tiers
+            item_type: Item type or list of types
+            effect_type: Effect type or list of effect types
+            weapon_type: Weapon type or list of weapon types
+            max_level: Only items whose tier is available at this player level
+
+        Returns:
+            Tuple shared between every caller asking for the same pool, don't modify the items in it
+        """
+        filters = {"tier": tier, "item_type": item_type, "effect_type": effect_type, "weapon_type": weapon_type}
+        key = tuple(
+            None if value is None else frozenset([value] if isinstance(value, str) else value)
+            for value in filters.values()
+        ) + (None if max_level is None else level_band(max_level),)
+
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._build_pool(dict(zip(filters, key)), key[-1])
+            self._pools[key] = pool
+        return pool
+
+    def _build_pool(self, filters, band):
+        matches = None
+        for field, values in filters.items():
+            if values is None:
+                continue
+            index = self._indexes[field]
+            found = {name for value in values for name in index.get(value, ())}
+            matches = found if matches is None else matches & found
+        if band is not None:
+            found = {name for item_band, names in self._bands.items() if item_band <= band for name in names}
+            matches = found if matches is None else matches & found
+        if matches is None:
+            return tuple(self._items.values())
+        return tuple(self._items[name] for name in sorted(matches, key=self._order.__getitem__))
+
+    def available_at(self, level):
+        """Every item whose tier is unlocked at this player level"""
+        return self.pool(max_level=level)
@@ -0,0 +1,190 @@
+# loot_tables.py
+"""Compiled loot tables.
+
+Every enemy tier, combined with a variant's loot_modifiers, compiles once into
+Walker alias tables over the item catalog. The chance of each item already
+includes the variant's quality boost, so a drop is a single O(1) draw. The
+exact chances can be dumped per tier for balancing.
+
+Example:
+    python loot_tables.py --output loot_probabilities.json
+"""
+import argparse
+import json
+import random
+
+from alias_table import AliasTable
+from item_catalog import ITEM_TIERS, next_tier
+
+# Item tiers each enemy tier drops
+BASE_LOOT_TIERS = {
+    "low": ["common"],
+    "medium": ["uncommon"],
+    "medium-hard": ["uncommon", "rare"],
+    "hard": ["rare", "epic"],
+    "very-hard": ["epic", "masterwork"],
+    "extreme": ["masterwork", "legendary"],
+    "boss": ["legendary", "mythical"]
+}
+
+# Highest item tier a variant's quality boost can add to each enemy tier's drops
+MAX_TIER_UPGRADE = {
+    "low": "rare",
+    "medium": "epic",
+    "medium-hard": "epic",
+    "hard": "legendary",
+    "very-hard": "legendary",
+    "extreme": "mythical",
+    "boss": "mythical"
+}
+
+# Stack size range for stackable drops by item tier, anything else drops singly
+STACK_RANGES = {
+    "common": (1, 3),
+    "uncommon": (1, 2),
+    "rare": (1, 2)
+}
+
+EXTRA_DROP_CHANCE = 0.1  # Chance of each extra drop, rolled until one fails
+MAX_DROPS = 3  # Extra drops stop here, quantity bonuses can still go over it
+
+def loot_tiers(enemy_tier, boosted=False):
+    """Item tiers an enemy drops from, boosted adds the next tier up if the enemy tier allows it"""
+    tiers = list(BASE_LOOT_TIERS.get(enemy_tier, ["common"]))
+    if boosted:
+        upgrade = next_tier(tiers[-1])
+        max_allowed = MAX_TIER_UPGRADE.get(enemy_tier, "rare")
+        if upgrade and ITEM_TIERS.index(upgrade) <= ITEM_TIERS.index(max_allowed):
+            tiers.append(upgrade)
+    return tiers
+
+def drop_count_chances(quantity_bonus=0):
+    """Chance of each number of drops"""
+    count = 1 + quantity_bonus
+    chances = {}
+    chance = 1.0
+    while count < MAX_DROPS:
+        chances[count] = chance * (1 - EXTRA_DROP_CHANCE)
+        chance *= EXTRA_DROP_CHANCE
+        count += 1
+    chances[count] = chance
+    return chances
+
+def stack_size(tier):
+    low, high = STACK_RANGES.get(tier, (1, 1))
+    return random.randint(low, high) if high > low else low
+
+def guaranteed_drop_list(loot_modifiers):
+    """A variant's guaranteed drops as a list, some variants pick a single tier name when enemies.py loads"""
+    guaranteed = (loot_modifiers or {}).get("guaranteed_drops", [])
+    return [guaranteed] if isinstance(guaranteed, str) else list(guaranteed)
+
+class LootTable:
+    """Drops for one enemy tier with one set of variant loot modifiers"""
+    def __init__(self, catalog, enemy_tier, loot_modifiers=None):
+        loot_modifiers = loot_modifiers or {}
+        self.catalog = catalog
+        self.enemy_tier = enemy_tier
+        self.quality_boost = min(1.0, loot_modifiers.get("quality_boost", 0))
+        self.quantity_bonus = loot_modifiers.get("quantity_bonus", 0)
+        self.guaranteed = guaranteed_drop_list(loot_modifiers)
+
+        # The quality boost rolls once per kill for an extra item tier, then again for each drop to upgrade it
+        base_tiers = loot_tiers(enemy_tier)
+        boosted_tiers = loot_tiers(enemy_tier, boosted=True)
+        self.tier_boost_chance = self.quality_boost if boosted_tiers != base_tiers else 0.0
+        self.weights = {False: self._item_weights(base_tiers)}
+        if self.tier_boost_chance:
+            self.weights[True] = self._item_weights(boosted_tiers)
+        self.tables = {boosted: AliasTable(weights) for boosted, weights in self.weights.items() if weights}
+        self.counts = AliasTable(drop_count_chances(self.quantity_bonus))
+
+        # Chance per drop with the per-kill tier boost averaged in, for sample() and probabilities()
+        self.drop_chances = {}
+        for boosted, weights in self.weights.items():
+            share = self.tier_boost_chance if boosted else 1 - self.tier_boost_chance
+            for item, weight in weights.items():
+                self.drop_chances[item] = self.drop_chances.get(item, 0.0) + weight * share
+        self.drop_table = AliasTable(self.drop_chances) if self.drop_chances else None
+
+    def _item_weights(self, tiers):
+        pool = self.catalog.pool(tier=tiers)
+        weights = {}
+        for item in pool:
+            chance = 1 / len(pool)
+            upgrade = next_tier(item.tier)
+            upgrade_pool = self.catalog.pool(tier=upgrade) if upgrade and self.quality_boost else ()
+            if upgrade_pool:
+                for upgraded in upgrade_pool:
+                    weights[upgraded] = weights.get(upgraded, 0.0) + chance * self.quality_boost / len(upgrade_pool)
+                chance *= 1 - self.quality_boost
+            weights[item] = weights.get(item, 0.0) + chance
+        return weights
+
+    def draw(self):
+        """Catalog items dropped by one kill, not counting guaranteed drops"""
+        if not self.tables:
+            return []
+        boosted = bool(self.tier_boost_chance) and random.random() < self.tier_boost_chance
+        table = self.tables[boosted]
+        return [table.draw() for _ in range(self.counts.draw())]
+
+    def sample(self, n):
+        """n independent drops, each from the per-drop chances, for simulation"""
+        if self.drop_table is None:
+            return []
+        draw = self.drop_table.draw
+        return [draw() for _ in range(n)]
+
+    def expected_drops(self):
+        return sum(count * chance for count, chance in drop_count_chances(self.quantity_bonus).items())
+
+    def probabilities(self):
+        """Exact chance that a single drop is each item, by item name"""
+        return {item.name: chance for item, chance in self.drop_chances.items()}
+
+# Compiled tables by catalog, enemy tier and the loot modifiers that change them
+_loot_tables = {}
+
+def get_loot_table(catalog, enemy_tier, loot_modifiers=None):
+    loot_modifiers = loot_modifiers or {}
+    # Each table keeps its catalog alive, so the id can't be reused for another catalog
+    key = (id(catalog), enemy_tier, loot_modifiers.get("quality_boost", 0), loot_modifiers.get("quantity_bonus", 0),
+           tuple(guaranteed_drop_list(loot_modifiers)))
+    if key not in _loot_tables:
+        _loot_tables[key] = LootTable(catalog, enemy_tier, loot_modifiers)
+    return _loot_tables[key]
+
+def loot_report(catalog):
+    """Exact drop chances for every enemy tier, with no variant and with each variant"""
+    from enemies import MONSTER_VARIANTS
+    report = {}
+    for enemy_tier in BASE_LOOT_TIERS:
+        variants = {"none": None}
+        variants.update((name, variant["loot_modifiers"]) for name, variant in MONSTER_VARIANTS.items())
+        report[enemy_tier] = {}
+        for name, loot_modifiers in variants.items():
+            table = get_loot_table(catalog, enemy_tier, loot_modifiers)
+            chances = sorted(table.probabilities().items(), key=lambda entry: entry[1], reverse=True)
+            report[enemy_tier][name] = {
+                "tier_boost_chance": table.tier_boost_chance,
+                "drop_counts": drop_count_chances(table.quantity_bonus),
+                "expected_drops": table.expected_drops(),
+                "guaranteed_drops": table.guaranteed,
+                "items": dict(chances)
+            }
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Dump the exact loot drop chances for every enemy tier and variant")
+    parser.add_argument("--output", default="loot_probabilities.json", help="JSON file to write")
+    args = parser.parse_args()
+
+    from items import initialise_items
+    from item_catalog import ItemCatalog
+    with open(args.output, "w") as file:
+        json.dump(loot_report(ItemCatalog(initialise_items())), file, indent=2)
+    print(f"Loot chances written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,11 @@ from display import *
 from player import Player
 from enemies import create_enemy, Enemy
 from items import initialise_items
+from item_catalog import ItemCatalog
 from shop import Blacksmith, Alchemist, Inn
 from battle import Battle
 from world_map import WorldMap
-from save_system import save_game, load_game, get_save_files
+from save_system import save_game, load_game, get_save_files, save_filename
 from random_events import *
 
 class Game:
@@ -16,13 +17,13 @@ class Game:
         self.player = None
         self.current_location = "Village"
         self.world_map = WorldMap()
-        self.items = initialise_items()
+        self.items = ItemCatalog(initialise_items())
         self.blacksmith = Blacksmith(self.items)
         self.alchemist = Alchemist(self.items)
         self.inn = Inn(self.items)
         self.battle = None
         self.random_events = RandomEventSystem()
-        self.display = Display()
+        self.display = get_display()
         self.display.set_game(self)
         self.battle_display = BattleDisplay(self.display)
         self.config = DisplayConfig()
@@ -315,7 +316,7 @@ class Game:
                 print("No save files found.")
                 return None
             else:
-                return input("Enter a name for your new save file: ") + ".json"
+                return save_filename(input("Enter a name for your new save file: "))
         
         print("Available save files:")
         for i, file in enumerate(save_files, 1):
@@ -330,7 +331,7 @@ class Game:
                 if 1 <= choice <= len(save_files):
                     return save_files[choice - 1]
                 elif not for_loading and choice == len(save_files) + 1:
-                    return input("Enter a name for your new save file: ") + ".json"
+                    return save_filename(input("Enter a name for your new save file: "))
                 else:
                     print("Invalid choice. Please try again.")
             except ValueError:
@@ -377,7 +378,7 @@ class Game:
     
     def handle_game_events(self):
         """Handle game events and player actions"""
-        self.display.draw_game_screen(self.player, self.current_location)
+        self.display.draw_game_screen(self.player, self.current_location, incremental=True)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -389,6 +390,8 @@ class Game:
                 
                 # Process the input and update state
                 action_type = self.process_input(event.key)
+                # Menus opened by the input draw over the overworld, so repaint it fully next frame
+                self.display.invalidate()
                 if action_type == "quit":
                     return self.handle_quit()
                 elif action_type in ["move", "rest", "explore"]:
@@ -500,9 +503,10 @@ class Game:
         
         # Main game loop
         while True:
-            self.display.draw_game_screen(self.player, self.current_location)
+            self.display.draw_game_screen(self.player, self.current_location, incremental=True)
             result = self.handle_game_events()
             if result == "quit":
+                self.autosave_manager.flush()
                 return
             
             self.display.clock.tick(self.display.config.FPS)
@@ -1,9 +1,11 @@
 import pygame
 import random, time
 from items import Item, initialise_items, SoulCrystal
-from display import Display, ItemUseDisplay, InventoryDisplay, BattleDisplay
+from display import Display, get_display, ItemUseDisplay, InventoryDisplay, BattleDisplay
 from game_config import VARIANT_TYPES
 from status_effects import *
+from stat_stack import StatBlock, StatStack, block_property, stat_property, layer_property
+from inventory import Inventory
 
 PLAYER_ATTACK_TYPES = {
     "normal": {
@@ -156,6 +158,36 @@ WEAPON_ATTACK_TYPES = {
 }
 
 class Character:
+    # Base and current stats live in fixed-layout StatBlocks, these keep the old attribute names working
+    base_attack = block_property("base_stats", "attack")
+    base_defence = block_property("base_stats", "defence")
+    base_evasion = block_property("base_stats", "evasion")
+    base_accuracy = block_property("base_stats", "accuracy")
+    base_crit_chance = block_property("base_stats", "crit_chance")
+    base_crit_damage = block_property("base_stats", "crit_damage")
+    base_damage_reduction = block_property("base_stats", "damage_reduction")
+    base_armour_penetration = block_property("base_stats", "armour_penetration")
+    base_block_chance = block_property("base_stats", "block_chance")
+
+    attack = block_property("current_stats", "attack")
+    defence = block_property("current_stats", "defence")
+    evasion = block_property("current_stats", "evasion")
+    accuracy = block_property("current_stats", "accuracy")
+    crit_chance = block_property("current_stats", "crit_chance")
+    crit_damage = block_property("current_stats", "crit_damage")
+    damage_reduction = block_property("current_stats", "damage_reduction")
+    armour_penetration = block_property("current_stats", "armour_penetration")
+    block_chance = block_property("current_stats", "block_chance")
+
+    @property
+    def status_effects(self):
+        return self._status_effects
+
+    @status_effects.setter
+    def status_effects(self, effects):
+        # Plain lists (from a save or a filter) are indexed into an EffectStore
+        self._status_effects = effects if isinstance(effects, EffectStore) else EffectStore(effects)
+
     def __init__(self, name, hp, attack, defence, accuracy=70, evasion=5, crit_chance=5, crit_damage=150, armour_penetration=0, damage_reduction=0, block_chance=0):
         # Initialize basic character attributes
         self.name = name
@@ -166,41 +198,20 @@ class Character:
             "normal": {"name": "Normal Attack", "stamina_modifier": 0, "damage_modifier": 1},
         }
         # Base stats
-        self.base_attack = attack
-        self.base_defence = defence
-        self.base_accuracy = accuracy
-        self.base_evasion = evasion
-        self.base_crit_chance = crit_chance
-        self.base_crit_damage = crit_damage
-        self.base_armour_penetration = armour_penetration
-        self.base_damage_reduction = damage_reduction
-        self.base_block_chance = block_chance
+        self.base_stats = StatBlock(attack=attack, defence=defence, accuracy=accuracy, evasion=evasion,
+                                    crit_chance=crit_chance, crit_damage=crit_damage, armour_penetration=armour_penetration,
+                                    damage_reduction=damage_reduction, block_chance=block_chance)
         # Current stats (will be calculated)
-        self.attack = attack
-        self.defence = defence
-        self.accuracy = accuracy
-        self.evasion = evasion
-        self.crit_chance = crit_chance
-        self.crit_damage = crit_damage
-        self.armour_penetration = armour_penetration
-        self.damage_reduction = damage_reduction
-        self.block_chance = block_chance
+        self.current_stats = self.base_stats.copy()
         self.stunned = False
         self.confused = False
         self.status_effects = []
-        self.display = Display()
         self.pause = Display.pause
         self.title_screen = Display.display_title
-        self.battle_display = BattleDisplay(self.display)
-        self.buff_modifiers = {"attack": 0, "defence": 0, "accuracy": 0, "evasion": 0, 
-                              "crit_chance": 0, "crit_damage": 0, "armour_penetration": 0, 
-                              "damage_reduction": 0, "block_chance": 0}
-        self.combat_buff_modifiers = {"attack": 0, "defence": 0, "accuracy": 0, "evasion": 0, 
-                                     "crit_chance": 0, "crit_damage": 0, "armour_penetration": 0, 
-                                     "damage_reduction": 0, "block_chance": 0}
-        self.debuff_modifiers = {"attack": 0, "defence": 0, "accuracy": 0, "evasion": 0, 
-                                "crit_chance": 0, "crit_damage": 0, "armour_penetration": 0, 
-                                "damage_reduction": 0, "block_chance": 0}
+        self._battle_display = None
+        self.buff_modifiers = StatBlock()
+        self.combat_buff_modifiers = StatBlock()
+        self.debuff_modifiers = StatBlock()
         
     def show_stats(self):
         # Show basic stats
@@ -299,6 +310,21 @@ class Character:
         else:
             other_buffs.append(buff_str)
     
+    @property
+    def display(self):
+        # Looked up lazily so characters can be created without opening a window
+        return get_display()
+
+    @property
+    def battle_display(self):
+        if self._battle_display is None:
+            self._battle_display = BattleDisplay(self.display)
+        return self._battle_display
+
+    @battle_display.setter
+    def battle_display(self, battle_display):
+        self._battle_display = battle_display
+
     def apply_special_effects(self, attacker, defender):
         """Apply any special combat modifiers based on the target"""
         modifiers = {}
@@ -405,120 +431,6 @@ class Character:
         
         return damage, "critical" if is_critical else "normal", hit_chance, shattered_stun
 
-    def perform_attack(self, target, attack_type):
-        from enemies import ENEMY_ATTACK_TYPES
-        # Check to see who is attacking
-        if isinstance(self, Player):
-            attack_info = PLAYER_ATTACK_TYPES[attack_type]
-            self.battle_display.display_attack_animation(self.name, attack_info['name'])
-        else:  # Enemy attacker
-            attack_info = ENEMY_ATTACK_TYPES[attack_type]
-            self.battle_display.display_attack_animation(self.name, attack_info['name'], is_player=False)
-        message = f"{self.name} used {attack_info['name']}."
-        total_damage = 0
-        hits = 1 + attack_info.get("extra_attacks", 0)
-        attack_hit = False
-        shattered_freeze = False
-        successful_hits = 0 # Track successful hits for weapon_coating effects
-        
-        # Apply attack-specific buffs before damage calculation (player only)
-        if isinstance(self, Player) and 'stat_buffs' in attack_info:
-            self.apply_attack_buffs(attack_info['stat_buffs'])
-
-        for i in range(hits):
-            damage, hit_type, hit_chance, freeze_shatter = self.calculate_damage(self, target, attack_type)
-            shattered_freeze = shattered_freeze or freeze_shatter
-            
-            # Display hit animation and damage
-            self.battle_display.display_damage_numbers(target, damage, hit_type, isinstance(self, Player))
-            
-            # Handle self_damage display
-            if attack_info.get('effect') == 'self_damage':
-                self_damage = int(damage * 0.2)  # 20% of the damage dealt
-                self.battle_display.display_damage_numbers(self, self_damage, "self_damage", isinstance(self, Player), True)
-            
-            if hit_type == "miss":
-                message += f"\n{self.name}'s attack missed {target.name}!"
-            elif hit_type == "blocked":
-                message += f"\n{self.name}'s attack was blocked by {target.name}!"
-            else:
-                attack_hit = True
-                target.take_damage(damage)
-                total_damage += damage
-                if damage > 0:
-                    successful_hits += 1 # Increment by 1 on successful hit
-                if i == 0:
-                    message += f"\n{self.name} dealt {damage} damage to {target.name}!"
-                else:
-                    message += f"\n{self.name} dealt an additional {damage} damage to {target.name}!"
-                
-                if hit_type == "critical":
-                    message += " Critical hit!"
-                    shattered_freeze = True
-                    if "Freeze" in [effect.name for effect in target.status_effects] and shattered_freeze:
-                        target.remove_status_effect("Freeze")
-                        message += "\nThe frozen state shatters with the critical hit!"
-                
-                if attack_info.get('effect') == 'self_damage':
-                    # Create red flash for self damage
-                    self_damage = int(damage * 0.2)
-                    layout = self.battle_display.layout['battle_panel']
-                    width, height, x, y = layout
-                    original_surface = self.battle_display.display.screen.copy()
-                    flash_surface = pygame.Surface((width, height))
-                    flash_surface.fill((255, 0, 0))
-                    
-                    for _ in range(3):
-                        # Show flash
-                        for alpha in range(0, 128, 32): # Fade in
-                            flash_surface.set_alpha(alpha)
-                            self.battle_display.display.screen.blit(original_surface, (0, 0))
-                            self.battle_display.display.screen.blit(flash_surface, (x, y))
-                            self.display.draw_text(f"{self.name} takes {self_damage} damage as recoil from their {attack_info['name']} attack!", 
-                                                   (x + width // 2, y + height // 5), 'large', 'white', center=True)
-                            pygame.display.flip()
-                            pygame.time.wait(100)
-                            
-                        for alpha in range(128, 0, -32): # Fade out
-                            flash_surface.set_alpha(alpha)
-                            self.battle_display.display.screen.blit(original_surface, (0, 0))
-                            self.battle_display.display.screen.blit(flash_surface, (x, y))
-                            self.display.draw_text(f"{self.name} takes {self_damage} damage as recoil from their {attack_info['name']} attack!", 
-                                                   (x + width // 2, y + height // 5), 'large', 'white', center=True)
-                            pygame.display.flip()
-                            pygame.time.wait(100)
-                        
-                        self.battle_display.display.screen.blit(original_surface, (0, 0))
-                        pygame.display.flip()
-                    
-        if total_damage > 0 and hits > 1:
-            message += f"\nTotal damage dealt: {total_damage}"
-
-        #self.battle_display.display_attack_animation(self.name, attack_info['name'])
-        
-        #print(message.rstrip())
-                
-        if isinstance(self, Player) and self.weapon_coating and successful_hits > 0:
-            total_stacks = self.weapon_coating['stacks'] * successful_hits
-            message += f"\n{target.name} is poisoned by your coated weapon!"
-            message += f"\n({successful_hits} hits, {total_stacks} total poison stacks)"
-            poison_effect = POISON(
-                duration=self.weapon_coating['duration'],
-                strength= total_stacks
-            )
-            target.apply_status_effect(poison_effect)
-        
-        if isinstance(self, Player) and successful_hits > 0:
-            self.update_weapon_buff()
-        
-        self.remove_status_effect("Freeze")
-        
-        # Remove attack-specific buffs after damage calculation (player only)
-        if isinstance(self, Player) and 'stat_buffs' in attack_info:
-            self.remove_attack_buffs(attack_info['stat_buffs'])
-
-        return message, total_damage, None, attack_hit
-
     def is_alive(self):
         # Check if character is still alive
         return self.hp > 0
@@ -535,7 +447,7 @@ class Character:
     def apply_status_effect(self, new_effect):
         #print("Battle display object:", self.battle_display)
         #print("Trying to draw message")
-        existing_effect = next((e for e in self.status_effects if e.name == new_effect.name), None)
+        existing_effect = self.status_effects.get(new_effect.name)
         
         if existing_effect:
             #print(f"DEBUG: Updating existing effect: {existing_effect.name}")
@@ -576,18 +488,11 @@ class Character:
         return True
 
     def update_status_effects(self, character):
-        for effect in character.status_effects[:]:
-            if effect.is_active:
-                is_active, remove_message = effect.update(character)
-                if not is_active:
-                    if remove_message:
-                        print(remove_message)
-                    self.remove_status_effect(effect.name)
-            else:
-                self.remove_status_effect(effect.name)
+        for remove_message in character.status_effects.tick(character):
+            print(remove_message)
    
     def remove_status_effect(self, effect_name):
-        self.status_effects = [e for e in self.status_effects if e.name != effect_name]
+        self.status_effects.remove(effect_name)
 
     def get_status_effects_display(self):
         return ", ".join(str(effect) for effect in self.status_effects)
@@ -663,12 +568,40 @@ class Character:
             setattr(self, stat, value)
         
 class Player(Character):
+    # Final stats are read from the stat stack, which keeps a running total of every modifier layer
+    attack = stat_property("attack")
+    defence = stat_property("defence")
+    evasion = stat_property("evasion")
+    accuracy = stat_property("accuracy")
+    crit_chance = stat_property("crit_chance")
+    crit_damage = stat_property("crit_damage")
+    damage_reduction = stat_property("damage_reduction")
+    armour_penetration = stat_property("armour_penetration")
+    block_chance = stat_property("block_chance")
+
+    level_modifiers = layer_property("level_modifiers", rounding=2)
+    equipment_modifiers = layer_property("equipment_modifiers")
+    buff_modifiers = layer_property("buff_modifiers")
+    combat_buff_modifiers = layer_property("combat_buff_modifiers")
+    weapon_buff_modifiers = layer_property("weapon_buff_modifiers")
+    debuff_modifiers = layer_property("debuff_modifiers", debuff=True)
+
+    @property
+    def inventory(self):
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, items):
+        # Plain lists (from a save or a filter) are indexed into an Inventory
+        self._inventory = items if isinstance(items, Inventory) else Inventory(items)
+
     def __init__(self, name):
         # Initialise player with default stats
+        self._stat_stack = StatStack()
         super().__init__(name, hp=100, attack=10, defence=5, accuracy=70, evasion=5, crit_chance=5, crit_damage=0, armour_penetration=0, damage_reduction=0, block_chance=5)
         self.days = 1
         self.level = 1
-        self.inventory = []
+        self.inventory = Inventory()
         self.max_stamina = 100
         self.stamina = self.max_stamina
         self.exp = 0
@@ -739,7 +672,7 @@ class Player(Character):
         
         # Display items one by one with animation
         for i, item_name in enumerate(starter_items):
-            item = self.items[item_name]
+            item = self.items[item_name].copy()
             self.inventory.append(item)
             
             # Calculate position
@@ -799,52 +732,7 @@ class Player(Character):
             self.level_up()
     
     def level_up(self):
-        # Capture previous stats for comparison
-        old_stats = {
-            'max_hp': self.max_hp,
-            'attack': self.attack,
-            'defence': self.defence,
-            'accuracy': self.accuracy,
-            'evasion': self.evasion,
-            'crit_chance': self.crit_chance,
-            'crit_damage': self.crit_damage,
-            'armour_penetration': self.armour_penetration,
-            'damage_reduction': self.damage_reduction,
-            'block_chance': self.block_chance,
-            'max_stamina': self.max_stamina
-        }
-        
-        # Increase player stats on level up
-        self.level += 1
-        max_hp = random.randint(40, 60)
-        self.max_hp += max_hp
-        self.hp = self.max_hp
-        attack = random.randint(2, 5)
-        self.level_modifiers["attack"] += attack
-        defence = random.randint(1, 4)
-        self.level_modifiers["defence"] += defence
-        accuracy = random.randint(2, 4)
-        self.level_modifiers["accuracy"] += accuracy
-        evasion = round(random.uniform(0.5, 1.5), 1)
-        self.level_modifiers["evasion"] += evasion
-        crit_chance = random.randint(1, 2)
-        self.level_modifiers["crit_chance"] += crit_chance
-        crit_damage = random.randint(2, 4)
-        self.level_modifiers["crit_damage"] += crit_damage
-        armour_penetration = 1
-        self.level_modifiers["armour_penetration"] += armour_penetration
-        damage_reduction = 1
-        self.level_modifiers["damage_reduction"] += damage_reduction
-        block_chance = round(random.uniform(0.5, 1.5), 1)
-        self.level_modifiers["block_chance"] += block_chance
-        self.max_stamina += 10
-        stamina_restore = self.max_stamina // 4
-        self.restore_stamina(stamina_restore)
-        
-        # Update equipment stats and remaining exp
-        self.update_equipment_stats()
-        self.exp = self.exp // 4
-        self.recalculate_stats()
+        old_stats, gains = self.apply_level_gains()
         
         # Get layout of main panel
         layout = self.display.calculate_layout()
@@ -875,16 +763,16 @@ class Player(Character):
         base_y += 50
         
         stat_changes = [
-            (f"Max HP: {old_stats['max_hp']} -> {self.max_hp}", max_hp),
-            (f"Attack: {old_stats['attack']} -> {self.attack}", attack),
-            (f"Accuracy: {old_stats['accuracy']} -> {self.accuracy}", accuracy),
-            (f"Armour Penetration: {old_stats['armour_penetration']} -> {self.armour_penetration}", armour_penetration),
-            (f"Crit Chance: {old_stats['crit_chance']} -> {self.crit_chance}", crit_chance),
-            (f"Crit Damage: {old_stats['crit_damage']} -> {self.crit_damage}", crit_damage),
-            (f"Defence: {old_stats['defence']} -> {self.defence}", defence),
-            (f"Evasion: {old_stats['evasion']} -> {self.evasion}", evasion),
-            (f"Block Chance: {old_stats['block_chance']} -> {self.block_chance}", block_chance),
-            (f"Damage Reduction: {old_stats['damage_reduction']} -> {self.damage_reduction}", damage_reduction),
+            (f"Max HP: {old_stats['max_hp']} -> {self.max_hp}", gains['max_hp']),
+            (f"Attack: {old_stats['attack']} -> {self.attack}", gains['attack']),
+            (f"Accuracy: {old_stats['accuracy']} -> {self.accuracy}", gains['accuracy']),
+            (f"Armour Penetration: {old_stats['armour_penetration']} -> {self.armour_penetration}", gains['armour_penetration']),
+            (f"Crit Chance: {old_stats['crit_chance']} -> {self.crit_chance}", gains['crit_chance']),
+            (f"Crit Damage: {old_stats['crit_damage']} -> {self.crit_damage}", gains['crit_damage']),
+            (f"Defence: {old_stats['defence']} -> {self.defence}", gains['defence']),
+            (f"Evasion: {old_stats['evasion']} -> {self.evasion}", gains['evasion']),
+            (f"Block Chance: {old_stats['block_chance']} -> {self.block_chance}", gains['block_chance']),
+            (f"Damage Reduction: {old_stats['damage_reduction']} -> {self.damage_reduction}", gains['damage_reduction']),
             (f"Max Stamina: {old_stats['max_stamina']} -> {self.max_stamina}", 10)
         ]
         
@@ -905,6 +793,63 @@ class Player(Character):
         """self.battle_display.draw_battle_message(f"Congratulations! You reached level {self.level}!")
         self.battle_display.draw_battle_message(f"Your stats have increased:\nAttack: +{attack}\nDefence: +{defence}\nEvasion: +{evasion}\nAccuracy: +{accuracy}\nCrit Chance: +{crit_chance}%\nCrit Damage: +{crit_damage}%\nArmour Pentration: +{armour_penetration}\nDamage Reduction: +{damage_reduction}\nBlock Chance: +{block_chance}%")"""
     
+    def apply_level_gains(self):
+        """Roll and apply the stat increases for a new level, returns the old stats and the gains"""
+        # Capture previous stats for comparison
+        old_stats = {
+            'max_hp': self.max_hp,
+            'attack': self.attack,
+            'defence': self.defence,
+            'accuracy': self.accuracy,
+            'evasion': self.evasion,
+            'crit_chance': self.crit_chance,
+            'crit_damage': self.crit_damage,
+            'armour_penetration': self.armour_penetration,
+            'damage_reduction': self.damage_reduction,
+            'block_chance': self.block_chance,
+            'max_stamina': self.max_stamina
+        }
+        
+        # Increase player stats on level up
+        self.level += 1
+        max_hp = random.randint(40, 60)
+        self.max_hp += max_hp
+        self.hp = self.max_hp
+        attack = random.randint(2, 5)
+        self.level_modifiers["attack"] += attack
+        defence = random.randint(1, 4)
+        self.level_modifiers["defence"] += defence
+        accuracy = random.randint(2, 4)
+        self.level_modifiers["accuracy"] += accuracy
+        evasion = round(random.uniform(0.5, 1.5), 1)
+        self.level_modifiers["evasion"] += evasion
+        crit_chance = random.randint(1, 2)
+        self.level_modifiers["crit_chance"] += crit_chance
+        crit_damage = random.randint(2, 4)
+        self.level_modifiers["crit_damage"] += crit_damage
+        armour_penetration = 1
+        self.level_modifiers["armour_penetration"] += armour_penetration
+        damage_reduction = 1
+        self.level_modifiers["damage_reduction"] += damage_reduction
+        block_chance = round(random.uniform(0.5, 1.5), 1)
+        self.level_modifiers["block_chance"] += block_chance
+        self.max_stamina += 10
+        stamina_restore = self.max_stamina // 4
+        self.restore_stamina(stamina_restore)
+        
+        # Update equipment stats and remaining exp
+        self.update_equipment_stats()
+        self.exp = self.exp // 4
+        self.recalculate_stats()
+        
+        gains = {
+            'max_hp': max_hp, 'attack': attack, 'defence': defence, 'accuracy': accuracy,
+            'evasion': evasion, 'crit_chance': crit_chance, 'crit_damage': crit_damage,
+            'armour_penetration': armour_penetration, 'damage_reduction': damage_reduction,
+            'block_chance': block_chance, 'max_stamina': 10
+        }
+        return old_stats, gains
+
     def lose_level(self):
         if self.level <= 1:
             # Display level 1 message
@@ -1092,6 +1037,11 @@ class Player(Character):
                 print(f"   {enemy}: {count}")
     
     def recalculate_stats(self):
+        # Modifier changes already reach the stat stack as deltas, just make sure the next read is up to date
+        self._stat_stack.dirty = True
+
+    def rebuild_stats(self):
+        """Work out every stat from scratch, used to check the incremental totals in debug mode"""
         # Initialize stats with base values
         stats = {
             "attack": self.base_attack,
@@ -1126,7 +1076,7 @@ class Player(Character):
             # Subtract debuff modifiers
             stats[stat] = max(0, stats[stat] - self.debuff_modifiers.get(stat, 0))
 
-        # Update character stats with calculated values
+        # Clamp the calculated values
         for stat, value in stats.items():
             if stat == "crit_damage":
                 value = max(100, value)
@@ -1134,14 +1084,15 @@ class Player(Character):
                 value = max(0, value)
             else:
                 value = max(1, value)
-            setattr(self, stat, value)
+            stats[stat] = value
 
         # Ensure crit_chance and crit_damage stay within reasonable bounds
-        self.crit_chance = max(0, min(100, self.crit_chance))
-        self.crit_damage = max(100, self.crit_damage)  # Minimum 100% crit damage
+        stats["crit_chance"] = max(0, min(100, stats["crit_chance"]))
+        stats["crit_damage"] = max(100, stats["crit_damage"])  # Minimum 100% crit damage
+        return stats
     
     def cleanup_after_battle(self):
-        for effect in self.status_effects[:]:
+        for effect in self.status_effects:
             effect.on_remove(self)
             self.remove_status_effect(effect.name)
         
@@ -1155,7 +1106,7 @@ class Player(Character):
                     del self.soul_crystal_effects[effect_name]
                     print(f"The {effect_name} effect has worn off!")
         self.debuff_modifiers = {"attack": 0, "defence": 0, "accuracy": 0, "evasion": 0, "crit_chance": 0, "crit_damage": 0, "armour_penetration": 0, "damage_reduction": 0, "block_chance": 0}
-        self.recalculate_stats()
+        self._stat_stack.rebuild()  # Once a battle, clear any float drift from the running totals
     
     def show_soul_crystal_effects(self):
         if not self.soul_crystal_effects:
@@ -1312,7 +1263,7 @@ class Player(Character):
     
     def apply_defensive_stance(self, duration, boost_percentage):
         """Apply defensive stance with specified duration and boost percentage"""
-        existing_effect = next((effect for effect in self.status_effects if effect.name == "Defensive Stance"), None)
+        existing_effect = self.status_effects.get("Defensive Stance")
         if existing_effect:
             existing_effect.reset_duration()
         else:
@@ -1321,7 +1272,7 @@ class Player(Character):
 
     def apply_power_stance(self, duration, boost_percentage):
         """Apply power stance with specified duration and boost percentage"""
-        existing_effect = next((effect for effect in self.status_effects if effect.name == "Power Stance"), None)
+        existing_effect = self.status_effects.get("Power Stance")
         if existing_effect:
             existing_effect.reset_duration()
         else:
@@ -1330,7 +1281,7 @@ class Player(Character):
 
     def apply_berserker_stance(self, duration, boost_percentage):
         """Apply berserker stance with specified duration and boost percentage"""
-        existing_effect = next((effect for effect in self.status_effects if effect.name == "Berserker Stance"), None)
+        existing_effect = self.status_effects.get("Berserker Stance")
         if existing_effect:
             existing_effect.reset_duration()
         else:
@@ -1339,7 +1290,7 @@ class Player(Character):
 
     def apply_accuracy_stance(self, duration, boost_percentage):
         """Apply accuracy stance with specified duration and boost percentage"""
-        existing_effect = next((effect for effect in self.status_effects if effect.name == "Accuracy Stance"), None)
+        existing_effect = self.status_effects.get("Accuracy Stance")
         if existing_effect:
             existing_effect.reset_duration()
         else:
@@ -1348,7 +1299,7 @@ class Player(Character):
 
     def apply_evasion_stance(self, duration, boost_percentage):
         """Apply evasion stance with specified duration and boost percentage"""
-        existing_effect = next((effect for effect in self.status_effects if effect.name == "Evasion Stance"), None)
+        existing_effect = self.status_effects.get("Evasion Stance")
         if existing_effect:
             existing_effect.reset_duration()
         else:
@@ -1466,8 +1417,8 @@ class Player(Character):
             return
             
         # Try to stack with existing items
-        for inv_item in self.inventory:
-            if inv_item.name == item.name and inv_item.is_stackable():
+        for inv_item in self.inventory.stacks(item.name):
+            if inv_item.is_stackable():
                 # Check if we can add to this stack
                 space_in_stack = inv_item.max_stack - inv_item.stack_size
                 if space_in_stack > 0:
@@ -1492,13 +1443,12 @@ class Player(Character):
             self.inventory.remove(item)
             return item
         
-        for inv_item in self.inventory:
-            if inv_item.name == item.name:
-                if inv_item.stack_size <= amount:
-                    self.inventory.remove(inv_item)
-                    return inv_item
-                else:
-                    return inv_item.split_stack(amount)
+        for inv_item in self.inventory.stacks(item.name):
+            if inv_item.stack_size <= amount:
+                self.inventory.remove(inv_item)
+                return inv_item
+            else:
+                return inv_item.split_stack(amount)
                 
         return None
         
@@ -1872,7 +1822,7 @@ class Player(Character):
         available_attacks = {}
         
         # Check if any stance is active
-        active_stance = any(effect.name.endswith("Stance") for effect in self.status_effects)
+        active_stance = any(self.status_effects.of_type(StanceEffect))
         
         # Add each available attack, filtering out stances if one is active
         for name in available_attack_names:
@@ -1,7 +1,9 @@
 from enemies import Enemy, create_enemy, get_type_for_monster
 from game_config import MONSTER_TYPES
 from items import create_soulbound_item, SoulCrystal, BossResonance, VariantAffinity, SoulEcho, ElementalResonance, SoulboundItem
-from display import Display, RandomEventDisplay, ComplexEventDisplay, VisualInput
+from display import Display, get_display, RandomEventDisplay, ComplexEventDisplay, VisualInput
+from item_catalog import EQUIPMENT_TYPES, highest_tier_at
+from event_registry import EventRegistry
 from enum import Enum
 import random
 import pygame
@@ -12,14 +14,15 @@ class EventType(Enum):
     DANGEROUS = "dangerous"
     
 class RandomEvent:
-    def __init__(self, name, description, event_type, choices, conditions=None):
-        self.display = Display()
+    def __init__(self, name, description, event_type, choices, conditions=None, weight=1):
+        self.display = get_display()
         self.clear_screen = Display.clear_screen
         self.name = name
         self.description = description
         self.event_type = event_type
         self.choices = choices # List of tuples (choice_text, outcome_func)
         self.conditions = conditions or {} # Dictionary of requirements
+        self.weight = weight # How likely this event is next to the others it can happen alongside
         self.create_enemy = create_enemy
         
     def can_occur(self, player, location):
@@ -30,7 +33,7 @@ class RandomEvent:
             elif condition == "location_type" and location not in value:
                 return False
             elif condition == "required_item":
-                if not any(item.name == value for item in player.inventory):
+                if not player.inventory.has_item(value):
                     return False
                 
         return True
@@ -54,6 +57,7 @@ class RandomEvent:
 class RandomEventSystem:
     def __init__(self):
         self.events = self._initialise_events()
+        self.registry = EventRegistry(self.events)
         
     def _initialise_events(self):
         """Initialise all possible random events."""
@@ -357,14 +361,10 @@ class RandomEventSystem:
         """Attempt to trigger an event"""
         # 15% chance for a random event
         if random.random() < 0.15:
-            # Filter eligible events
-            eligible_events = [
-                event for event in self.events
-                if event.can_occur(player, game.current_location)
-            ]
+            # Weighted pick from the events indexed for this location and level
+            event = self.registry.choose(player, game.current_location)
             
-            if eligible_events:
-                event = random.choice(eligible_events)
+            if event is not None:
                 self._run_event(event, player, game)
                 return True
         
@@ -1036,15 +1036,11 @@ class RandomEventSystem:
         self._consume_selected_souls(player, selected_souls)
         
         # Get equipment of appropriate tier
-        equipment = [
-            item for item in game.items.values()
-            if item.type in ["weapon", "helm", "chest", "legs", "boots", "gloves", "shield", "ring"]
-            and item.tier == selected_tier
-        ]
+        equipment = game.items.pool(item_type=EQUIPMENT_TYPES, tier=selected_tier)
         
         if equipment:
             item = random.choice(equipment)
-            player.add_item(item)
+            player.add_item(item.copy())
             event_display.show_outcome(f"Souls forged into a {item.name} ({item.tier.title()})!")
                 
     def _trade_souls_for_consumables(self, player, game, total_souls, reward_scale, game_display):
@@ -1320,7 +1316,7 @@ class RandomEventSystem:
     def _outcome_forge_challenge(self, player, game):
         """Challenge the forge's guardian for greater rewards"""
         event_display = ComplexEventDisplay(game.display)
-        self.display = Display()
+        self.display = get_display()
         
         if player.stamina < (player.max_stamina * 0.5):
             event_display.show_outcome("You're too exhausted to face this challenge!")
@@ -1545,7 +1541,7 @@ class RandomEventSystem:
         """Select souls for trading using VisualInput for quantity"""
         event_display = ComplexEventDisplay(game_display)
         visual_input = VisualInput(game_display)
-        self.display = Display()
+        self.display = get_display()
         
         max_souls_limits = {
             'stats': 500,
@@ -1856,9 +1852,7 @@ class RandomEventSystem:
         target_tier = tier_mapping.get(quality, "rare")
         
         # Find valid base items
-        valid_items = [item for item in game.items.values()
-                    if item.type == equipment_type
-                    and item.tier == target_tier]
+        valid_items = game.items.pool(item_type=equipment_type, tier=target_tier)
         
         if not valid_items:
             print("No suitable equipment found!")
@@ -2787,11 +2781,10 @@ class RandomEventSystem:
                 # Give potion based on chain count
                 rarity_tiers = ["uncommon", "rare", "epic", "masterwork", "legendary"]
                 if chain_count < len(rarity_tiers):
-                    consumables = [item for item in game.items.values()
-                                    if item.type == "consumable" and item.tier == rarity_tiers[chain_count]]
+                    consumables = game.items.pool(item_type="consumable", tier=rarity_tiers[chain_count])
                     if consumables:
                         item = random.choice(consumables)
-                        player.add_item(item)
+                        player.add_item(item.copy())
                         event_display.show_outcome(f"The storms power crystalizes into {item.name}!",
                                                    2000)
                 chain_count += 1
@@ -2925,22 +2918,18 @@ class RandomEventSystem:
         
     def _give_random_consumable(self, player, game, level):
         """Gives player a random consumable"""
-        consumables = [item for item in game.items.values()
-                       if item.type in ["consumable", "food", "drink"]
-                       and self._is_appropriate_tier(item, level)]
+        consumables = self._appropriate_tier_pool(game, level, item_type=["consumable", "food", "drink"])
         if consumables:
             item = random.choice(consumables)
-            player.add_item(item)
+            player.add_item(item.copy())
             print(f"You acquired a {item.name} ({item.tier.title()})!")
             
     def _give_specific_consumable(self, player, game, level, type, effect_type):
         """Gives player a specific consumable type"""
-        consumables = [item for item in game.items.values()
-                       if item.type in type and item.effect_type in effect_type
-                       and self._is_appropriate_tier(item, level)]
+        consumables = self._appropriate_tier_pool(game, level, item_type=type, effect_type=effect_type)
         if consumables:
             item = random.choice(consumables)
-            player.add_item(item)
+            player.add_item(item.copy())
             print(f"You acquired a {item.name} ({item.tier.title()})!")
      
     def _give_multiple_consumables_random(self, player, game, count):
@@ -2954,22 +2943,19 @@ class RandomEventSystem:
             
     def _give_tier_equipment(self, player, game, level):
         """Gives player a random piece of equipment appropriate to level"""
-        equipment = [item for item in game.items.values()
-                     if item.type in ["weapon", "helm", "chest", "legs", "boots", "gloves", "shield", "ring"]
-                     and self._is_appropriate_tier(item, level)]
+        equipment = self._appropriate_tier_pool(game, level, item_type=EQUIPMENT_TYPES)
         if equipment:
             item = random.choice(equipment)
-            player.add_item(item)
+            player.add_item(item.copy())
             print(f"You gained a {item.name}")
     
     def _give_special_item(self, player, game, *args):
         """Gives a special rare item"""
-        special_items = [item for item in game.items.values()
-                         if item.tier in ["masterwork", "legendary"]]
+        special_items = game.items.pool(tier=["masterwork", "legendary"])
         
         if special_items:
             item = random.choice(special_items)
-            player.add_item(item)
+            player.add_item(item.copy())
             if args:
                 print(*args)
             print(f"You receive something special: {item.name} ({item.tier.title()})!")
@@ -3417,23 +3403,13 @@ class RandomEventSystem:
                             
     def _is_appropriate_tier(self, item, level):
         """Check if item tier is appropriate for level"""
-        tier_levels = {
-            "common": 1,
-            "uncommon": 3,
-            "rare": 6,
-            "epic": 10,
-            "masterwork": 15,
-            "legendary": 20,
-            "mythical": 25
-        }
-        # Find the highest tier available at player's level
-        highest_available_tier = None
-        for tier, req_level in tier_levels.items():
-            if level >= req_level:
-                highest_available_tier = tier
-                
         # Return true only if item is of the highest available tier
-        return item.tier == highest_available_tier
+        return item.tier == highest_tier_at(level)
+    
+    def _appropriate_tier_pool(self, game, level, **filters):
+        """Catalog items matching the filters that are of the highest tier available at the level"""
+        tier = highest_tier_at(level)
+        return game.items.pool(tier=tier, **filters) if tier else ()
     
     """def _pause(self):
         input("Press Enter to continue...")"""
\ No newline at end of file
@@ -0,0 +1,64 @@
+# save_benchmark.py
+"""Compares the json and binary save formats on a late game character.
+
+Builds a levelled player carrying a large inventory of catalog items, a share of
+them with their own changed stats like event rewards, then times saving and
+loading in each format and reports the size of each file.
+
+Example:
+    python save_benchmark.py --items 2000 --level 30
+"""
+import argparse
+import random
+import time
+
+from battle_simulator import build_player, load_game_modules
+
+def fill_inventory(player, count, changed_share, seed):
+    """Give the player count items picked from the catalog, changed_share of them with their own stats"""
+    rng = random.Random(seed)
+    catalog = list(player.items.values())
+    for _ in range(count):
+        item = rng.choice(catalog).copy()
+        if item.is_stackable():
+            item.stack_size = rng.randint(1, item.max_stack)
+        elif rng.random() < changed_share:
+            item.value = int(item.value * 1.5)
+            item.attack = (item.attack or 0) + rng.randint(1, 5)
+        player.inventory.append(item)
+
+def time_format(player, location, save_format, repeats):
+    from save_system import build_save_data, encode_save_data, decode_save_data, load_save_data
+    start = time.perf_counter()
+    for _ in range(repeats):
+        data = encode_save_data(build_save_data(player, location), save_format)
+    save_time = (time.perf_counter() - start) / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        load_save_data(decode_save_data(data))
+    load_time = (time.perf_counter() - start) / repeats
+    return len(data), save_time, load_time
+
+def main():
+    parser = argparse.ArgumentParser(description="Save format size and speed benchmark")
+    parser.add_argument("--items", type=int, default=1000, help="Inventory size")
+    parser.add_argument("--level", type=int, default=30, help="Player level")
+    parser.add_argument("--changed", type=float, default=0.1, help="Share of equipment with its own stats")
+    parser.add_argument("--repeats", type=int, default=20, help="Saves and loads timed per format")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    load_game_modules(args.seed)
+    player = build_player(args.level, args.seed)
+    fill_inventory(player, args.items, args.changed, args.seed)
+
+    results = {save_format: time_format(player, "Village", save_format, args.repeats) for save_format in ("json", "binary")}
+    print(f"{'Format':<8}{'Size':>12}{'Save ms':>10}{'Load ms':>10}")
+    for save_format, (size, save_time, load_time) in results.items():
+        print(f"{save_format:<8}{size:>12,}{save_time * 1000:>10.2f}{load_time * 1000:>10.2f}")
+    json_size, binary_size = results["json"][0], results["binary"][0]
+    print(f"Binary saves are {binary_size / json_size:.0%} the size of json")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# save_index.py
+"""Summary of every save file, kept in a small index next to the saves.
+
+Every time a save is written its character name, level, location, day and
+save time go into saves/saves.index, so menus can describe hundreds of saves
+without loading any of them. Each entry remembers the size and modification
+time of the file it came from, and the size of its autosave journal. Files the
+index doesn't know about, or that have changed since (copied in by hand,
+renamed by autosave rotation, journalled by a session that quit without
+flushing the index), are read on a background thread and added as they finish.
+
+Autosaves that only append to a journal update the entry in memory with
+note(), the index file itself is written with the next full save or flush().
+"""
+import json
+import os
+import threading
+import time
+
+from save_journal import journal_path
+
+INDEX_FILE = "saves.index"  # Not .json so it isn't listed as a save
+
+def summarise(save_data):
+    """The parts of a save the menus show"""
+    player_data = save_data["player"]
+    return {
+        "name": player_data["name"],
+        "level": player_data["level"],
+        "location": save_data["current_location"],
+        "days": player_data.get("days", 1),
+        "gold": player_data.get("gold", 0),
+        "saved_at": time.time()
+    }
+
+def describe(filename, summary):
+    """One line menu label for a save"""
+    if summary is None:
+        return f"{filename} (reading...)"
+    return f"{filename} - {summary['name']} Lv {summary['level']}, {summary['location']}, Day {summary['days']}"
+
+class SaveIndex:
+    def __init__(self, directory, reader):
+        """
+        Args:
+            directory: Folder the saves and the index are in
+            reader: Called with a filename to read a save the index doesn't know about
+        """
+        self.directory = directory
+        self.reader = reader
+        self.path = os.path.join(directory, INDEX_FILE)
+        self._entries = None
+        self._lock = threading.RLock()
+        self._scanning = set()
+        self._dirty = False  # Entries noted in memory that aren't in the index file yet
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _write(self):
+        # Same temp file and rename as the saves, a crash mid-write just loses the index and it gets rebuilt
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self._entries, f)
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def _stamp(self, filename):
+        path = os.path.join(self.directory, filename)
+        stat = os.stat(path)
+        try:
+            journal_size = os.path.getsize(journal_path(path))
+        except OSError:
+            journal_size = 0
+        return stat.st_size, stat.st_mtime_ns, journal_size
+
+    def _entry(self, filename, save_data):
+        entry = summarise(save_data)
+        entry["size"], entry["mtime"], entry["journal"] = self._stamp(filename)
+        return entry
+
+    @staticmethod
+    def _entry_stamp(entry):
+        # Entries written before journals were stamped had none
+        return entry["size"], entry["mtime"], entry.get("journal", 0)
+
+    def record(self, filename, save_data):
+        """Update a save's entry once it has been written"""
+        with self._lock:
+            self._load()[filename] = self._entry(filename, save_data)
+            self._write()
+
+    def note(self, filename, save_data):
+        """Update a save's entry in memory only, e.g. after an autosave journal entry"""
+        with self._lock:
+            self._load()[filename] = self._entry(filename, save_data)
+            self._dirty = True
+
+    def flush(self):
+        """Write entries noted since the index file was last written"""
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    def rename(self, old_filename, new_filename):
+        """Move an entry along with its save, e.g. when autosaves rotate"""
+        with self._lock:
+            entries = self._load()
+            entry = entries.pop(old_filename, None)
+            if entry is not None:
+                entries[new_filename] = entry
+                self._write()
+
+    def forget(self, filename):
+        with self._lock:
+            if self._load().pop(filename, None) is not None:
+                self._write()
+
+    def summary(self, filename):
+        """A save's entry, None while it is waiting to be read, call summaries() first to check it is up to date"""
+        with self._lock:
+            if filename in self._scanning:
+                return None
+            return self._load().get(filename)
+
+    def summaries(self, filenames):
+        """Entries for these saves by filename, stale or missing ones are None and get read in the background"""
+        with self._lock:
+            entries = self._load()
+            result = {}
+            stale = []
+            for filename in filenames:
+                entry = entries.get(filename)
+                try:
+                    current = entry is not None and self._entry_stamp(entry) == self._stamp(filename)
+                except OSError:
+                    current = False
+                result[filename] = entry if current else None
+                if not current and filename not in self._scanning:
+                    stale.append(filename)
+            if stale:
+                self._scanning.update(stale)
+                threading.Thread(target=self._scan, args=(stale,), name="SaveIndexScan", daemon=True).start()
+            return result
+
+    def _scan(self, filenames):
+        for filename in filenames:
+            try:
+                save_data = self.reader(filename)
+                with self._lock:
+                    entry = self._entry(filename, save_data)
+                    entry["saved_at"] = os.path.getmtime(os.path.join(self.directory, filename))
+                    self._load()[filename] = entry
+            except Exception as e:
+                print(f"Couldn't read {filename} for the save index: {e}")
+            finally:
+                with self._lock:
+                    self._scanning.discard(filename)
+        with self._lock:
+            self._write()
@@ -0,0 +1,109 @@
+# save_journal.py
+"""Delta journal for autosaves.
+
+Between full snapshots an autosave only appends what changed since the last
+one to <save>.journal, one JSON line per autosave. Changes are found by
+comparing the save data with the last written copy:
+    dicts: only the keys that changed, recursively, plus any removed keys
+    lists: the slice between the unchanged start and end, so picking up or
+        using one item only writes that item
+    anything else: the new value
+
+Every snapshot that takes a journal gets a snapshot_id and each journal line
+names the snapshot it applies to. A save written over the snapshot some other
+way, or a journal left behind by a crash mid-compaction, is ignored when
+loading rather than applied to the wrong data.
+"""
+import json
+import os
+import uuid
+
+JOURNAL_SUFFIX = ".journal"
+
+def journal_path(filepath):
+    return filepath + JOURNAL_SUFFIX
+
+def new_snapshot_id():
+    return uuid.uuid4().hex
+
+def _key(key):
+    # json turns int, float, bool and None keys into strings, do the same so deltas apply to loaded saves
+    return key if isinstance(key, str) else json.dumps(key)
+
+def diff(old, new):
+    """Delta that turns old into new, None if they are equal"""
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed = {}
+        for key, value in new.items():
+            if key not in old:
+                changed[_key(key)] = {"set": value}
+            else:
+                delta = diff(old[key], value)
+                if delta is not None:
+                    changed[_key(key)] = delta
+        removed = [_key(key) for key in old if key not in new]
+        delta = {"dict": changed}
+        if removed:
+            delta["del"] = removed
+        return delta
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[len(old) - 1 - end] == new[len(new) - 1 - end]:
+            end += 1
+        return {"splice": [start, len(old) - end, list(new[start:len(new) - end])]}
+    return {"set": new}
+
+def patch(value, delta):
+    """Apply a delta from diff() to json style save data, returns the new value"""
+    if "set" in delta:
+        return delta["set"]
+    if "dict" in delta:
+        for key, change in delta["dict"].items():
+            value[key] = patch(value.get(key), change)
+        for key in delta.get("del", []):
+            value.pop(key, None)
+        return value
+    start, stop, items = delta["splice"]
+    value[start:stop] = items
+    return value
+
+def append_entry(filepath, snapshot_id, delta):
+    """Append a delta to a save's journal and flush it to disk, returns the bytes written"""
+    line = (json.dumps({"base": snapshot_id, "delta": delta}, separators=(",", ":")) + "\n").encode("utf-8")
+    with open(journal_path(filepath), "ab") as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(line)
+
+def replay(save_data, filepath):
+    """Apply a save's journal to its snapshot data, returns how many deltas were applied"""
+    path = journal_path(filepath)
+    snapshot_id = save_data.get("snapshot_id")
+    if snapshot_id is None or not os.path.exists(path):
+        return 0
+    applied = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash while appending, nothing after it was written
+                break
+            if entry.get("base") != snapshot_id:
+                continue
+            patch(save_data, entry["delta"])
+            applied += 1
+    return applied
+
+def remove_journal(filepath):
+    try:
+        os.remove(journal_path(filepath))
+    except FileNotFoundError:
+        pass
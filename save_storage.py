@@ -0,0 +1,449 @@
+# save_storage.py
+"""Where saves are kept.
+
+save_game, load_game, get_save_files and the autosaves all go through a save
+store, picked with TEXT_RPG_SAVE_STORE when the game starts:
+    unset or a folder: FileSaveStore, one file per save in that folder, the
+        format picked by the file's extension
+    sqlite:<path>: SQLiteSaveStore, every save in one SQLite database in WAL
+        mode, for hosting many player profiles on one machine
+
+Existing save folders can be copied into a database in one go:
+    python save_storage.py import saves saves.db
+"""
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import binary_save
+import compressed_save
+import save_journal
+from save_index import SaveIndex, summarise
+
+# Save file extensions and the format each one is written in, pick one by naming the save
+SAVE_FORMATS = {
+    ".json": "json",
+    ".sav": "binary",
+    ".savz": "compressed"
+}
+
+# Kill trackers get their own table in a database, everything else in the player's data stays json
+KILL_TRACKERS = ("kill_tracker", "used_kill_tracker", "variant_kill_tracker", "used_variant_tracker",
+                 "boss_kill_tracker", "used_boss_kill_tracker")
+
+def save_format(filename):
+    """Format a save is written in, decided by its extension, json if it has neither"""
+    return SAVE_FORMATS.get(os.path.splitext(filename)[1], "json")
+
+def encode_save_data(save_data, save_format="json"):
+    if save_format == "binary":
+        return binary_save.encode(save_data)
+    if save_format == "compressed":
+        return compressed_save.encode(save_data)
+    return json.dumps(save_data).encode("utf-8")
+
+def decode_save_data(data):
+    """Save data from a save file's bytes in any format"""
+    if binary_save.is_binary_save(data):
+        return binary_save.decode(data)
+    if compressed_save.is_compressed_save(data):
+        return compressed_save.decode(data)
+    return json.loads(data.decode("utf-8"))
+
+class FileSaveStore:
+    """Saves as files in one folder, with a metadata index and autosave journals beside them"""
+    def __init__(self, directory):
+        self.directory = directory
+        self.index = SaveIndex(directory, self.read)
+
+    def __repr__(self):
+        return f"FileSaveStore({self.directory!r})"
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def ensure_directory(self):
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+    def list_saves(self):
+        self.ensure_directory()
+        return [f for f in os.listdir(self.directory) if f.endswith(tuple(SAVE_FORMATS))]
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def write(self, name, save_data):
+        """Write a save atomically and return where it went.
+
+        The data goes to a temporary file that is flushed to disk and then renamed
+        over the old save, so a crash mid-write leaves the previous save intact.
+        """
+        self.ensure_directory()
+        filepath = self.path(name)
+        temp_path = filepath + ".tmp"
+        file_format = save_format(name)
+        try:
+            with open(temp_path, 'wb') as f:
+                if file_format == "compressed":
+                    # Streamed straight into the file rather than encoded in memory first
+                    compressed_save.write(f, save_data)
+                else:
+                    f.write(encode_save_data(save_data, file_format))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        # The snapshot holds everything now, any journal belonged to the one it replaced
+        save_journal.remove_journal(filepath)
+        self.index.record(name, save_data)
+        return filepath
+
+    def read(self, name):
+        """A save's data, whichever format it was written in, with its autosave journal applied"""
+        filepath = self.path(name)
+        with open(filepath, 'rb') as f:
+            streamed = compressed_save.is_compressed_save(f.read(len(compressed_save.MAGIC)))
+            f.seek(0)
+            save_data = compressed_save.read(f) if streamed else decode_save_data(f.read())
+        save_journal.replay(save_data, filepath)
+        return save_data
+
+    def append_delta(self, name, snapshot_id, delta, save_data):
+        """Journal the changes since the last write, save_data is the state after them"""
+        save_journal.append_entry(self.path(name), snapshot_id, delta)
+        # Only the journal line touches disk, the index catches up on the next full write or flush()
+        self.index.note(name, save_data)
+
+    def flush(self):
+        self.index.flush()
+
+    def delete(self, name):
+        os.remove(self.path(name))
+        save_journal.remove_journal(self.path(name))
+        self.index.forget(name)
+
+    def rename(self, old_name, new_name):
+        os.replace(self.path(old_name), self.path(new_name))
+        old_journal = save_journal.journal_path(self.path(old_name))
+        if os.path.exists(old_journal):
+            os.replace(old_journal, save_journal.journal_path(self.path(new_name)))
+        else:
+            save_journal.remove_journal(self.path(new_name))
+        self.index.rename(old_name, new_name)
+
+    def autosaves(self, base_name):
+        """Saves whose name starts with base_name, newest first"""
+        self.ensure_directory()
+        saves = [f for f in self.list_saves() if f.startswith(base_name)]
+        saves.sort(key=lambda f: os.path.getctime(self.path(f)), reverse=True)
+        return saves
+
+    def summaries(self, names):
+        return self.index.summaries(names)
+
+    def summary(self, name):
+        return self.index.summary(name)
+
+class ConnectionPool:
+    """Up to size SQLite connections shared between threads, each handed to one thread at a time"""
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL safe against corruption, a power cut can only lose the last few commits
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            connection = self._connect() if create else self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self._created = 0
+
+class SQLiteSaveStore:
+    """Every save in one SQLite database, with players, items and kill counts in indexed tables"""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS saves (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            player_name TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            location TEXT,
+            days INTEGER,
+            gold INTEGER,
+            saved_at REAL NOT NULL,
+            snapshot_id TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS saves_by_time ON saves (saved_at);
+        CREATE INDEX IF NOT EXISTS saves_by_player ON saves (player_name, level);
+
+        CREATE TABLE IF NOT EXISTS items (
+            save_id INTEGER NOT NULL REFERENCES saves (id) ON DELETE CASCADE,
+            slot TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            item_id TEXT,
+            stack_size INTEGER,
+            data TEXT,
+            PRIMARY KEY (save_id, slot, position)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS items_by_id ON items (item_id);
+
+        CREATE TABLE IF NOT EXISTS kills (
+            save_id INTEGER NOT NULL REFERENCES saves (id) ON DELETE CASCADE,
+            tracker TEXT NOT NULL,
+            enemy TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (save_id, tracker, enemy)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS kills_by_enemy ON kills (enemy, tracker);
+
+        CREATE TABLE IF NOT EXISTS journal (
+            id INTEGER PRIMARY KEY,
+            save_id INTEGER NOT NULL REFERENCES saves (id) ON DELETE CASCADE,
+            base TEXT NOT NULL,
+            delta TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS journal_by_save ON journal (save_id, id);
+    """
+    INVENTORY = ""  # Slot the inventory's rows are stored under, equipped items use their slot name
+
+    def __init__(self, path, pool_size=4):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.pool = ConnectionPool(path, pool_size)
+        self._summaries = {}
+        with self.pool.connection() as connection:
+            connection.executescript(self.SCHEMA)
+
+    def __repr__(self):
+        return f"SQLiteSaveStore({self.path!r})"
+
+    def close(self):
+        self.pool.close()
+
+    def flush(self):
+        # Every write is committed as it happens, including the summaries
+        pass
+
+    def checkpoint(self):
+        """Fold the write-ahead log back into the database file, e.g. before backing it up"""
+        with self.pool.connection() as connection:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def list_saves(self):
+        with self.pool.connection() as connection:
+            return [name for name, in connection.execute("SELECT name FROM saves ORDER BY name")]
+
+    def exists(self, name):
+        with self.pool.connection() as connection:
+            return connection.execute("SELECT 1 FROM saves WHERE name = ?", (name,)).fetchone() is not None
+
+    def _item_row(self, save_id, slot, position, item_data):
+        if item_data is None:
+            return (save_id, slot, position, None, None, None)
+        if set(item_data) == {"id", "stack_size"}:
+            return (save_id, slot, position, item_data["id"], item_data["stack_size"], None)
+        return (save_id, slot, position, item_data.get("name"), item_data.get("stack_size", 1), json.dumps(item_data))
+
+    def _write(self, connection, name, save_data):
+        save_data = dict(save_data)
+        snapshot_id = save_data.pop("snapshot_id", None)
+        player_data = dict(save_data["player"])
+        inventory = player_data.pop("inventory", [])
+        equipped = player_data.pop("equipped", {})
+        trackers = {}
+        for tracker in KILL_TRACKERS:
+            counts = player_data.get(tracker)
+            if isinstance(counts, dict) and all(isinstance(count, int) for count in counts.values()):
+                trackers[tracker] = player_data.pop(tracker)
+        save_data["player"] = player_data
+
+        summary = summarise(save_data)
+        connection.execute(
+            """INSERT INTO saves (name, player_name, level, location, days, gold, saved_at, snapshot_id, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (name) DO UPDATE SET
+                   player_name = excluded.player_name, level = excluded.level, location = excluded.location,
+                   days = excluded.days, gold = excluded.gold, saved_at = excluded.saved_at,
+                   snapshot_id = excluded.snapshot_id, data = excluded.data""",
+            (name, summary["name"], summary["level"], summary["location"], summary["days"], summary["gold"],
+             summary["saved_at"], snapshot_id, json.dumps(save_data)))
+        save_id = connection.execute("SELECT id FROM saves WHERE name = ?", (name,)).fetchone()[0]
+
+        # The new snapshot replaces the old one's rows and any journal on top of it
+        for table in ("items", "kills", "journal"):
+            connection.execute(f"DELETE FROM {table} WHERE save_id = ?", (save_id,))
+        rows = [self._item_row(save_id, self.INVENTORY, position, item) for position, item in enumerate(inventory)]
+        rows += [self._item_row(save_id, slot, position, item) for position, (slot, item) in enumerate(equipped.items())]
+        connection.executemany("INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)", rows)
+        connection.executemany(
+            "INSERT INTO kills VALUES (?, ?, ?, ?, ?)",
+            [(save_id, tracker, enemy, position, count)
+             for tracker, counts in trackers.items() for position, (enemy, count) in enumerate(counts.items())])
+        self._summaries[name] = summary
+
+    def write(self, name, save_data):
+        with self.pool.connection() as connection:
+            with connection:
+                self._write(connection, name, save_data)
+        return f"{self.path}:{name}"
+
+    def read(self, name):
+        with self.pool.connection() as connection:
+            row = connection.execute("SELECT id, snapshot_id, data FROM saves WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"No save called {name} in {self.path}")
+            save_id, snapshot_id, data = row
+            save_data = json.loads(data)
+            player_data = save_data["player"]
+
+            inventory, equipped = [], {}
+            for slot, item_id, stack_size, item_data in connection.execute(
+                    "SELECT slot, item_id, stack_size, data FROM items WHERE save_id = ? ORDER BY slot != '', position",
+                    (save_id,)):
+                if item_data is not None:
+                    item = json.loads(item_data)
+                elif item_id is not None:
+                    item = {"id": item_id, "stack_size": stack_size}
+                else:
+                    item = None
+                if slot == self.INVENTORY:
+                    inventory.append(item)
+                else:
+                    equipped[slot] = item
+            player_data["inventory"] = inventory
+            player_data["equipped"] = equipped
+
+            for tracker, enemy, count in connection.execute(
+                    "SELECT tracker, enemy, count FROM kills WHERE save_id = ? ORDER BY tracker, position", (save_id,)):
+                player_data.setdefault(tracker, {})[enemy] = count
+            for tracker in KILL_TRACKERS:
+                player_data.setdefault(tracker, {})
+
+            if snapshot_id is not None:
+                save_data["snapshot_id"] = snapshot_id
+                for delta, in connection.execute(
+                        "SELECT delta FROM journal WHERE save_id = ? AND base = ? ORDER BY id", (save_id, snapshot_id)):
+                    save_journal.patch(save_data, json.loads(delta))
+        return save_data
+
+    def append_delta(self, name, snapshot_id, delta, save_data):
+        """Journal the changes since the last write, save_data is the state after them"""
+        summary = summarise(save_data)
+        with self.pool.connection() as connection:
+            with connection:
+                connection.execute(
+                    """INSERT INTO journal (save_id, base, delta)
+                       SELECT id, ?, ? FROM saves WHERE name = ?""",
+                    (snapshot_id, json.dumps(delta, separators=(",", ":")), name))
+                connection.execute(
+                    "UPDATE saves SET level = ?, location = ?, days = ?, gold = ?, saved_at = ? WHERE name = ?",
+                    (summary["level"], summary["location"], summary["days"], summary["gold"], summary["saved_at"], name))
+        self._summaries[name] = summary
+
+    def delete(self, name):
+        with self.pool.connection() as connection:
+            with connection:
+                connection.execute("DELETE FROM saves WHERE name = ?", (name,))
+        self._summaries.pop(name, None)
+
+    def rename(self, old_name, new_name):
+        with self.pool.connection() as connection:
+            with connection:
+                # Renaming over an existing save replaces it, like renaming a file does
+                connection.execute("DELETE FROM saves WHERE name = ?", (new_name,))
+                connection.execute("UPDATE saves SET name = ? WHERE name = ?", (new_name, old_name))
+        if old_name in self._summaries:
+            self._summaries[new_name] = self._summaries.pop(old_name)
+
+    def autosaves(self, base_name):
+        """Saves whose name starts with base_name, newest first"""
+        with self.pool.connection() as connection:
+            return [name for name, in connection.execute(
+                "SELECT name FROM saves WHERE name >= ? AND name < ? ORDER BY saved_at DESC",
+                (base_name, base_name + "\uffff"))]
+
+    def summaries(self, names):
+        with self.pool.connection() as connection:
+            self._summaries = {
+                name: {"name": player_name, "level": level, "location": location, "days": days, "gold": gold, "saved_at": saved_at}
+                for name, player_name, level, location, days, gold, saved_at in connection.execute(
+                    "SELECT name, player_name, level, location, days, gold, saved_at FROM saves")
+            }
+        return {name: self._summaries.get(name) for name in names}
+
+    def summary(self, name):
+        return self._summaries.get(name)
+
+    def import_saves(self, store):
+        """Copy every save from another store in a single transaction, returns how many were copied"""
+        imported = 0
+        with self.pool.connection() as connection:
+            with connection:
+                for name in store.list_saves():
+                    try:
+                        save_data = store.read(name)
+                    except Exception as e:
+                        print(f"Skipping {name}, it couldn't be read: {e}")
+                        continue
+                    self._write(connection, name, save_data)
+                    imported += 1
+        return imported
+
+def open_save_store(spec, default_directory):
+    """Save store for a TEXT_RPG_SAVE_STORE value, sqlite:<path> or a folder"""
+    if spec and spec.startswith("sqlite:"):
+        return SQLiteSaveStore(spec[len("sqlite:"):])
+    return FileSaveStore(spec or default_directory)
+
+def main():
+    parser = argparse.ArgumentParser(description="Copy a folder of save files into a SQLite save database")
+    parser.add_argument("command", choices=["import"])
+    parser.add_argument("directory", help="Folder of save files")
+    parser.add_argument("database", help="SQLite database to copy them into, created if it doesn't exist")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store = SQLiteSaveStore(args.database)
+    count = store.import_saves(FileSaveStore(args.directory))
+    store.close()
+    print(f"Imported {count} saves into {args.database} in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -1,136 +1,129 @@
 import json
 import os
+import binary_save
+import compressed_save
+from save_storage import SAVE_FORMATS, save_format, encode_save_data, decode_save_data, open_save_store
 from player import Player
-from items import Item, initialise_items, SoulboundItem, SoulCrystal, BossResonance, VariantAffinity, ElementalResonance, SoulEcho
+from items import Item, item_definitions, SoulboundItem, SoulCrystal, BossResonance, VariantAffinity, ElementalResonance, SoulEcho
 from status_effects import StatusEffect, BURN, POISON, FREEZE, STUN, SELF_DAMAGE, VAMPIRIC, STAMINA_DRAIN, DAMAGE_REFLECT, DEFENCE_BREAK, DEFENSIVE_STANCE, POWER_STANCE, BERSERKER_STANCE, EVASION_STANCE, ACCURACY_STANCE
 
 SAVE_DIRECTORY = "saves"
 
+# Where saves live, a folder of files unless TEXT_RPG_SAVE_STORE says otherwise (see save_storage.py)
+SAVE_STORE = open_save_store(os.environ.get("TEXT_RPG_SAVE_STORE"), SAVE_DIRECTORY)
+
+def set_save_store(store):
+    """Switch every save, load and autosave over to another store"""
+    global SAVE_STORE
+    SAVE_STORE = store
+
 def ensure_save_directory():
     if not os.path.exists(SAVE_DIRECTORY):
         os.makedirs(SAVE_DIRECTORY)
 
 def get_save_files():
-    ensure_save_directory()
-    return [f for f in os.listdir(SAVE_DIRECTORY) if f.endswith('.json')]
+    return SAVE_STORE.list_saves()
 
-def save_game(player, current_location, filename):
-    ensure_save_directory()
-    
-    # Initialize item data lists/dicts
-    inventory_data = []
-    equipped_data = {}
+def save_summaries(filenames):
+    """Menu summaries of these saves, any the store has to look up again come back as None until it has"""
+    return SAVE_STORE.summaries(filenames)
+
+def save_summary(filename):
+    return SAVE_STORE.summary(filename)
+
+def save_filename(name):
+    """File name for a new save, typing name.sav or name.savz picks that format and anything else saves as json"""
+    return name if name.endswith(tuple(SAVE_FORMATS)) else name + ".json"
+
+def item_to_data(item):
+    """Save data for one item.
+
+    Unchanged catalog items are saved by id with their stack size, anything
+    with its own stats (soul crystals, soulbound and soul forged items) is
+    saved in full.
+    """
+    if type(item) is Item and item_definitions().get(item.name) is item.definition:
+        return {"id": item.name, "stack_size": item.stack_size}
     
-    # Process inventory items
-    for item in player.inventory:
-        item_data = {
-            "name": item.name,
-            "type": item.type,
-            "value": item.value,
-            "tier": item.tier,
-            "stats": {
-                "attack": getattr(item, 'attack', 0),
-                "defence": getattr(item, 'defence', 0),
-                "accuracy": getattr(item, 'accuracy', 0),
-                "evasion": getattr(item, 'evasion', 0),
-                "crit_chance": getattr(item, 'crit_chance', 0),
-                "crit_damage": getattr(item, 'crit_damage', 0),
-                "armour_penetration": getattr(item, 'armour_penetration', 0),
-                "damage_reduction": getattr(item, 'damage_reduction', 0),
-                "block_chance": getattr(item, 'block_chance', 0),
-                "weapon_type": getattr(item, 'weapon_type', None)
-            }
+    item_data = {
+        "name": item.name,
+        "type": item.type,
+        "value": item.value,
+        "tier": item.tier,
+        "stack_size": item.stack_size,
+        "stats": {
+            "attack": getattr(item, 'attack', 0),
+            "defence": getattr(item, 'defence', 0),
+            "accuracy": getattr(item, 'accuracy', 0),
+            "evasion": getattr(item, 'evasion', 0),
+            "crit_chance": getattr(item, 'crit_chance', 0),
+            "crit_damage": getattr(item, 'crit_damage', 0),
+            "armour_penetration": getattr(item, 'armour_penetration', 0),
+            "damage_reduction": getattr(item, 'damage_reduction', 0),
+            "block_chance": getattr(item, 'block_chance', 0),
+            "weapon_type": getattr(item, 'weapon_type', None)
         }
-        
-        # Add soul crystal properties if present
-        if isinstance(item, SoulCrystal):
-            item_data["is_soul_crystal"] = True
-            item_data["stored_buffs"] = item.stored_buffs
-            item_data["used"] = item.used
-            item_data["soul_source"] = item.soul_source
-            
-            # Modify how special effects are saved
-            special_effects_data = []
-            for effect in item.special_effects:
-                effect_data = {
-                    "type": effect.__class__.__name__,
-                    "description": effect.description,
-                    "effect_details": effect.effect_details
-                }
-                
-                # Add specific data based on effect type
-                if isinstance(effect, SoulEcho):
-                    effect_data.update({
-                        "enemy_type": effect.enemy_type,
-                        "kill_count": effect.kill_count,
-                        "bonus": effect.bonus,  # Make sure bonus is saved
-                        "duration": effect.duration
-                    })
-                elif isinstance(effect, BossResonance):
-                    effect_data.update({
-                        "boss_type": effect.boss_type,
-                        "kill_count": effect.kill_count,
-                        "bonus": effect.bonus,
-                        "duration": effect.duration
-                    })
-                elif isinstance(effect, VariantAffinity):
-                    effect_data.update({
-                        "variant_type": effect.variant_type,
-                        "kill_count": effect.kill_count,
-                        "bonus": effect.bonus,
-                        "duration": effect.duration
-                    })
-                elif isinstance(effect, ElementalResonance):
-                    effect_data["element"] = effect.element
-                    
-                special_effects_data.append(effect_data)
-            item_data["special_effects"] = special_effects_data
-        
-        # Add soulbound properties if present
-        if hasattr(item, 'soulbound') and item.soulbound:
-            item_data["soulbound"] = True
-            item_data["growth_stats"] = getattr(item, 'growth_stats', [])
-            item_data["soul_source"] = getattr(item, 'soul_source', {})
-            item_data["birth_level"] = getattr(item, 'birth_level', 1)
-            item_data["current_level"] = getattr(item, 'current_level', 1)
-            item_data["growth_rate"] = getattr(item, 'growth_rate', 0.1)
-            
-        inventory_data.append(item_data)
+    }
     
-    # Process equipped items
-    for slot, item in player.equipped.items():
-        if item:
-            item_data = {
-                "name": item.name,
-                "type": item.type,
-                "value": item.value,
-                "tier": item.tier,
-                "stats": {
-                    "attack": getattr(item, 'attack', 0),
-                    "defence": getattr(item, 'defence', 0),
-                    "accuracy": getattr(item, 'accuracy', 0),
-                    "evasion": getattr(item, 'evasion', 0),
-                    "crit_chance": getattr(item, 'crit_chance', 0),
-                    "crit_damage": getattr(item, 'crit_damage', 0),
-                    "armour_penetration": getattr(item, 'armour_penetration', 0),
-                    "damage_reduction": getattr(item, 'damage_reduction', 0),
-                    "block_chance": getattr(item, 'block_chance', 0),
-                    "weapon_type": getattr(item, 'weapon_type', None)
-                }
+    # Add soul crystal properties if present
+    if isinstance(item, SoulCrystal):
+        item_data["is_soul_crystal"] = True
+        item_data["stored_buffs"] = item.stored_buffs
+        item_data["used"] = item.used
+        item_data["soul_source"] = item.soul_source
+        
+        # Modify how special effects are saved
+        special_effects_data = []
+        for effect in item.special_effects:
+            effect_data = {
+                "type": effect.__class__.__name__,
+                "description": effect.description,
+                "effect_details": effect.effect_details
             }
             
-            # Add soulbound properties if present
-            if hasattr(item, 'soulbound') and item.soulbound:
-                item_data["soulbound"] = True
-                item_data["growth_stats"] = getattr(item, 'growth_stats', [])
-                item_data["soul_source"] = getattr(item, 'soul_source', {})
-                item_data["birth_level"] = getattr(item, 'birth_level', 1)
-                item_data["current_level"] = getattr(item, 'current_level', 1)
-                item_data["growth_rate"] = getattr(item, 'growth_rate', 0.1)
+            # Add specific data based on effect type
+            if isinstance(effect, SoulEcho):
+                effect_data.update({
+                    "enemy_type": effect.enemy_type,
+                    "kill_count": effect.kill_count,
+                    "bonus": effect.bonus,  # Make sure bonus is saved
+                    "duration": effect.duration
+                })
+            elif isinstance(effect, BossResonance):
+                effect_data.update({
+                    "boss_type": effect.boss_type,
+                    "kill_count": effect.kill_count,
+                    "bonus": effect.bonus,
+                    "duration": effect.duration
+                })
+            elif isinstance(effect, VariantAffinity):
+                effect_data.update({
+                    "variant_type": effect.variant_type,
+                    "kill_count": effect.kill_count,
+                    "bonus": effect.bonus,
+                    "duration": effect.duration
+                })
+            elif isinstance(effect, ElementalResonance):
+                effect_data["element"] = effect.element
                 
-            equipped_data[slot] = item_data
-        else:
-            equipped_data[slot] = None
+            special_effects_data.append(effect_data)
+        item_data["special_effects"] = special_effects_data
+    
+    # Add soulbound properties if present
+    if hasattr(item, 'soulbound') and item.soulbound:
+        item_data["soulbound"] = True
+        item_data["growth_stats"] = getattr(item, 'growth_stats', [])
+        item_data["soul_source"] = getattr(item, 'soul_source', {})
+        item_data["birth_level"] = getattr(item, 'birth_level', 1)
+        item_data["current_level"] = getattr(item, 'current_level', 1)
+        item_data["growth_rate"] = getattr(item, 'growth_rate', 0.1)
+        
+    return item_data
+
+def build_save_data(player, current_location):
+    """Everything a save file holds, as plain dicts and lists ready for json"""
+    inventory_data = [item_to_data(item) for item in player.inventory]
+    equipped_data = {slot: item_to_data(item) if item else None for slot, item in player.equipped.items()}
             
     save_data = {
         "player": {
@@ -171,32 +164,143 @@ def save_game(player, current_location, filename):
             "used_variant_tracker": player.used_variant_tracker,
             "boss_kill_tracker": player.boss_kill_tracker,
             "used_boss_kill_tracker": player.used_boss_kill_tracker,
-            "level_modifiers": player.level_modifiers,
-            "equipment_modifiers": player.equipment_modifiers,
-            "buff_modifiers": player.buff_modifiers,
-            "combat_buff_modifiers": player.combat_buff_modifiers,
-            "weapon_buff_modifiers": player.weapon_buff_modifiers,
-            "debuff_modifiers": player.debuff_modifiers,
+            "level_modifiers": dict(player.level_modifiers),
+            "equipment_modifiers": dict(player.equipment_modifiers),
+            "buff_modifiers": dict(player.buff_modifiers),
+            "combat_buff_modifiers": dict(player.combat_buff_modifiers),
+            "weapon_buff_modifiers": dict(player.weapon_buff_modifiers),
+            "debuff_modifiers": dict(player.debuff_modifiers),
             "status_effects": [(effect.name, effect.remaining_duration, effect.strength, effect.stackable) 
                              for effect in player.status_effects]
         },
         "current_location": current_location,
     }
-    
-    filepath = os.path.join(SAVE_DIRECTORY, filename)
-    with open(filepath, 'w') as f:
-        json.dump(save_data, f)
+    return save_data
+
+def write_save_data(save_data, filename):
+    """Write save data to the save store and return where it went"""
+    return SAVE_STORE.write(filename, save_data)
+
+def save_game(player, current_location, filename):
+    filepath = write_save_data(build_save_data(player, current_location), filename)
     print(f"Game saved successfully to {filepath}")
 
+def load_special_effects(effects_data):
+    """Rebuild a soul crystal's special effects"""
+    special_effects = []
+    for effect_data in effects_data:
+        if effect_data["type"] == "SoulEcho":
+            effect = SoulEcho(
+                effect_data["enemy_type"],
+                effect_data["kill_count"],
+                effect_data["bonus"],
+                effect_data["duration"]
+            )
+        elif effect_data["type"] == "BossResonance":
+            effect = BossResonance(
+                effect_data["boss_type"],
+                effect_data["kill_count"],
+                stored_bonus=effect_data["bonus"],
+                stored_duration=effect_data.get("duration", effect_data["bonus"] // 2)
+                )
+        elif effect_data["type"] == "VariantAffinity":
+            effect = VariantAffinity(
+                effect_data["variant_type"],
+                effect_data["kill_count"],
+                stored_bonus=effect_data["bonus"],
+                stored_duration=effect_data.get("duration", effect_data["bonus"] // 2)
+                )
+        elif effect_data["type"] == "ElementalResonance":
+            effect = ElementalResonance(effect_data["element"])
+            
+        # Restore description and effect details
+        effect.description = effect_data["description"]
+        effect.effect_details = effect_data["effect_details"]
+        special_effects.append(effect)
+    return special_effects
+
+def item_from_data(item_data, definitions):
+    """Rebuild an item from its save data, catalog items share the catalog's definition"""
+    if isinstance(item_data, str):  # Handle old save format
+        return Item.from_def(definitions[item_data]) if item_data in definitions else None
+    
+    if "id" in item_data:
+        if item_data["id"] not in definitions:
+            print(f"Unknown item {item_data['id']} in save, skipping it")
+            return None
+        return Item.from_def(definitions[item_data["id"]], item_data.get("stack_size", 1))
+    
+    if "is_soul_crystal" in item_data:
+        # Create the soul crystal with all its data
+        item = SoulCrystal(
+            item_data["name"],
+            item_data["value"],
+            item_data["tier"],
+            item_data["stored_buffs"],
+            load_special_effects(item_data.get("special_effects", [])),
+            item_data["soul_source"]
+        )
+        item.used = item_data.get("used", False)
+        return item
+    
+    stats = dict(item_data["stats"])
+    # Get weapon_type from stats if it exists
+    weapon_type = stats.pop("weapon_type", None)
+    if item_data.get("soulbound"):
+        item = SoulboundItem(
+            item_data["name"],
+            item_data["type"],
+            item_data["value"],
+            item_data["tier"],
+            growth_stats=item_data["growth_stats"],
+            soul_source=item_data["soul_source"],
+            weapon_type=weapon_type,
+            **stats
+        )
+        item.birth_level = item_data["birth_level"]
+        item.current_level = item_data["current_level"]
+        item.growth_rate = item_data["growth_rate"]
+    elif item_data["name"] in definitions:
+        # Saves from before items were saved by id
+        item = Item.from_def(definitions[item_data["name"]])
+    else:
+        # Create regular item
+        item = Item(
+            item_data["name"],
+            item_data["type"],
+            item_data["value"],
+            item_data["tier"],
+            weapon_type=weapon_type,
+            **stats
+        )
+    item.stack_size = item_data.get("stack_size", 1)
+    return item
+
+def read_save_data(filename):
+    """Save data from the save store, whichever format it was written in, with its autosave journal applied"""
+    return SAVE_STORE.read(filename)
+
+def convert_save(source, target):
+    """Rewrite a save in the format of the target's extension, e.g. hero.json to hero.sav"""
+    return write_save_data(read_save_data(source), target)
+
 def load_game(filename):
-    filepath = os.path.join(SAVE_DIRECTORY, filename)
-    if not os.path.exists(filepath):
+    if not SAVE_STORE.exists(filename):
         print(f"Save file {filename} not found.")
         return None, None
 
-    with open(filepath, 'r') as f:
-        save_data = json.load(f)
+    try:
+        save_data = read_save_data(filename)
+    except (binary_save.SaveFormatError, compressed_save.CompressedSaveError) as e:
+        print(f"Couldn't load {filename}: {e}")
+        return None, None
+
+    player, current_location = load_save_data(save_data)
+    print(f"Game loaded successfully from {filename}")
+    return player, current_location
 
+def load_save_data(save_data):
+    """Rebuild the player and their location from save data"""
     player_data = save_data["player"]
     player = Player(player_data["name"])
     
@@ -208,139 +312,17 @@ def load_game(filename):
         setattr(player, attr, player_data[attr])
     
     # Load inventory items
+    definitions = item_definitions()
     player.inventory = []
-    all_items = initialise_items()
-    
     for item_data in player_data["inventory"]:
-        if isinstance(item_data, str):  # Handle old save format
-            if item_data in all_items:
-                player.inventory.append(all_items[item_data])
-        else:  # New save format
-            if "is_soul_crystal" in item_data:
-                special_effects = []
-                if "special_effects" in item_data:
-                    for effect_data in item_data["special_effects"]:
-                        if effect_data["type"] == "SoulEcho":
-                            effect = SoulEcho(
-                                effect_data["enemy_type"],
-                                effect_data["kill_count"],
-                                effect_data["bonus"],
-                                effect_data["duration"]
-                            )
-                        elif effect_data["type"] == "BossResonance":
-                            effect = BossResonance(
-                                effect_data["boss_type"],
-                                effect_data["kill_count"],
-                                stored_bonus=effect_data["bonus"],
-                                stored_duration=effect_data.get("duration", effect_data["bonus"] // 2)
-                                )
-                        elif effect_data["type"] == "VariantAffinity":
-                            effect = VariantAffinity(
-                                effect_data["variant_type"],
-                                effect_data["kill_count"],
-                                stored_bonus=effect_data["bonus"],
-                                stored_duration=effect_data.get("duration", effect_data["bonus"] // 2)
-                                )
-                        elif effect_data["type"] == "ElementalResonance":
-                            effect = ElementalResonance(effect_data["element"])
-                            
-                        # Restore description and effect details
-                        effect.description = effect_data["description"]
-                        effect.effect_details = effect_data["effect_details"]
-                        special_effects.append(effect)
-                
-                # Create the soul crystal with all its data
-                item = SoulCrystal(
-                    item_data["name"],
-                    item_data["value"],
-                    item_data["tier"],
-                    item_data["stored_buffs"],
-                    special_effects,  # Add the reconstructed special effects
-                    item_data["soul_source"]
-                )
-                item.used = item_data.get("used", False)
-                
-            elif "soulbound" in item_data and item_data["soulbound"]:
-                # Get weapon_type from stats if it exists
-                weapon_type = item_data["stats"].pop("weapon_type", None)
-                # Create soulbound item
-                item = SoulboundItem(
-                    item_data["name"],
-                    item_data["type"],
-                    item_data["value"],
-                    item_data["tier"],
-                    growth_stats=item_data["growth_stats"],
-                    soul_source=item_data["soul_source"],
-                    weapon_type=weapon_type,
-                    **item_data["stats"]
-                )
-                item.birth_level = item_data["birth_level"]
-                item.current_level = item_data["current_level"]
-                item.growth_rate = item_data["growth_rate"]
-            else:
-                # Try to get from all_items first
-                if item_data["name"] in all_items:
-                    item = all_items[item_data["name"]]
-                else:
-                    # Get the weapon_type from stats if it exists
-                    weapon_type = item_data["stats"].pop("weapon_type", None)
-                    # Create regular item
-                    item = Item(
-                        item_data["name"],
-                        item_data["type"],
-                        item_data["value"],
-                        item_data["tier"],
-                        weapon_type=weapon_type,
-                        **item_data["stats"]
-                    )
+        item = item_from_data(item_data, definitions)
+        if item:
             player.inventory.append(item)
     
     # Load equipped items
     player.equipped = {}
     for slot, item_data in player_data["equipped"].items():
-        if isinstance(item_data, str):  # Handle old save format
-            if item_data in all_items:
-                player.equipped[slot] = all_items[item_data]
-            else:
-                player.equipped[slot] = None
-        else:  # New save format
-            if item_data:
-                if "soulbound" in item_data and item_data["soulbound"]:
-                    # Get the weapon_type from stats if it exists
-                    weapon_type = item_data["stats"].pop("weapon_type", None)
-                    # Create soulbound equipped item
-                    item = SoulboundItem(
-                        item_data["name"],
-                        item_data["type"],
-                        item_data["value"],
-                        item_data["tier"],
-                        growth_stats=item_data["growth_stats"],
-                        soul_source=item_data["soul_source"],
-                        weapon_type=weapon_type,
-                        **item_data["stats"]
-                    )
-                    item.birth_level = item_data["birth_level"]
-                    item.current_level = item_data["current_level"]
-                    item.growth_rate = item_data["growth_rate"]
-                else:
-                    # Try to get from all_items first
-                    if item_data["name"] in all_items:
-                        item = all_items[item_data["name"]]
-                    else:
-                        # Get the weapon_type from stats if it exists
-                        weapon_type = item_data["stats"].pop("weapon_type", None)
-                        # Create regular item
-                        item = Item(
-                            item_data["name"],
-                            item_data["type"],
-                            item_data["value"],
-                            item_data["tier"],
-                            weapon_type=weapon_type,
-                            **item_data["stats"]
-                        )
-                player.equipped[slot] = item
-            else:
-                player.equipped[slot] = None
+        player.equipped[slot] = item_from_data(item_data, definitions) if item_data else None
 
     # Load other attributes
     player.cooldowns = player_data["cooldowns"]
@@ -392,6 +374,4 @@ def load_game(filename):
             player.status_effects.append(effect)
 
     current_location = save_data["current_location"]
-    
-    print(f"Game loaded successfully from {filepath}")
     return player, current_location
\ No newline at end of file
@@ -2,14 +2,15 @@ import random
 import pygame
 from player import Player
 from items import Item, SoulCrystal
-from display import Display, ShopDisplay
+from item_catalog import ItemCatalog, TIER_LEVELS, ITEM_TIERS
+from display import get_display, ShopDisplay, AssetManager, SHOP_IMAGES
 
 class BaseShop:
     # Standard shop class, this will allow easy addition of other shops without having to rewrite lots of code
     def __init__(self, all_items):
-        self.display = Display()
+        self.display = get_display()
         self.inventory = {} # Dictionary of items in the shop
-        self.all_items = all_items 
+        self.all_items = ItemCatalog(all_items)  # Only the items this shop can stock
         self.restock_counter = 0 # Counter to check if its time for new items to be stocked
         self.restock_frequency = 10 # Amount counter needs to reach before restock occurs
 
@@ -53,18 +54,13 @@ class BaseShop:
         sorted_items = sorted(sellable_items, key=lambda x: (x.type == "soul_crystal", x.name))
         
         display_items = []
-        current_group = None
         
-        # Group consecutive stackable items with same name, keep soul crystals individual
+        # Stackable items show the total held across their stacks, soul crystals stay individual
         for item in sorted_items:
             if item.type == "soul_crystal":
                 display_items.append({'item': item, 'quantity': 1, 'is_group': False})
             else:
-                if current_group and current_group['item'].name == item.name:
-                    current_group['quantity'] += item.stack_size
-                else:
-                    current_group = {'item': item, 'quantity': item.stack_size, 'is_group': True}
-                    display_items.append(current_group)
+                display_items.append({'item': item, 'quantity': player.inventory.quantity(item.name), 'is_group': True})
         
         # Display items
         for i, info in enumerate(display_items, 1):
@@ -165,13 +161,11 @@ class BaseShop:
         # Helper function to stack a random range of items which are available based on the player level
         """Stock shop with stackable items"""
         num_items = random.randint(8, 15)
-        available_items = [item for item in self.all_items.values() 
-                         if self.is_item_available(item, player_level)]
+        available_items = self.all_items.available_at(player_level)
         
         # Ensure at least one item of each rarity (if available)
-        rarities = ['common', 'uncommon', 'rare', 'epic', 'masterwork', 'legendary', 'mythical']
-        for rarity in rarities:
-            rarity_items = [item for item in available_items if item.tier == rarity]
+        for rarity in ITEM_TIERS:
+            rarity_items = self.all_items.pool(tier=rarity, max_level=player_level)
             if rarity_items:
                 item = random.choice(rarity_items)
                 if item.is_stackable():
@@ -190,17 +184,7 @@ class BaseShop:
 
     def is_item_available(self, item, player_level):
         # Stocks items based on the level of the player ensuring high level items aren't buyable until required level is met
-        tier_levels = {
-            "starter": 1,
-            "common": 1,
-            "uncommon": 3,
-            "rare": 6,
-            "epic": 10,
-            "masterwork": 15,
-            "legendary": 20,
-            "mythical": 25
-        }
-        return player_level >= tier_levels.get(item.tier, 1)
+        return player_level >= TIER_LEVELS.get(item.tier, 1)
 
     def buy_items(self, player):
         """Handle buying items with stack support"""
@@ -285,33 +269,12 @@ class BaseShop:
                     player.gold -= total_cost
                     
                     for item_name, item, quantity in purchase_list:
-                        # Create new item with proper stack size
-                        new_item = type(item)(
-                            item.name, item.type, item.value, item.tier,
-                            attack=item.attack,
-                            defence=item.defence,
-                            accuracy=item.accuracy,
-                            crit_chance=getattr(item, 'crit_chance', 0),
-                            crit_damage=getattr(item, 'crit_damage', 0),
-                            armour_penetration=getattr(item, 'armour_penetration', 0),
-                            damage_reduction=getattr(item, 'damage_reduction', 0),
-                            evasion=getattr(item, 'evasion', 0),
-                            block_chance=getattr(item, 'block_chance', 0),
-                            effect_type=item.effect_type,
-                            effect=item.effect,
-                            cooldown=item.cooldown,
-                            duration=item.duration,
-                            tick_effect=item.tick_effect,
-                            weapon_type=item.weapon_type,
-                            stamina_restore=item.stamina_restore
-                        )
-                        
-                        if new_item.is_stackable():
-                            new_item.stack_size = quantity
-                            player.add_item(new_item)
+                        if item.is_stackable():
+                            # One new stack with the bought quantity
+                            player.add_item(item.copy(quantity))
                         else:
                             for _ in range(quantity):
-                                player.add_item(new_item)
+                                player.add_item(item.copy())
                                 
                         self.remove_item(item_name, quantity)
                     
@@ -358,7 +321,7 @@ class BaseShop:
                     # Remove items from inventory
                     if item_info['is_group']:
                         remaining = quantity
-                        inventory_items = [i for i in player.inventory if i.name == item.name]
+                        inventory_items = player.inventory.stacks(item.name)
                         for inv_item in inventory_items:
                             if remaining <= 0:
                                 break
@@ -384,21 +347,20 @@ class BaseShop:
             
     def get_sellable_items(self, player):
         """Return grouped sellable items from player inventory"""
-        sellable_items = [item for item in player.inventory if self.can_sell_item(item)]
-        grouped_items = {}
-        
-        for item in sellable_items:
-            if item.type == "soul_crystal":
+        grouped_items = []
+        soul_crystals = []
+        for name in player.inventory.names():
+            sellable = [item for item in player.inventory.stacks(name) if self.can_sell_item(item)]
+            if not sellable:
+                continue
+            if sellable[0].type == "soul_crystal":
                 # Soul crystals don't stack, add individually
-                sellable_items.append(item)
+                soul_crystals.extend(sellable)
             else:
-                # Group stackable items by name and type
-                key = (item.name, item.type)
-                if key not in grouped_items:
-                    grouped_items[key] = item
+                # One instance of each stackable item, the shop screen shows the total held
+                grouped_items.append(sellable[0])
         
-        # Return soul crystals and one instance of each stackable item
-        return list(grouped_items.values()) + [item for item in sellable_items if item.type == "soul_crystal"]
+        return grouped_items + soul_crystals
 
     def can_sell_item(self, item):
         # Check if item can be sold, to be overwritten in child classes
@@ -464,8 +426,7 @@ class Inn(BaseShop):
         shop_display = ShopDisplay(self.display, player)
         rest_cost = player.level * 10
         
-        location_image = pygame.image.load("assets/area_images/inn.jpg")
-        location_image = pygame.transform.scale(location_image, (self.display.config.SCREEN_WIDTH, self.display.config.SCREEN_HEIGHT))
+        location_image = AssetManager.get_image(SHOP_IMAGES["Inn"], (self.display.config.SCREEN_WIDTH, self.display.config.SCREEN_HEIGHT))
         
         while True:
             self.display.screen.fill('black')
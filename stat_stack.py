@@ -0,0 +1,243 @@
+# stat_stack.py
+"""Stat blocks and incremental stat totals.
+
+Each modifier dict (level, equipment, buffs, combat buffs, weapon buffs and
+debuffs) is a ModifierLayer that passes every change on to a StatStack as a
+delta, so the stack always holds a running total per stat. Final stats are only
+worked out when one is read after something has changed.
+"""
+import math
+import os
+from array import array
+from enum import IntEnum
+
+class Stat(IntEnum):
+    """Fixed position of each combat stat in a StatBlock row"""
+    ATTACK = 0
+    DEFENCE = 1
+    EVASION = 2
+    ACCURACY = 3
+    CRIT_CHANCE = 4
+    CRIT_DAMAGE = 5
+    DAMAGE_REDUCTION = 6
+    ARMOUR_PENETRATION = 7
+    BLOCK_CHANCE = 8
+
+STAT_NAMES = tuple(stat.name.lower() for stat in Stat)
+
+# Set TEXT_RPG_DEBUG_STATS=1 to check every incremental update against a full rebuild
+DEBUG_STATS = os.environ.get("TEXT_RPG_DEBUG_STATS") == "1"
+
+class StatBlock:
+    """The nine combat stats in fixed slots.
+
+    Works like the nine-key stat dicts it replaces (indexing by name, get,
+    items), can also be indexed by Stat, and packs into an array row for
+    batch work.
+    """
+    __slots__ = STAT_NAMES
+
+    def __init__(self, values=None, **stats):
+        for name in STAT_NAMES:
+            setattr(self, name, 0)
+        if values:
+            self.update(values)
+        if stats:
+            self.update(stats)
+
+    @staticmethod
+    def _name(stat):
+        return STAT_NAMES[stat] if isinstance(stat, int) else stat
+
+    def __getitem__(self, stat):
+        name = self._name(stat)
+        if name not in STAT_NAMES:
+            raise KeyError(stat)
+        return getattr(self, name)
+
+    def __setitem__(self, stat, value):
+        name = self._name(stat)
+        if name not in STAT_NAMES:
+            raise KeyError(stat)
+        setattr(self, name, value)
+
+    def __contains__(self, stat):
+        return self._name(stat) in STAT_NAMES
+
+    def __iter__(self):
+        return iter(STAT_NAMES)
+
+    def __len__(self):
+        return len(STAT_NAMES)
+
+    def __repr__(self):
+        return f"StatBlock({self.as_dict()})"
+
+    def get(self, stat, default=0):
+        return self[stat] if stat in self else default
+
+    def keys(self):
+        return STAT_NAMES
+
+    def values(self):
+        return [getattr(self, name) for name in STAT_NAMES]
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in STAT_NAMES]
+
+    def update(self, values):
+        for stat, value in dict(values).items():
+            self[stat] = value
+
+    def copy(self):
+        block = StatBlock.__new__(StatBlock)
+        for name in STAT_NAMES:
+            setattr(block, name, getattr(self, name))
+        return block
+
+    def as_dict(self):
+        return dict(self.items())
+
+    def row(self):
+        return array('d', self.values())
+
+def stat_matrix(blocks):
+    """Pack stat blocks into one contiguous row-major array.
+
+    np.frombuffer(matrix).reshape(-1, len(Stat)) views it as an N x 9 matrix
+    without copying, with columns indexed by Stat.
+    """
+    matrix = array('d')
+    for block in blocks:
+        matrix.extend(block.values())
+    return matrix
+
+def block_property(block, stat):
+    """Attribute that reads and writes one slot of a StatBlock attribute, e.g. base_attack"""
+    def get(self):
+        return getattr(getattr(self, block), stat)
+
+    def set(self, value):
+        setattr(getattr(self, block), stat, value)
+    return property(get, set)
+
+class ModifierLayer(dict):
+    """Stat modifier dict that reports every change to its StatStack"""
+    def __init__(self, stack, values=None, rounding=None, debuff=False):
+        super().__init__(values or {})
+        self.stack = stack
+        self.rounding = rounding  # Level modifiers only count to 2 decimal places
+        self.debuff = debuff
+
+    def contribution(self, stat):
+        value = self.get(stat, 0)
+        return round(value, self.rounding) if self.rounding is not None else value
+
+    def __setitem__(self, stat, value):
+        old = self.contribution(stat)
+        super().__setitem__(stat, value)
+        self.stack.apply_delta(self, stat, self.contribution(stat) - old)
+
+    def __delitem__(self, stat):
+        old = self.contribution(stat)
+        super().__delitem__(stat)
+        self.stack.apply_delta(self, stat, -old)
+
+    # The rest of dict's mutating methods skip __setitem__, route them through it
+    def update(self, *args, **kwargs):
+        for stat, value in dict(*args, **kwargs).items():
+            self[stat] = value
+
+    def setdefault(self, stat, default=None):
+        if stat not in self:
+            self[stat] = default
+        return self[stat]
+
+    def pop(self, stat, *default):
+        if stat not in self:
+            return super().pop(stat, *default)
+        value = self[stat]
+        del self[stat]
+        return value
+
+    def clear(self):
+        for stat in list(self):
+            del self[stat]
+
+class StatStack:
+    """Running per-stat totals of a character's modifier layers"""
+    def __init__(self):
+        self.layers = {}
+        self.totals = StatBlock()
+        self.debuffs = StatBlock()
+        self.dirty = False
+
+    def set_layer(self, name, values, rounding=None, debuff=False):
+        """Replace a whole layer, e.g. when a save is loaded, and return the new ModifierLayer"""
+        old = self.layers.get(name)
+        if old is not None:
+            for stat in STAT_NAMES:
+                self.apply_delta(old, stat, -old.contribution(stat))
+        layer = ModifierLayer(self, values, rounding, debuff)
+        self.layers[name] = layer
+        for stat in STAT_NAMES:
+            self.apply_delta(layer, stat, layer.contribution(stat))
+        return layer
+
+    def apply_delta(self, layer, stat, delta):
+        if delta and stat in self.totals:
+            (self.debuffs if layer.debuff else self.totals)[stat] += delta
+            self.dirty = True
+
+    def rebuild(self):
+        """Recalculate the running totals from scratch, clearing any float drift"""
+        self.totals = StatBlock()
+        self.debuffs = StatBlock()
+        for layer in self.layers.values():
+            target = self.debuffs if layer.debuff else self.totals
+            for stat in STAT_NAMES:
+                target[stat] += layer.contribution(stat)
+        self.dirty = True
+
+    def flush(self, owner):
+        """Turn the running totals into final stats, clamped the same way as a full rebuild"""
+        self.dirty = False
+        base, current = owner.base_stats, owner.current_stats
+        for stat in STAT_NAMES:
+            value = max(0, getattr(base, stat) + getattr(self.totals, stat) - getattr(self.debuffs, stat))
+            if stat == "crit_damage":
+                value = max(100, value)
+            elif stat == "crit_chance":
+                value = max(1, min(100, value))
+            elif stat not in ("damage_reduction", "armour_penetration", "block_chance"):
+                value = max(1, value)
+            setattr(current, stat, value)
+
+        if DEBUG_STATS:
+            expected = owner.rebuild_stats()
+            for stat in STAT_NAMES:
+                assert math.isclose(current[stat], expected[stat], abs_tol=1e-6), \
+                    f"Incremental {stat} is {current[stat]}, full rebuild gives {expected[stat]}"
+
+def stat_property(stat):
+    """Final stat attribute that is brought up to date the first time it is read after a change"""
+    def get(self):
+        if self._stat_stack.dirty:
+            self._stat_stack.flush(self)
+        return getattr(self.current_stats, stat)
+
+    def set(self, value):
+        # Direct assignment overrides the stat until the modifiers next change, as it always has
+        if self._stat_stack.dirty:
+            self._stat_stack.flush(self)
+        setattr(self.current_stats, stat, value)
+    return property(get, set)
+
+def layer_property(name, rounding=None, debuff=False):
+    """Modifier dict attribute, assigning a plain dict to it swaps the whole layer"""
+    def get(self):
+        return self._stat_stack.layers[name]
+
+    def set(self, values):
+        self._stat_stack.set_layer(name, values, rounding, debuff)
+    return property(get, set)
@@ -0,0 +1,93 @@
+# stat_trace.py
+"""Opt-in tracing of enemy stat calculations.
+
+Tracing is off unless TEXT_RPG_TRACE_STATS=1 is set or STAT_TRACE.enable() is
+called. While it is off enemies spawn from their compiled templates and nothing
+is recorded. While it is on every spawn goes through the step by step
+calculation and its working is kept in a ring buffer, where the oldest traces
+drop off once it is full. If a file is given each trace is also appended to it
+as a line of JSON for balance investigations.
+
+Environment:
+    TEXT_RPG_TRACE_STATS=1: Trace every spawn from startup
+    TEXT_RPG_TRACE_CAPACITY: Traces kept in memory (default 256)
+    TEXT_RPG_TRACE_FILE: JSONL file every trace is appended to
+"""
+import itertools
+import json
+import os
+from collections import deque
+
+class StatTrace:
+    """Ring buffer of enemy stat calculation traces"""
+    def __init__(self, capacity=256, path=None, enabled=False):
+        self.traces = deque(maxlen=capacity)
+        self.path = path
+        self.enabled = enabled
+        self._ids = itertools.count(1)
+
+    def enable(self, capacity=None, path=None):
+        """Trace every spawn from now on, optionally resizing the buffer and streaming to a JSONL file"""
+        if capacity is not None and capacity != self.traces.maxlen:
+            self.traces = deque(self.traces, maxlen=capacity)
+        if path is not None:
+            self.path = path
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def __len__(self):
+        return len(self.traces)
+
+    def __iter__(self):
+        return iter(list(self.traces))
+
+    def record(self, stats, player, steps):
+        """Store the working behind one enemy's stats.
+
+        Args:
+            stats: Final stats the calculation produced
+            player: Player the enemy was scaled against
+            steps: Intermediate values from each step of the calculation
+
+        Returns:
+            Id to look the trace up with get()
+        """
+        trace = {
+            'id': next(self._ids),
+            'enemy': stats['name'],
+            'level': stats['level'],
+            'player_level': player.level,
+            'stats': {stat: value for stat, value in stats.items() if stat not in ('name', 'attack_types', 'variant')},
+            'steps': steps
+        }
+        self.traces.append(trace)
+        if self.path:
+            with open(self.path, "a") as file:
+                file.write(json.dumps(trace, default=str) + "\n")
+        return trace['id']
+
+    def get(self, trace_id):
+        """Steps recorded for a trace, None if it was never recorded or has dropped out of the buffer"""
+        for trace in self.traces:
+            if trace['id'] == trace_id:
+                return trace['steps']
+        return None
+
+    def dump_jsonl(self, path):
+        """Write every buffered trace to a JSONL file, one trace per line, and return how many were written"""
+        traces = list(self.traces)
+        with open(path, "w") as file:
+            for trace in traces:
+                file.write(json.dumps(trace, default=str) + "\n")
+        return len(traces)
+
+    def clear(self):
+        self.traces.clear()
+
+STAT_TRACE = StatTrace(
+    capacity=int(os.environ.get("TEXT_RPG_TRACE_CAPACITY", 256)),
+    path=os.environ.get("TEXT_RPG_TRACE_FILE"),
+    enabled=os.environ.get("TEXT_RPG_TRACE_STATS") == "1"
+)
@@ -1,9 +1,14 @@
+import heapq
+import itertools
 import random
 
 class StatusEffect:
     def __init__(self, name, duration, is_debuff=False, stackable=False):
         self.name = name
-        self.remaining_duration = duration
+        self._store = None
+        self._remaining = duration
+        self._expires_at = 0
+        self._order = 0
         self.initial_duration = duration
         self.is_debuff = is_debuff
         self.stackable = stackable
@@ -11,6 +16,20 @@ class StatusEffect:
         self.is_active = True
         self.battle_display = None
     
+    @property
+    def remaining_duration(self):
+        # Inside an EffectStore the duration is counted against the store's turn clock
+        if self._store is None:
+            return self._remaining
+        return self._expires_at - self._store.clock(self)
+
+    @remaining_duration.setter
+    def remaining_duration(self, value):
+        if self._store is None:
+            self._remaining = value
+        else:
+            self._store.schedule(self, self._store.clock(self) + value)
+
     def set_battle_display(self, battle_display):
         self.battle_display = battle_display
         
@@ -54,6 +73,156 @@ class StatusEffect:
             return f"\n{self.name} ({self.strength} stacks, {self.remaining_duration} turns)"
         return f"\n{self.name} ({self.remaining_duration} turns)"
 
+class EffectStore:
+    """A character's status effects, indexed by name and class.
+
+    Iterates in the order effects were applied. Expiry times sit in a min-heap,
+    so a turn only touches effects that do something every turn (on_tick) or
+    that are due to wear off.
+    """
+    def __init__(self, effects=()):
+        self.turn = 0
+        self._position = None  # While ticking, effects applied before this _order have already had their turn
+        self._tick_end = None  # While ticking, effects applied after this _order were added during the tick
+        self._by_name = {}
+        self._by_class = {}
+        self._tickers = {}
+        self._expiry = []
+        self._counter = itertools.count()
+        for effect in effects:
+            self.append(effect)
+
+    def __iter__(self):
+        # Snapshot so effects can be removed while looping, as with the old list
+        return iter(tuple(self._by_name.values()))
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __contains__(self, effect):
+        if isinstance(effect, str):
+            return effect in self._by_name
+        return self._by_name.get(effect.name) is effect
+
+    def __getitem__(self, index):
+        return list(self._by_name.values())[index]
+
+    def __repr__(self):
+        return f"EffectStore({list(self._by_name.values())})"
+
+    def get(self, name, default=None):
+        return self._by_name.get(name, default)
+
+    def of_type(self, effect_class):
+        """Effects that are instances of effect_class, e.g. every StanceEffect"""
+        for klass, effects in list(self._by_class.items()):
+            if issubclass(klass, effect_class):
+                yield from list(effects.values())
+
+    def append(self, effect):
+        if effect.name in self._by_name:
+            self.remove(effect.name)
+        remaining = effect.remaining_duration
+        if effect._store is not None and effect._store is not self:
+            effect._store.remove(effect.name)
+        effect._store = self
+        effect._order = next(self._counter)
+        self._by_name[effect.name] = effect
+        self._by_class.setdefault(type(effect), {})[effect.name] = effect
+        if type(effect).on_tick is not StatusEffect.on_tick:
+            self._tickers[effect.name] = effect
+        self.schedule(effect, self.clock(effect) + remaining)
+
+    def remove(self, name):
+        """Take an effect out without calling on_remove, returns it or None"""
+        effect = self._by_name.pop(name, None)
+        if effect is None:
+            return None
+        bucket = self._by_class.get(type(effect))
+        if bucket is not None:
+            bucket.pop(name, None)
+            if not bucket:
+                del self._by_class[type(effect)]
+        self._tickers.pop(name, None)
+        # Stale heap entries are skipped when they come up
+        effect._remaining = effect.remaining_duration
+        effect._store = None
+        return effect
+
+    def clear(self):
+        for name in list(self._by_name):
+            self.remove(name)
+
+    def schedule(self, effect, expires_at):
+        effect._expires_at = expires_at
+        heapq.heappush(self._expiry, (expires_at, next(self._counter), effect))
+
+    def clock(self, effect):
+        """Turn an effect's duration counts down from.
+
+        Mid-tick, effects that have already had their turn this tick, or were
+        added during it, count from the next turn, as they did in the old list.
+        """
+        if self._position is not None and (effect._order < self._position or effect._order > self._tick_end):
+            return self.turn + 1
+        return self.turn
+
+    def tick(self, character):
+        """Advance one turn: tick effects with per-turn logic and expire the ones that run out.
+
+        Follows StatusEffect.update for each effect in the order they were
+        applied: on_tick runs before the effect's duration goes down, then it
+        wears off if that leaves no turns. Returns the messages for effects
+        that wore off.
+        """
+        next_turn = self.turn + 1
+        self._tick_end = next(self._counter)
+        self._position = 0
+        due = [(effect._order, effect) for effect in self._tickers.values()]
+        heapq.heapify(due)
+        self._take_due(due, next_turn)
+
+        messages = []
+        try:
+            while due:
+                order, effect = heapq.heappop(due)
+                if order < self._position or self._by_name.get(effect.name) is not effect:
+                    continue  # Already had its turn, or removed by an earlier effect this turn
+                self._position = order
+                if not effect.is_active:
+                    self.remove(effect.name)
+                    continue
+                effect.on_tick(character)
+                self._position = order + 1
+                if effect.remaining_duration <= 0:
+                    effect.on_remove(character)
+                    effect.is_active = False
+                    self.remove(effect.name)
+                    messages.append(f"\n{effect.name} has worn off from {character.name}.")
+                # on_tick may have shortened effects that haven't had their turn yet
+                self._take_due(due, next_turn)
+        finally:
+            self.turn = next_turn
+            self._position = None
+            self._tick_end = None
+        return messages
+
+    def _take_due(self, due, next_turn):
+        """Move effects that run out this turn and haven't had their turn yet from the expiry heap to due"""
+        later = []
+        while self._expiry and self._expiry[0][0] <= next_turn:
+            entry = heapq.heappop(self._expiry)
+            expires_at, _, effect = entry
+            if self._by_name.get(effect.name) is not effect or effect._expires_at != expires_at:
+                continue  # Stale
+            if self._position <= effect._order < self._tick_end:
+                heapq.heappush(due, (effect._order, effect))
+            else:
+                # Already had its turn (or added mid-tick), it wears off on the next tick as in the old list
+                later.append(entry)
+        for entry in later:
+            heapq.heappush(self._expiry, entry)
+
 class DotEffect(StatusEffect):
     def __init__(self, name, duration, base_damage, is_percent=False, stackable=True):
         super().__init__(name, duration, is_debuff=True, stackable=stackable)
@@ -88,8 +257,7 @@ class StatModifier(StatusEffect):
         #print(f"DEBUG: Current debuffs: {character.debuff_modifiers} (Stat Modifier On_apply)")
         #print(f"DEBUG: New reduction: {self.stat_changes} (Stat Modifier On_apply)")
         
-        found_effect = next((effect for effect in character.status_effects 
-                           if effect.name == self.name), None)
+        found_effect = character.status_effects.get(self.name)
         
         if found_effect:
             for stat, value in self.stat_changes.items():